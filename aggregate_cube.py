@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+LinkedIn Jobs Dataset - Precomputed Aggregate Cube
+Düşük kardinaliteli boyutlar (urgency × investment × workplace × industry ×
+tech function) üzerinde materialize edilmiş OLAP küpü.
+
+Küp her dataset versiyonu için bir kez O(satır) ile kurulur; sonrasında
+her slice, rollup ve normalize crosstab O(hücre) ile küpten hesaplanır.
+Ölçüler toplanabilir (additive) tutulur, bu sayede:
+- yeni / silinen satırlar için küp yeniden kurulmadan güncellenir (refresh_cube),
+- ortalama kalan gün gibi zamana bağlı metrikler sorgu anında
+  expire_sum_s / expire_count'tan hesaplanır (küp bayatlamaz).
+"""
+
+import json
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+from lazy_query import (EXPIRE_COLUMN, INDUSTRY_COLUMN, INVESTMENT_COLUMN, JOB_FUNCTIONS_COLUMN,
+                        TECH_FUNCTIONS_REGEX, URGENCY_COLUMN, WORKPLACE_COLUMN)
+
+CUBE_PATH = 'linkedin_jobs_cube.parquet'
+UNKNOWN = 'UNKNOWN'
+
+# Küp boyutları: isim → kaynak sütundan türetme fonksiyonu
+CUBE_DIMENSIONS = {
+    'urgency': lambda df: df[URGENCY_COLUMN],
+    'investment': lambda df: df[INVESTMENT_COLUMN],
+    'workplace': lambda df: df[WORKPLACE_COLUMN],
+    # industries_consolidated 'A | B' çoklu değer: küpte birincil industry tutulur
+    'industry': lambda df: df[INDUSTRY_COLUMN].astype('string').str.split(' | ', n=1, regex=False).str[0],
+    # Tamamen boş sütun read_csv'de float64 gelir; .str için string'e çevrilir
+    'is_tech_function': lambda df: df[JOB_FUNCTIONS_COLUMN].astype('string').str.contains(TECH_FUNCTIONS_REGEX, na=False).astype(bool),
+}
+
+MEASURES = ['jobs', 'expire_sum_s', 'expire_count']
+
+
+def _expire_seconds(df):
+    """expireAt → epoch saniye (ms int veya datetime kabul eder)"""
+    values = df[EXPIRE_COLUMN]
+    if pd.api.types.is_numeric_dtype(values):
+        return values.astype('float64') / 1000
+    timestamps = pd.to_datetime(values, errors='coerce')
+    nanoseconds = timestamps.to_numpy(dtype='datetime64[ns]').astype('int64')
+    seconds = pd.Series(nanoseconds / 1e9, index=df.index)
+    return seconds.where(timestamps.notna())
+
+
+def available_dimensions(df):
+    """Dataset'te kaynak sütunu bulunan boyutlar"""
+    sources = {
+        'urgency': URGENCY_COLUMN, 'investment': INVESTMENT_COLUMN, 'workplace': WORKPLACE_COLUMN,
+        'industry': INDUSTRY_COLUMN, 'is_tech_function': JOB_FUNCTIONS_COLUMN
+    }
+    return [dim for dim, col in sources.items() if col in df.columns]
+
+
+def build_cube(df, dimensions=None):
+    """Satırlardan küp hücrelerini kurar (tek groupby geçişi)
+
+    Returns:
+        DataFrame: boyut sütunları + jobs, expire_sum_s, expire_count
+    """
+    dimensions = available_dimensions(df) if dimensions is None else list(dimensions)
+
+    frame = pd.DataFrame({dim: CUBE_DIMENSIONS[dim](df) for dim in dimensions}, index=df.index)
+    for dim in dimensions:
+        if frame[dim].dtype != bool:
+            frame[dim] = frame[dim].astype('object').where(frame[dim].notna(), UNKNOWN)
+
+    if EXPIRE_COLUMN in df.columns:
+        seconds = _expire_seconds(df)
+        frame['expire_sum_s'] = seconds.fillna(0.0)
+        frame['expire_count'] = seconds.notna().astype('int64')
+    else:
+        frame['expire_sum_s'] = 0.0
+        frame['expire_count'] = 0
+    frame['jobs'] = 1
+
+    cube = frame.groupby(dimensions, sort=False, observed=True)[MEASURES].sum().reset_index()
+    return cube
+
+
+def refresh_cube(cube, added=None, removed=None):
+    """Küpü yeni / silinen satırlarla günceller (yalnızca delta kadar iş)
+
+    Değişmiş satırlar için eski hali removed, yeni hali added olarak verilir.
+    """
+    dimensions = [col for col in cube.columns if col not in MEASURES]
+    parts = [cube]
+    if added is not None and len(added) > 0:
+        parts.append(build_cube(added, dimensions))
+    if removed is not None and len(removed) > 0:
+        removed_cube = build_cube(removed, dimensions)
+        removed_cube[MEASURES] = -removed_cube[MEASURES]
+        parts.append(removed_cube)
+
+    merged = pd.concat(parts, ignore_index=True)
+    refreshed = merged.groupby(dimensions, sort=False, observed=True)[MEASURES].sum().reset_index()
+    return refreshed[refreshed['jobs'] > 0].reset_index(drop=True)
+
+
+def slice_cube(cube, **filters):
+    """Boyut filtreleri ile küp dilimi (değer veya değer listesi)"""
+    mask = np.ones(len(cube), dtype=bool)
+    for dim, value in filters.items():
+        values = value if isinstance(value, (list, tuple, set)) else [value]
+        mask &= cube[dim].isin(values).to_numpy()
+    return cube[mask]
+
+
+def rollup(cube, by):
+    """Verilen boyutlara göre ölçüleri toplar"""
+    by = [by] if isinstance(by, str) else list(by)
+    return cube.groupby(by, sort=False, observed=True)[MEASURES].sum()
+
+
+def cube_crosstab(cube, index, columns, normalize=False):
+    """pd.crosstab(..., normalize=...) eşdeğeri, küp hücrelerinden
+
+    normalize: False / 'index' / 'columns' / 'all' (oranlar, pd.crosstab gibi 0-1)
+    """
+    table = rollup(cube, [index, columns])['jobs'].unstack(columns, fill_value=0)
+    table = table.sort_index().sort_index(axis=1)
+
+    if normalize == 'index':
+        table = table.div(table.sum(axis=1), axis=0)
+    elif normalize == 'columns':
+        table = table.div(table.sum(axis=0), axis=1)
+    elif normalize in ('all', True):
+        table = table / table.to_numpy().sum()
+    return table
+
+
+def mean_days_to_expire(cube, by, now=None):
+    """Gruplara göre ortalama kalan gün (analyze_investment_vs_expiry)"""
+    now = pd.Timestamp.now() if now is None else pd.Timestamp(now)
+    totals = rollup(cube, by)
+    mean_seconds = totals['expire_sum_s'] / totals['expire_count'].replace(0, np.nan)
+    result = pd.DataFrame({
+        'avg_days': (mean_seconds - now.timestamp()) / 86400,
+        'count': totals['jobs']
+    })
+    return result.sort_values('count', ascending=False)
+
+
+def dataset_version(df):
+    """Küp kaynak sütunlarının fingerprint'i (dataset versiyonu)"""
+    sources = [c for c in (URGENCY_COLUMN, INVESTMENT_COLUMN, WORKPLACE_COLUMN, INDUSTRY_COLUMN,
+                           JOB_FUNCTIONS_COLUMN, EXPIRE_COLUMN) if c in df.columns]
+    hashes = pd.util.hash_pandas_object(df[sources], index=False).to_numpy()
+    return f'{len(df)}-{int(hashes.sum(dtype=np.uint64)):016x}'
+
+
+def cube_cache_path(dataset_path):
+    """'dataset.csv' → 'dataset.cube.parquet' (her dataset'in kendi küpü)"""
+    root, _ = os.path.splitext(dataset_path)
+    return root + '.cube.parquet'
+
+
+def save_cube(cube, version, path=CUBE_PATH):
+    cube.to_parquet(path, index=False)
+    with open(path + '.json', 'w', encoding='utf-8') as f:
+        json.dump({'version': version, 'cells': len(cube)}, f)
+
+
+def load_cube(path=CUBE_PATH, version=None):
+    """Kayıtlı küpü yükler; version verilmişse eşleşmiyorsa None döner"""
+    meta_path = path + '.json'
+    if not os.path.exists(path) or not os.path.exists(meta_path):
+        return None
+    with open(meta_path, encoding='utf-8') as f:
+        meta = json.load(f)
+    if version is not None and meta.get('version') != version:
+        return None
+    return pd.read_parquet(path)
+
+
+def load_or_build_cube(df, path=CUBE_PATH):
+    """Dataset versiyonu değişmediyse kayıtlı küpü, değiştiyse yeni kurulanı döndürür"""
+    version = dataset_version(df)
+    cube = load_cube(path, version=version)
+    if cube is None:
+        cube = build_cube(df)
+        save_cube(cube, version, path)
+    return cube
+
+
+def main():
+    """Küpü kurar ve standart raporları küpten üretir"""
+
+    print("🧊 LinkedIn Jobs Dataset - Aggregate Cube")
+    print("=" * 60)
+
+    dataset_file = sys.argv[1] if len(sys.argv) > 1 else 'fixed_all_company_colums.csv'
+
+    try:
+        df = pd.read_csv(dataset_file)
+        print(f"✅ Dataset yüklendi: {len(df):,} satır, {len(df.columns)} sütun")
+    except Exception as e:
+        print(f"❌ HATA: Dataset yüklenemedi - {e}")
+        return
+
+    cube = load_or_build_cube(df)
+    dims = [col for col in cube.columns if col not in MEASURES]
+    print(f"🧊 Küp: {len(cube):,} hücre, boyutlar: {dims}")
+    print()
+
+    if {'investment', 'urgency'} <= set(dims):
+        print("💰 Investment × Urgency (satır %):")
+        print((cube_crosstab(cube, 'investment', 'urgency', normalize='index') * 100).round(1))
+        print()
+    if {'investment', 'is_tech_function'} <= set(dims):
+        print("💻 Investment × IT/Engineering:")
+        print(cube_crosstab(cube, 'investment', 'is_tech_function'))
+        print()
+    if 'investment' in dims:
+        print("⏰ Investment bazında ortalama kalan gün:")
+        print(mean_days_to_expire(cube, 'investment').round(1))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+LinkedIn Jobs Dataset - Embedded Analytical Store
+Pipeline sonunda temizlenmiş dataset'i gömülü bir analitik veritabanına yazar
+ve mevcut analizleri hazır (parametreli) SQL sorguları olarak sunar.
+
+- DuckDB kuruluysa 'linkedin_jobs_analytics.duckdb', değilse standart
+  kütüphanedeki sqlite3 ile 'linkedin_jobs_analytics.sqlite' kullanılır.
+- job id, şirket, industry ve expireAt üzerinde index oluşturulur.
+- Dashboard'lar CSV'yi yeniden okumak yerine indexli store'dan milisaniyede
+  cevaplanır.
+
+Pipeline entegrasyonu: opsiyoneldir; PIPELINE_ANALYTICS_STORE=1 ise
+process_final_column_deletions.py son adımda populate_store() çağırır.
+"""
+
+import os
+import sqlite3
+import sys
+import time
+
+import pandas as pd
+
+try:
+    import duckdb
+except ImportError:
+    duckdb = None
+
+STORE_ENV = 'PIPELINE_ANALYTICS_STORE'
+DUCKDB_PATH = 'linkedin_jobs_analytics.duckdb'
+SQLITE_PATH = 'linkedin_jobs_analytics.sqlite'
+TABLE_NAME = 'jobs'
+
+ID_COLUMN = 'id'
+COMPANY_COLUMN = 'companyName'
+INDUSTRY_COLUMN = 'industries_consolidated'
+EXPIRE_COLUMN = 'expireAt'
+
+# index adı → sütun (sütun dataset'te yoksa atlanır)
+STORE_INDEXES = {
+    'idx_jobs_id': ID_COLUMN,
+    'idx_jobs_company': COMPANY_COLUMN,
+    'idx_jobs_industry': INDUSTRY_COLUMN,
+    'idx_jobs_expire': EXPIRE_COLUMN,
+}
+
+# Mevcut script'lerdeki analizlerin SQL karşılıkları ('?' parametreli)
+PREPARED_QUERIES = {
+    'job_by_id': {
+        'description': 'Tek ilan (id index)',
+        'sql': f'SELECT * FROM {TABLE_NAME} WHERE "{ID_COLUMN}" = ?'
+    },
+    'company_jobs': {
+        'description': 'Şirketin ilanları (company index)',
+        'sql': f'SELECT * FROM {TABLE_NAME} WHERE "{COMPANY_COLUMN}" = ? ORDER BY "{EXPIRE_COLUMN}"'
+    },
+    'expiring_between': {
+        'description': 'expireAt aralığındaki ilanlar (expireAt index)',
+        'sql': (f'SELECT * FROM {TABLE_NAME} WHERE "{EXPIRE_COLUMN}" >= ? AND "{EXPIRE_COLUMN}" < ? '
+                f'ORDER BY "{EXPIRE_COLUMN}"')
+    },
+    'urgency_distribution': {
+        'description': 'job_urgency_level dağılımı',
+        'sql': (f'SELECT "job_urgency_level", COUNT(*) AS jobs, '
+                f'100.0 * COUNT(*) / SUM(COUNT(*)) OVER () AS percentage '
+                f'FROM {TABLE_NAME} GROUP BY "job_urgency_level" ORDER BY jobs DESC')
+    },
+    'investment_by_urgency': {
+        'description': 'create_urgency_categories: job_investment_type × job_urgency_level (satır %)',
+        'sql': (f'SELECT "job_investment_type", "job_urgency_level", COUNT(*) AS jobs, '
+                f'100.0 * COUNT(*) / SUM(COUNT(*)) OVER (PARTITION BY "job_investment_type") AS percentage '
+                f'FROM {TABLE_NAME} GROUP BY "job_investment_type", "job_urgency_level" '
+                f'ORDER BY "job_investment_type", jobs DESC')
+    },
+    'company_logo_coverage': {
+        'description': 'company_logo_single_column_analysis: logo\'lu şirket / toplam şirket',
+        'sql': (f'SELECT COUNT(DISTINCT CASE WHEN "has_company_logo" THEN "{COMPANY_COLUMN}" END) AS companies_with_logo, '
+                f'COUNT(DISTINCT "{COMPANY_COLUMN}") AS total_companies '
+                f'FROM {TABLE_NAME} WHERE "{COMPANY_COLUMN}" IS NOT NULL')
+    },
+    'company_logo_stats': {
+        'description': 'Şirket bazında ilan ve logo sayıları',
+        'sql': (f'SELECT "{COMPANY_COLUMN}", COUNT(*) AS jobs, '
+                f'SUM(CASE WHEN "has_company_logo" THEN 1 ELSE 0 END) AS jobs_with_logo '
+                f'FROM {TABLE_NAME} WHERE "{COMPANY_COLUMN}" IS NOT NULL '
+                f'GROUP BY "{COMPANY_COLUMN}" ORDER BY jobs DESC LIMIT ?')
+    },
+    'industry_counts': {
+        'description': 'industries_consolidated dağılımı',
+        'sql': (f'SELECT "{INDUSTRY_COLUMN}", COUNT(*) AS jobs FROM {TABLE_NAME} '
+                f'WHERE "{INDUSTRY_COLUMN}" IS NOT NULL GROUP BY "{INDUSTRY_COLUMN}" ORDER BY jobs DESC LIMIT ?')
+    },
+}
+
+
+def default_store_path(backend=None):
+    backend = backend or ('duckdb' if duckdb is not None else 'sqlite')
+    return DUCKDB_PATH if backend == 'duckdb' else SQLITE_PATH
+
+
+def open_store(path=None, read_only=False):
+    """Store bağlantısı açar (backend dosya uzantısından belirlenir)
+
+    Returns:
+        (connection, backend)
+    """
+    path = path or default_store_path()
+    if path.endswith('.duckdb'):
+        if duckdb is None:
+            raise ImportError("DuckDB store için duckdb gerekli")
+        return duckdb.connect(path, read_only=read_only), 'duckdb'
+
+    uri = f'file:{path}?mode=ro' if read_only else f'file:{path}'
+    return sqlite3.connect(uri, uri=True), 'sqlite'
+
+
+def _prepare_frame(df):
+    """Store'a yazılacak DataFrame kopyası (category → object)"""
+    prepared = df.copy()
+    for col in prepared.columns:
+        if isinstance(prepared[col].dtype, pd.CategoricalDtype):
+            prepared[col] = prepared[col].astype('object')
+    return prepared
+
+
+def populate_store(df, path=None, backend=None):
+    """DataFrame'i store'a (yeniden) yazar ve index'leri oluşturur
+
+    Returns:
+        dict: path, backend, rows, indexes, elapsed_s
+    """
+    start = time.perf_counter()
+    backend = backend or ('duckdb' if duckdb is not None else 'sqlite')
+    path = path or default_store_path(backend)
+    if os.path.exists(path):
+        os.remove(path)
+
+    con, backend = open_store(path)
+    frame = _prepare_frame(df)
+
+    try:
+        if backend == 'duckdb':
+            con.register('jobs_frame', frame)
+            con.execute(f'CREATE TABLE {TABLE_NAME} AS SELECT * FROM jobs_frame')
+            con.unregister('jobs_frame')
+        else:
+            for col in frame.columns:
+                if pd.api.types.is_datetime64_any_dtype(frame[col]):
+                    # ISO string: sıralama ve aralık karşılaştırmaları string üzerinde doğru çalışır
+                    frame[col] = frame[col].dt.strftime('%Y-%m-%d %H:%M:%S')
+            frame.to_sql(TABLE_NAME, con, index=False, if_exists='replace', chunksize=10_000)
+
+        created = []
+        for index_name, column in STORE_INDEXES.items():
+            if column in frame.columns:
+                con.execute(f'CREATE INDEX {index_name} ON {TABLE_NAME} ("{column}")')
+                created.append(index_name)
+
+        if backend == 'sqlite':
+            con.execute('ANALYZE')
+            con.commit()
+    finally:
+        con.close()
+
+    return {
+        'path': path,
+        'backend': backend,
+        'rows': len(df),
+        'indexes': created,
+        'elapsed_s': time.perf_counter() - start
+    }
+
+
+def run_query(con, name, params=(), backend=None):
+    """Hazır sorguyu çalıştırır ve DataFrame döndürür"""
+    if name not in PREPARED_QUERIES:
+        raise ValueError(f"Bilinmeyen sorgu: {name}")
+    sql = PREPARED_QUERIES[name]['sql']
+    if backend is None:
+        backend = 'sqlite' if isinstance(con, sqlite3.Connection) else 'duckdb'
+
+    if backend == 'duckdb':
+        return con.execute(sql, list(params)).df()
+    return pd.read_sql_query(sql, con, params=list(params))
+
+
+def analytics_store_enabled():
+    return os.environ.get(STORE_ENV, '0') == '1'
+
+
+def populate_store_if_enabled(df):
+    """Pipeline sonu kancası: PIPELINE_ANALYTICS_STORE=1 ise store'u günceller"""
+    if not analytics_store_enabled():
+        return None
+    return populate_store(df)
+
+
+def main():
+    """Store'u (gerekirse) oluşturur ve hazır sorguları zamanlar"""
+
+    print("🗄️ LinkedIn Jobs Dataset - Embedded Analytical Store")
+    print("=" * 60)
+
+    path = sys.argv[1] if len(sys.argv) > 1 else default_store_path()
+
+    if not os.path.exists(path):
+        try:
+            df = pd.read_csv('fixed_all_company_colums.csv')
+            info = populate_store(df, path=path)
+            print(f"✅ Store oluşturuldu: {info['path']} ({info['backend']}, {info['rows']:,} satır, {info['elapsed_s']:.2f} s)")
+            print(f"   📇 Index'ler: {', '.join(info['indexes'])}")
+        except Exception as e:
+            print(f"❌ HATA: Store oluşturulamadı - {e}")
+            return
+    print()
+
+    con, backend = open_store(path, read_only=True)
+    try:
+        for name, params in [('urgency_distribution', ()), ('investment_by_urgency', ()),
+                             ('company_logo_coverage', ()), ('industry_counts', (10,))]:
+            start = time.perf_counter()
+            try:
+                result = run_query(con, name, params, backend=backend)
+            except Exception as e:
+                print(f"⚠️ {name}: çalıştırılamadı - {e}")
+                continue
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            print(f"📊 {name} [{elapsed_ms:.1f} ms] - {PREPARED_QUERIES[name]['description']}")
+            print(result.head(15).to_string(index=False))
+            print()
+    finally:
+        con.close()
+
+if __name__ == "__main__":
+    main()
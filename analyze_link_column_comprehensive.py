@@ -13,10 +13,9 @@ Bu script link sütununu kapsamlı olarak analiz eder:
 
 import pandas as pd
 import numpy as np
-import re
-from urllib.parse import urlparse, parse_qs
-from collections import Counter
 import warnings
+from url_vectorized import decompose_urls, validate_urls, is_linkedin_host, protocol_prefix_counts, extract_url_job_ids
+from job_id_index import verify_url_id_redundancy
 warnings.filterwarnings('ignore')
 
 def load_dataset():
@@ -74,34 +73,28 @@ def analyze_url_patterns(df, target_col):
     print(f"\n🏗️  URL YAPISI ANALİZİ:")
     non_null_urls = df[target_col].dropna()
     
+    protocols, domains, paths = [], [], []
+    
     if len(non_null_urls) > 0:
-        # Protocol analysis
-        protocols = []
-        domains = []
-        paths = []
-        
-        for url in non_null_urls.head(1000):  # Sample ilk 1000 URL
-            try:
-                parsed = urlparse(str(url))
-                protocols.append(parsed.scheme)
-                domains.append(parsed.netloc)
-                paths.append(parsed.path)
-            except:
-                continue
+        # Tüm sütun tek geçişte vektörel parse edilir
+        parts = decompose_urls(non_null_urls)
+        parsed = parts[parts['is_parsed']]
+        protocols = parsed['scheme'].tolist()
+        domains = parsed['raw_host'].tolist()
+        paths = parsed['path'].dropna().tolist()
         
+        print(f"   • Parse edilen URL: {len(parsed):,}/{len(non_null_urls):,}")
         print(f"   • Protocol Dağılımı:")
-        protocol_counts = Counter(protocols)
-        for protocol, count in protocol_counts.most_common():
+        for protocol, count in parsed['scheme'].value_counts().items():
             print(f"     - {protocol}: {count:,} adet")
         
         print(f"   • Domain Dağılımı:")
-        domain_counts = Counter(domains)
-        for domain, count in domain_counts.most_common(5):
+        for domain, count in parsed['raw_host'].value_counts().head(5).items():
             print(f"     - {domain}: {count:,} adet")
         
         # Path pattern analysis
         print(f"   • Path Pattern Örnekleri:")
-        unique_paths = list(set(paths))[:5]
+        unique_paths = parsed['path'].dropna().unique()[:5]
         for path in unique_paths:
             print(f"     - {path}")
     
@@ -115,22 +108,12 @@ def check_data_consistency(df, target_col):
     non_null_urls = df[target_col].dropna()
     issues = []
     
-    # URL format validation
-    invalid_urls = []
-    valid_url_pattern = re.compile(
-        r'^https?://'  # http:// or https://
-        r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain...
-        r'localhost|'  # localhost...
-        r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ...or ip
-        r'(?::\d+)?'  # optional port
-        r'(?:/?|[/?]\S+)$', re.IGNORECASE)
-    
-    for idx, url in non_null_urls.items():
-        url_str = str(url).strip()
-        if not valid_url_pattern.match(url_str):
-            invalid_urls.append((idx, url_str))
-            if len(invalid_urls) <= 5:  # İlk 5 örnek
-                issues.append(f"Geçersiz URL format: {url_str}")
+    # URL format validation (tüm sütun, vektörel)
+    valid_mask = validate_urls(non_null_urls)
+    invalid_series = non_null_urls[~valid_mask]
+    invalid_urls = list(zip(invalid_series.index, invalid_series.astype(str).str.strip()))
+    for _, url_str in invalid_urls[:5]:  # İlk 5 örnek
+        issues.append(f"Geçersiz URL format: {url_str}")
     
     print(f"📊 TUTARLILIK SONUÇLARI:")
     print(f"   • Toplam incelenen URL: {len(non_null_urls):,}")
@@ -142,20 +125,11 @@ def check_data_consistency(df, target_col):
         for issue in issues[:10]:  # İlk 10 sorun
             print(f"   • {issue}")
     
-    # LinkedIn domain consistency
-    linkedin_domains = ['linkedin.com', 'www.linkedin.com', 'tr.linkedin.com']
-    linkedin_count = 0
-    other_domains = []
-    
-    for url in non_null_urls.head(1000):
-        try:
-            domain = urlparse(str(url)).netloc.lower()
-            if any(ld in domain for ld in linkedin_domains):
-                linkedin_count += 1
-            else:
-                other_domains.append(domain)
-        except:
-            continue
+    # LinkedIn domain consistency (tüm sütun)
+    hosts = decompose_urls(non_null_urls)['host'].dropna()
+    linkedin_mask = is_linkedin_host(hosts)
+    linkedin_count = int(linkedin_mask.sum())
+    other_domains = hosts[~linkedin_mask].tolist()
     
     print(f"\n🏢 DOMAIN TUTARLILIK:")
     print(f"   • LinkedIn domain'leri: {linkedin_count:,}")
@@ -248,36 +222,16 @@ def analyze_format_standardization(df, target_col):
     non_null_urls = df[target_col].dropna()
     standardization_issues = []
     
-    # Case sensitivity analizi
-    case_issues = []
-    protocol_variations = []
-    domain_variations = []
+    # Protocol ve domain case varyasyonları (tüm sütun, vektörel)
+    protocol_counts = protocol_prefix_counts(non_null_urls)
     
-    for url in non_null_urls.head(1000):
-        url_str = str(url).strip()
-        
-        # Protocol case variations
-        if url_str.startswith('HTTP://'):
-            protocol_variations.append('HTTP://')
-        elif url_str.startswith('HTTPS://'):
-            protocol_variations.append('HTTPS://')
-        elif url_str.startswith('http://'):
-            protocol_variations.append('http://')
-        elif url_str.startswith('https://'):
-            protocol_variations.append('https://')
-        
-        # Domain case variations
-        try:
-            domain = urlparse(url_str).netloc
-            if domain != domain.lower():
-                domain_variations.append((domain, domain.lower()))
-        except:
-            continue
+    hosts = decompose_urls(non_null_urls)['raw_host'].dropna()
+    mixed_case_hosts = hosts[hosts != hosts.str.lower()]
+    domain_variations = list(zip(mixed_case_hosts, mixed_case_hosts.str.lower()))
     
     print(f"📊 STANDARDIZASYON DURUMU:")
     
     # Protocol standardization
-    protocol_counts = Counter(protocol_variations)
     print(f"   • Protocol Varyasyonları:")
     for protocol, count in protocol_counts.items():
         print(f"     - {protocol}: {count:,} adet")
@@ -389,28 +343,21 @@ def find_similar_columns(df, target_col):
     
     # URL içeriğinden ID çıkarma analizi
     print(f"\n🔍 URL'LERDEN ID ÇIKARMA ANALİZİ:")
-    sample_urls = df[target_col].dropna().head(10)
-    
-    extracted_ids = []
-    for url in sample_urls:
-        # LinkedIn job URL pattern: /jobs/view/JOBID
-        match = re.search(r'/jobs/view/(\d+)', str(url))
-        if match:
-            job_id = match.group(1)
-            extracted_ids.append(job_id)
+    url_job_ids = extract_url_job_ids(df[target_col])
+    extracted_ids = url_job_ids.dropna()
     
-    if extracted_ids:
+    if len(extracted_ids) > 0:
+        print(f"   • ID çıkarılan URL: {len(extracted_ids):,} / {df[target_col].notna().sum():,}")
         print(f"   • URL'lerden çıkarılan ID örnekleri:")
-        for i, job_id in enumerate(extracted_ids[:5], 1):
+        for i, job_id in enumerate(extracted_ids.head(5), 1):
             print(f"     {i}. {job_id}")
         
-        # ID sütunu ile karşılaştırma
+        # ID sütunu ile tam sütun karşılaştırma
         if 'id' in df.columns:
-            sample_ids = df['id'].head(10).astype(str).tolist()
-            matches = len(set(extracted_ids) & set(sample_ids))
-            print(f"   • 'id' sütunu ile eşleşme: {matches}/{len(extracted_ids)} örnekte")
+            proof = verify_url_id_redundancy(df, url_column=target_col, id_column='id')
+            print(f"   • 'id' sütunu ile eşleşme: {proof['matched']:,}/{proof['checked']:,} satırda (%{proof['mapping_rate']:.2f})")
             
-            if matches > len(extracted_ids) * 0.8:  # %80 üzeri eşleşme
+            if proof['mapping_rate'] > 80:  # %80 üzeri eşleşme
                 print(f"     🚨 YÜKSEK REDUNDANCY: URL'ler 'id' sütunundan türetilebilir!")
                 similar_columns.append({
                     'column': 'id',
@@ -7,6 +7,10 @@ Tüm silme kararlarını kontrol eder ve toplu silme için hazırlar.
 
 import pandas as pd
 
+from fast_loader import read_csv_fast
+from null_bitmap_index import build_null_index, structural_duplicate_groups
+from schema_validator import read_columns, column_statistics, null_percentages, stats_sidecar_path
+
 def check_all_column_issues():
     """Tüm sütun problemlerini kontrol et"""
     
@@ -14,9 +18,14 @@ def check_all_column_issues():
     print("=" * 60)
     
     # Son dataset'i yükle
+    dataset_file = 'linkedin_jobs_cleaned_no_redundant_links.csv'
     try:
-        df = pd.read_csv('linkedin_jobs_cleaned_no_redundant_links.csv')
-        print(f"✅ Dataset yüklendi: {len(df):,} kayıt, {len(df.columns)} sütun")
+        columns = read_columns(dataset_file)
+        stats = column_statistics(dataset_file, allow_scan=False)
+        if stats is None:
+            print(f"❌ {stats_sidecar_path(dataset_file)} yok veya bayat - dosyayı üreten adımı yeniden çalıştırın")
+            return
+        print(f"✅ Dataset şeması yüklendi: {stats['rows']:,} kayıt, {len(columns)} sütun ({stats['source']})")
     except Exception as e:
         print(f"❌ Dataset yüklenemedi: {e}")
         return
@@ -37,36 +46,49 @@ def check_all_column_issues():
     
     print(f"\n📊 KULLANICININ BAHSETTİĞİ PROBLEMLİ SÜTUNLAR:")
     for col in user_mentioned_issues:
-        if col in df.columns:
+        if col in columns:
             print(f"   😱 {col}: VAR (silinmeli!)")
         else:
             print(f"   ✅ {col}: YOK")
     
     print(f"\n📊 DAHA ÖNCE SİLDİĞİMİZ SÜTUNLAR (kontrol):")
     for col in previously_decided_to_delete:
-        if col in df.columns:
+        if col in columns:
             print(f"   😱 {col}: VAR (hâlâ duruyor!)")
         else:
             print(f"   ✅ {col}: SİLİNMİŞ")
     
     # Tüm sütunları listele - yüksek null oranları için
     print(f"\n📋 YÜKSEK NULL ORANLI SÜTUNLAR (>90% null):")
-    null_analysis = df.isnull().sum()
+    null_pcts = null_percentages(stats)
     high_null_columns = []
     
-    for col in df.columns:
-        null_count = null_analysis[col]
-        null_pct = (null_count / len(df)) * 100
+    for col in columns:
+        null_pct = null_pcts.get(col, 0.0)
         if null_pct > 90:
             high_null_columns.append((col, null_pct))
             print(f"   🔥 {col}: %{null_pct:.1f} null")
     
+    # Aynı satırlarda null olan sütunlar - yalnızca kısmen null sütunlar okunur
+    print(f"\n🧬 AYNI SATIRLARDA NULL OLAN SÜTUN GRUPLARI:")
+    partially_null = [col for col in columns if 0 < stats['null_counts'].get(col, 0) < stats['rows']]
+    null_groups = []
+    if partially_null:
+        null_index = build_null_index(read_csv_fast(dataset_file, usecols=partially_null))
+        null_groups = structural_duplicate_groups(null_index)
+    for group in null_groups:
+        print(f"   🔗 {', '.join(group)}: {stats['null_counts'][group[0]]:,} null")
+    if not null_groups:
+        print(f"   ✅ Yapısal olarak aynı null pattern'ı taşıyan sütun yok")
+    
     # Company related sütunları bul
     print(f"\n🏢 COMPANY İLE İLGİLİ TÜM SÜTUNLAR:")
-    company_columns = [col for col in df.columns if 'company' in col.lower()]
+    company_columns = [col for col in columns if 'company' in col.lower()]
+    # nunique için yalnızca company sütunları okunur
+    company_df = pd.read_csv(dataset_file, usecols=company_columns) if company_columns else pd.DataFrame()
     for col in company_columns:
-        unique_count = df[col].nunique()
-        null_pct = (df[col].isnull().sum() / len(df)) * 100
+        unique_count = company_df[col].nunique()
+        null_pct = null_pcts.get(col, 0.0)
         print(f"   • {col}: {unique_count:,} benzersiz, %{null_pct:.1f} null")
     
     # Potansiyel silinecek sütunları topla
@@ -74,7 +96,7 @@ def check_all_column_issues():
     
     # Kullanıcının bahsettiği problemli sütunlar
     for col in user_mentioned_issues:
-        if col in df.columns:
+        if col in columns:
             columns_to_delete.append(col)
     
     # Yüksek null oranlı sütunlar (>95% null)
@@ -91,8 +113,8 @@ def check_all_column_issues():
             print(f"      - {col}")
         
         print(f"\n   📈 Sonuç:")
-        print(f"      • Mevcut: {len(df.columns)} sütun")  
-        print(f"      • Sonrası: {len(df.columns) - len(set(columns_to_delete))} sütun")
+        print(f"      • Mevcut: {len(columns)} sütun")  
+        print(f"      • Sonrası: {len(columns) - len(set(columns_to_delete))} sütun")
         print(f"      • Azalma: {len(set(columns_to_delete))} sütun")
     
     return sorted(set(columns_to_delete))
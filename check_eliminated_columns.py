@@ -5,7 +5,7 @@ Eliminated Columns Verification
 Silinen sütunların gerçekten silinip silinmediğini kontrol eder.
 """
 
-import pandas as pd
+from schema_validator import read_columns
 
 def check_eliminated_columns():
     """Silinen sütunları kontrol et"""
@@ -29,17 +29,17 @@ def check_eliminated_columns():
     for file_name in files_to_check:
         try:
             print(f"\n📂 Dosya: {file_name}")
-            df = pd.read_csv(file_name)
+            columns = set(read_columns(file_name))
             
-            print(f"   • Toplam sütun: {len(df.columns)}")
+            print(f"   • Toplam sütun: {len(columns)}")
             print(f"   • Silinen sütunların durumu:")
             
             for col in eliminated_columns:
-                status = "VAR 😱" if col in df.columns else "SİLİNMİŞ ✅"
+                status = "VAR 😱" if col in columns else "SİLİNMİŞ ✅"
                 print(f"     - {col}: {status}")
             
             # Hangi sütunlar var göster
-            remaining_eliminated = [col for col in eliminated_columns if col in df.columns]
+            remaining_eliminated = [col for col in eliminated_columns if col in columns]
             if remaining_eliminated:
                 print(f"   ⚠️  SİLİNMEMİŞ SÜTUNLAR: {len(remaining_eliminated)} adet")
             else:
@@ -7,7 +7,7 @@ Kontrol edilecekler:
 2. Üretilmesi gereken ama eksik olan sütunlar
 """
 
-import pandas as pd
+from schema_validator import read_columns, column_statistics, null_percentages, stats_sidecar_path
 
 def check_pipeline_issues():
     """Pipeline issues kontrolü"""
@@ -20,13 +20,17 @@ def check_pipeline_issues():
     
     try:
         print(f"📂 Loading latest dataset: {latest_file}")
-        df = pd.read_csv(latest_file)
-        print(f"✅ Dataset loaded: {len(df):,} records, {len(df.columns)} columns")
+        columns = read_columns(latest_file)
+        stats = column_statistics(latest_file, allow_scan=False)
+        if stats is None:
+            print(f"❌ Stats sidecar missing or stale: {stats_sidecar_path(latest_file)} - re-run the step that writes it")
+            return
+        print(f"✅ Dataset schema loaded: {stats['rows']:,} records, {len(columns)} columns ({stats['source']})")
     except Exception as e:
         print(f"❌ Error loading dataset: {e}")
         return
     
-    current_columns = set(df.columns)
+    current_columns = set(columns)
     print(f"\n📊 Current columns count: {len(current_columns)}")
     
     # BEKLENTİLER vs GERÇEKLER
@@ -79,8 +83,9 @@ def check_pipeline_issues():
     print("-" * 50)
     
     high_null_columns = []
-    for col in df.columns:
-        null_pct = (df[col].isnull().sum() / len(df)) * 100
+    null_pcts = null_percentages(stats)
+    for col in columns:
+        null_pct = null_pcts.get(col, 0.0)
         if null_pct > 95:
             high_null_columns.append((col, null_pct))
             print(f"   ⚠️  {col}: {null_pct:.1f}% null")
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+LinkedIn Jobs Dataset - Vectorized Classification Rules Engine
+Satır satır df.apply(..., axis=1) sınıflandırıcıları yerine kural tablosunu
+vektörel boolean mask'lere derleyip np.select ile categorical sonuç üretir.
+
+Kural tablosu formatı (sıra önemli, ilk eşleşen kural kazanır):
+    {'label': 'HIGH_INVESTMENT', 'any': [(feature, op, value), ...]}
+    {'label': 'X', 'all': [(feature, op, value), ...]}
+feature bir sütun adı veya FEATURES'taki türetilmiş özellik olabilir.
+
+Her koşul tüm sütun üzerinde tek bir numpy karşılaştırmasıdır; np.select
+kod dizisi üretir ve sonuç pd.Categorical.from_codes ile string
+materialize etmeden kurulur. Yeni kural eklemek satır başına maliyet
+eklemez, yalnızca bir mask daha hesaplanır.
+"""
+
+import numpy as np
+import pandas as pd
+
+SALARY_MIN_COLUMN = 'salaryInsights/salaryDisplayMinRange'
+SALARY_MAX_COLUMN = 'salaryInsights/salaryDisplayMaxRange'
+STAFF_COUNT_COLUMN = 'company/staffCount'
+EXPERIENCE_COLUMN = 'experienceLevel'
+CONTENT_SOURCE_COLUMN = 'contentSource'
+
+
+def _column(df, name, default):
+    """Sütun yoksa row.get(name, default) davranışı: sabit değerli Series"""
+    if name in df.columns:
+        return df[name]
+    return pd.Series(default, index=df.index)
+
+
+def _salary_avg(df):
+    salary_min = pd.to_numeric(_column(df, SALARY_MIN_COLUMN, 0), errors='coerce').fillna(0)
+    salary_max = pd.to_numeric(_column(df, SALARY_MAX_COLUMN, 0), errors='coerce').fillna(0)
+    return ((salary_min + salary_max) / 2).where(salary_max > 0, 0)
+
+
+# Türetilmiş özellikler: isim → DataFrame'den Series
+FEATURES = {
+    'salary_avg': _salary_avg,
+    'company_size': lambda df: pd.to_numeric(_column(df, STAFF_COUNT_COLUMN, 0), errors='coerce').fillna(0),
+    'experience_level': lambda df: _column(df, EXPERIENCE_COLUMN, 'UNKNOWN'),
+}
+
+# create_column_report.py'deki classify_investment_type'ın kural tablosu
+INVESTMENT_RULES = [
+    {'label': 'HIGH_INVESTMENT', 'any': [
+        ('salary_avg', '>', 150000),
+        ('company_size', '>', 10000),
+        ('experience_level', '==', 'DIRECTOR'),
+    ]},
+    {'label': 'MODERATE_INVESTMENT', 'any': [
+        ('salary_avg', '>', 80000),
+        ('company_size', '>', 1000),
+        ('experience_level', '==', 'MID_SENIOR'),
+    ]},
+]
+INVESTMENT_DEFAULT = 'LOW_INVESTMENT'
+
+# create_job_investment_category_and_delete_contentSource.py'deki contentSource mapping'i
+CONTENT_SOURCE_RULES = [
+    {'label': 'PREMIUM_OFFLINE', 'any': [(CONTENT_SOURCE_COLUMN, '==', 'JOBS_PREMIUM_OFFLINE')]},
+    {'label': 'PREMIUM_ONLINE', 'any': [(CONTENT_SOURCE_COLUMN, '==', 'JOBS_PREMIUM')]},
+    {'label': 'ORGANIC', 'any': [(CONTENT_SOURCE_COLUMN, '==', 'JOBS_CREATE')]},
+]
+
+OPERATORS = {
+    '==': lambda s, v: s == v,
+    '!=': lambda s, v: s != v,
+    '>': lambda s, v: s > v,
+    '>=': lambda s, v: s >= v,
+    '<': lambda s, v: s < v,
+    '<=': lambda s, v: s <= v,
+    'in': lambda s, v: s.isin(list(v)),
+    'not in': lambda s, v: ~s.isin(list(v)),
+    'contains': lambda s, v: s.astype('string').str.contains(v, regex=False, na=False),
+    'isna': lambda s, v: s.isna(),
+    'notna': lambda s, v: s.notna(),
+}
+
+
+def rule_labels(rules, default=None):
+    """Kural tablosunun kategori listesi (tablo sırası, default en sonda)"""
+    labels = list(dict.fromkeys(rule['label'] for rule in rules))
+    if default is not None and default not in labels:
+        labels.append(default)
+    return labels
+
+
+def _feature(df, name, cache):
+    if name not in cache:
+        cache[name] = FEATURES[name](df) if name in FEATURES else df[name]
+    return cache[name]
+
+
+def _condition_mask(df, condition, cache):
+    feature, op, value = condition
+    if op not in OPERATORS:
+        raise ValueError(f"Desteklenmeyen operatör: {op}")
+    mask = OPERATORS[op](_feature(df, feature, cache), value)
+    return mask.fillna(False).to_numpy(dtype=bool)
+
+
+def rule_masks(df, rules):
+    """Her kural için boolean mask (özellikler bir kez hesaplanır)"""
+    cache = {}
+    masks = []
+    for rule in rules:
+        if 'all' in rule:
+            conditions, combine = rule['all'], np.logical_and.reduce
+        else:
+            conditions, combine = rule['any'], np.logical_or.reduce
+        condition_masks = [_condition_mask(df, condition, cache) for condition in conditions]
+        masks.append(combine(condition_masks) if condition_masks else np.zeros(len(df), dtype=bool))
+    return masks
+
+
+def classify(df, rules, default=None, name=None):
+    """Kural tablosunu uygular ve categorical Series döndürür
+
+    default=None ise hiçbir kurala uymayan satırlar NaN kalır
+    (Series.map davranışı).
+    """
+    labels = rule_labels(rules, default)
+    masks = rule_masks(df, rules)
+    choices = [labels.index(rule['label']) for rule in rules]
+    fallback = labels.index(default) if default is not None else -1
+
+    if masks:
+        codes = np.select(masks, choices, default=fallback)
+    else:
+        codes = np.full(len(df), fallback)
+    categorical = pd.Categorical.from_codes(codes.astype('int64'), categories=labels)
+    return pd.Series(categorical, index=df.index, name=name)
+
+
+def compile_rules(rules, default=None, name=None):
+    """Kural tablosunu df → categorical Series fonksiyonuna derler"""
+    labels = rule_labels(rules, default)
+    for rule in rules:
+        for _, op, _ in rule.get('all', rule.get('any', [])):
+            if op not in OPERATORS:
+                raise ValueError(f"Desteklenmeyen operatör: {op}")
+
+    def classifier(df):
+        return classify(df, rules, default=default, name=name)
+
+    classifier.labels = labels
+    return classifier
+
+
+classify_investment_type = compile_rules(INVESTMENT_RULES, default=INVESTMENT_DEFAULT, name='job_investment_type')
+map_content_source = compile_rules(CONTENT_SOURCE_RULES, name='job_investment_type')
+
+
+def main():
+    """Kural tablolarını dataset üzerinde çalıştırır"""
+
+    print("🧮 LinkedIn Jobs Dataset - Classification Rules Engine")
+    print("=" * 60)
+
+    try:
+        df = pd.read_csv('linkedin_jobs_dataset_optimized_step6.csv')
+        print(f"✅ Dataset yüklendi: {len(df):,} satır, {len(df.columns)} sütun")
+        print()
+    except Exception as e:
+        print(f"❌ HATA: Dataset yüklenemedi - {e}")
+        return
+
+    classifiers = [('💰 Multi-factor investment', classify_investment_type)]
+    if CONTENT_SOURCE_COLUMN in df.columns:
+        classifiers.append(('🏷️ contentSource mapping', map_content_source))
+
+    for title, classifier in classifiers:
+        result = classifier(df)
+        print(f"{title}:")
+        for label, count in result.value_counts(sort=False).items():
+            print(f"   📊 {label}: {count:,} ilan ({count / len(df) * 100:.1f}%)")
+        unmatched = int(result.isna().sum())
+        if unmatched:
+            print(f"   ⚠️ Eşleşmeyen: {unmatched:,}")
+        print()
+
+if __name__ == "__main__":
+    main()
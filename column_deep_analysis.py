@@ -8,8 +8,11 @@ merged_companyDescription ve company/followingState/followingType sütunlarını
 import pandas as pd
 import numpy as np
 from collections import Counter
-import re
 import warnings
+from format_signature import profile_column
+from mmap_dataset import load_dataset
+from schema_validator import read_columns
+from streaming_sketches import print_column_summary, profile_csv, sketch_profile_enabled, summarize_column
 warnings.filterwarnings('ignore')
 
 def analyze_column_deep(df, column_name):
@@ -64,9 +67,9 @@ def analyze_column_deep(df, column_name):
     if len(non_null_data) > 0:
         # String kontrolü
         all_strings = all(isinstance(val, str) for val in non_null_data)
-        has_numbers = any(str(val).isdigit() for val in non_null_data)
-        has_mixed = any(bool(re.search(r'\d', str(val))) and bool(re.search(r'[a-zA-Z]', str(val))) 
-                       for val in non_null_data)
+        format_profile = profile_column(non_null_data)
+        has_numbers = '9' in format_profile['signatures'].index
+        has_mixed = format_profile['mixed_alnum_rows'] > 0
         
         print(f"📝 Tüm değerler string: {'✅ Evet' if all_strings else '❌ Hayır'}")
         print(f"🔢 Sayı içeren değerler: {'⚠️ Var' if has_numbers else '✅ Yok'}")
@@ -110,7 +113,7 @@ def analyze_column_deep(df, column_name):
                 print(f"   {i:2d}. '{display_value}' → {count:,} ({percentage:.1f}%)")
         
         # Uzunluk analizi (text için)
-        if col_data.dtype == 'object':
+        if pd.api.types.is_string_dtype(col_data) or pd.api.types.is_object_dtype(col_data):
             lengths = non_null_data.astype(str).str.len()
             print(f"\n📏 Karakter uzunluğu analizi:")
             print(f"   Min: {lengths.min()} | Max: {lengths.max()}")
@@ -151,6 +154,13 @@ def analyze_column_deep(df, column_name):
         else:
             print("✅ Büyük/küçük harf tutarsızlığı bulunamadı")
         
+        # Format signature dağılımı (tüm değerler)
+        print(f"🧬 Format signature sayısı: {format_profile['signature_count']:,} "
+              f"(dominant: '{format_profile['dominant_signature']}' %{format_profile['dominant_share']:.1f})")
+        if 1 < format_profile['signature_count'] <= 20:
+            for signature, rows in format_profile['signatures'].head(5).items():
+                print(f"   • '{signature}' → {rows:,} satır (örn: '{str(format_profile['examples'][signature])[:40]}')")
+        
         # Özel karakter kontrolü
         special_chars = non_null_data.str.contains(r'[^\w\s\-\.\,\(\)]', regex=True, na=False).sum()
         if special_chars > 0:
@@ -265,21 +275,36 @@ def main():
     print("🔍 LinkedIn Jobs Dataset - Column Deep Analysis")
     print("=" * 60)
     
+    # Analiz edilecek sütunlar
+    target_columns = [
+        'merged_companyDescription',
+        'company/followingState/followingType'
+    ]
+    dataset_file = 'linkedin_jobs_dataset_insights_completed.csv'
+    
+    # Sketch modu (PIPELINE_SKETCH_PROFILE=1): dataset belleğe alınmadan chunk chunk profillenir
+    if sketch_profile_enabled():
+        try:
+            columns = [col for col in target_columns if col in read_columns(dataset_file)]
+            profile = profile_csv(dataset_file, columns)
+        except Exception as e:
+            print(f"❌ HATA: Dataset profillenemedi - {e}")
+            return
+        print(f"📐 Sketch profili: {profile['rows']:,} satır")
+        print()
+        for column in columns:
+            print_column_summary(summarize_column(profile, column), column)
+        return
+    
     # Dataset'i yükle
     try:
-        df = pd.read_csv('linkedin_jobs_dataset_insights_completed.csv')
+        df = load_dataset(dataset_file)
         print(f"✅ Dataset yüklendi: {len(df):,} satır, {len(df.columns)} sütun")
         print()
     except Exception as e:
         print(f"❌ HATA: Dataset yüklenemedi - {e}")
         return
     
-    # Analiz edilecek sütunlar
-    target_columns = [
-        'merged_companyDescription',
-        'company/followingState/followingType'
-    ]
-    
     results = {}
     
     for column in target_columns:
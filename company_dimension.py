@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+LinkedIn Jobs Dataset - Company Dimension (Star Schema)
+Her ilan satırında tekrarlanan şirket sütunlarını (isim, universalName,
+LinkedIn URL, çalışan sayısı, takipçi sayısı, açıklama) tek satırı şirket
+olan bir dimension tablosuna taşır. Logo sütunları (has_company_logo,
+company_logo_url) ilan seviyesidir ve fact tablosunda kalır.
+
+- jobs fact tablosu: şirket sütunları yerine integer 'companyId' anahtarı
+- companies dimension: companyId başına bir satır + job_count
+
+Şirket anahtarı: dataset'te sayısal companyId varsa o, yoksa doğal anahtar
+factorize edilerek üretilen int64 surrogate key. Doğal anahtar şirket başına
+tek değere çözülür: companyLinkedinUrl → company/universalName → companyName
+→ company/name sırasında, düşük öncelikli bir değer (ör. şirket adı) aynı
+satırlarda görüldüğü yüksek öncelikli anahtara eşlenir; böylece URL'li ve
+yalnızca isimli ilanlar aynı şirkette birleşir.
+Şirket seviyesi analizler (logo coverage, şirket başına ilan) O(ilan)
+groupby yerine O(şirket) dimension üzerinde çalışır; gerektiğinde
+join_company_attributes integer anahtarla denormalize eder.
+
+Pipeline entegrasyonu: process_final_column_deletions.py son adımda
+star schema'yı Parquet olarak yazar. PIPELINE_STAR_SCHEMA=0 ile kapatılabilir.
+"""
+
+import os
+import sys
+
+import pandas as pd
+
+STAR_SCHEMA_ENV = 'PIPELINE_STAR_SCHEMA'
+FACT_PATH = 'linkedin_jobs_fact.parquet'
+DIMENSION_PATH = 'linkedin_companies_dim.parquet'
+
+COMPANY_KEY_COLUMN = 'companyId'
+JOB_COUNT_COLUMN = 'job_count'
+
+# Doğal anahtar adayları (öncelik sırasıyla)
+NATURAL_KEY_COLUMNS = ['companyLinkedinUrl', 'company/universalName', 'companyName', 'company/name']
+
+COMPANY_ATTRIBUTE_COLUMNS = [
+    'companyName',
+    'company/name',
+    'company/universalName',
+    'companyLinkedinUrl',
+    'companyDescription',
+    'company/staffCount',
+    'company/followingState/followerCount',
+]
+COMPANY_ATTRIBUTE_PREFIXES = ['company/employeeCountRange/']
+
+
+def star_schema_enabled():
+    return os.environ.get(STAR_SCHEMA_ENV, '1') != '0'
+
+
+def company_attribute_columns(df):
+    """Dataset'te bulunan şirket seviyesi sütunlar"""
+    columns = [col for col in COMPANY_ATTRIBUTE_COLUMNS if col in df.columns]
+    columns += [col for col in df.columns
+                if any(col.startswith(prefix) for prefix in COMPANY_ATTRIBUTE_PREFIXES) and col not in columns]
+    return columns
+
+
+def _normalized_key_values(series):
+    """Anahtar değerleri: strip + lower, boş string NA"""
+    values = series.astype('string').str.strip().str.lower()
+    return values.mask((values == '').fillna(False))
+
+
+def resolve_natural_keys(df, key_columns=None):
+    """Satır başına tek doğal şirket anahtarı ('<kaynak sütun>:<değer>')
+
+    Sütunlar öncelik sırasıyla işlenir. Bir sütunun değeri, daha önce anahtarı
+    çözülmüş satırlarda birlikte görüldüğü anahtara (en sık olana) eşlenir;
+    eşlenemeyen değer kendi sütunu ile anahtar olur. Hiçbir anahtar sütunu
+    dolu olmayan satırlar NA kalır.
+    """
+    key = pd.Series(pd.NA, index=df.index, dtype='string')
+    for col in key_columns or NATURAL_KEY_COLUMNS:
+        if col not in df.columns:
+            continue
+        values = _normalized_key_values(df[col])
+        known = key.notna() & values.notna()
+        if known.any():
+            # value_counts çok sıklıktan aza sıralı: değer başına ilk kayıt en sık anahtar
+            pairs = pd.DataFrame({'value': values[known], 'key': key[known]}).value_counts().reset_index()
+            mapping = pairs.drop_duplicates('value').set_index('value')['key']
+            key = key.fillna(values.map(mapping).astype('string'))
+        key = key.fillna(col + ':' + values)
+    return key
+
+
+def key_resolution_report(natural_key):
+    """Anahtar kaynağına göre satır sayıları; 'unresolved': şirketi çözülemeyen satırlar"""
+    sources = natural_key.str.split(':', n=1).str[0]
+    report = {col: int(count) for col, count in sources.value_counts().items()}
+    report['unresolved'] = int(natural_key.isna().sum())
+    return report
+
+
+def company_keys(df, key_columns=None):
+    """Satır başına Int64 şirket anahtarı
+
+    key_columns verilmezse sayısal companyId sütunu doğrudan kullanılır;
+    aksi halde resolve_natural_keys ile çözülen doğal anahtar factorize edilir
+    (şirketi belirsiz satırlar NA).
+    """
+    if key_columns is None and COMPANY_KEY_COLUMN in df.columns:
+        existing = pd.to_numeric(df[COMPANY_KEY_COLUMN], errors='coerce')
+        if existing.notna().sum() == df[COMPANY_KEY_COLUMN].notna().sum():
+            return existing.astype('Int64')
+
+    natural_key = resolve_natural_keys(df, key_columns)
+    codes, _ = pd.factorize(natural_key, use_na_sentinel=True)
+    return pd.Series(codes, index=df.index, dtype='Int64').mask(codes < 0)
+
+
+def build_company_dimension(df, keys, attribute_columns=None):
+    """companyId başına tek satırlık dimension (sütun başına ilk dolu değer)"""
+    attribute_columns = company_attribute_columns(df) if attribute_columns is None else attribute_columns
+    frame = df[attribute_columns].assign(**{COMPANY_KEY_COLUMN: keys})
+    frame = frame[frame[COMPANY_KEY_COLUMN].notna()]
+
+    aggregations = {col: 'first' for col in attribute_columns}
+    grouped = frame.groupby(COMPANY_KEY_COLUMN, sort=True)
+    dimension = grouped.agg(aggregations) if aggregations else pd.DataFrame(index=grouped.size().index)
+    dimension.insert(0, JOB_COUNT_COLUMN, grouped.size().astype('int64'))
+    dimension.index = dimension.index.astype('int64')
+    return dimension
+
+
+def build_star_schema(df, key_columns=None):
+    """DataFrame'i (fact, dimension) çiftine ayırır
+
+    Returns:
+        (fact, dimension): fact şirket sütunları yerine companyId taşır;
+        dimension companyId index'li şirket tablosudur.
+    """
+    keys = company_keys(df, key_columns)
+    attribute_columns = [col for col in company_attribute_columns(df) if col != COMPANY_KEY_COLUMN]
+    dimension = build_company_dimension(df, keys, attribute_columns)
+
+    fact = df.drop(columns=attribute_columns + [c for c in [COMPANY_KEY_COLUMN] if c in df.columns])
+    fact.insert(0, COMPANY_KEY_COLUMN, keys)
+    return fact, dimension
+
+
+def join_company_attributes(fact, dimension, columns=None):
+    """Fact'e integer anahtarla şirket sütunlarını ekler (denormalize)"""
+    columns = [col for col in dimension.columns if col != JOB_COUNT_COLUMN] if columns is None else list(columns)
+    keys = fact[COMPANY_KEY_COLUMN]
+    joined = fact.copy()
+    for col in columns:
+        # Series.map(Series): integer index üzerinden hash lookup, şirketi olmayan satırlar NaN
+        joined[col] = keys.map(dimension[col])
+    return joined
+
+
+def company_coverage(dimension, column):
+    """Şirket seviyesi coverage: column'u dolu (boolean ise True) şirket oranı (O(şirket))"""
+    total = len(dimension)
+    covered = 0
+    if column in dimension.columns:
+        values = dimension[column]
+        covered = int(values.sum()) if pd.api.types.is_bool_dtype(values) else int(values.notna().sum())
+    return {
+        'companies_with_value': covered,
+        'total_companies': total,
+        'coverage_pct': covered / total * 100 if total > 0 else 0.0
+    }
+
+
+def dimension_conflicts(df, keys, attribute_columns=None):
+    """Aynı şirket için birden fazla farklı değer taşıyan sütunlar {sütun: şirket sayısı}"""
+    attribute_columns = company_attribute_columns(df) if attribute_columns is None else attribute_columns
+    frame = df[attribute_columns].assign(**{COMPANY_KEY_COLUMN: keys}).dropna(subset=[COMPANY_KEY_COLUMN])
+    distinct = frame.groupby(COMPANY_KEY_COLUMN).nunique()
+    return {col: int(count) for col, count in (distinct > 1).sum().items() if count > 0}
+
+
+def write_star_schema(fact, dimension, fact_path=FACT_PATH, dimension_path=DIMENSION_PATH):
+    fact.to_parquet(fact_path, index=False)
+    dimension.to_parquet(dimension_path, index=True)
+    return fact_path, dimension_path
+
+
+def load_company_dimension(path=DIMENSION_PATH):
+    return pd.read_parquet(path)
+
+
+def emit_star_schema_if_enabled(df):
+    """Pipeline sonu kancası: PIPELINE_STAR_SCHEMA=0 değilse fact + dimension yazar"""
+    if not star_schema_enabled():
+        return None
+    fact, dimension = build_star_schema(df)
+    write_star_schema(fact, dimension)
+    return {
+        'fact_path': FACT_PATH,
+        'dimension_path': DIMENSION_PATH,
+        'jobs': len(fact),
+        'companies': len(dimension),
+        'fact_columns': len(fact.columns),
+        'dimension_columns': len(dimension.columns)
+    }
+
+
+def main():
+    """Final dataset'ten star schema üretir ve bellek kazancını raporlar"""
+
+    print("⭐ LinkedIn Jobs Dataset - Company Dimension (Star Schema)")
+    print("=" * 60)
+
+    input_file = sys.argv[1] if len(sys.argv) > 1 else 'fixed_all_company_colums.csv'
+    try:
+        df = pd.read_csv(input_file)
+        print(f"✅ Dataset yüklendi: {len(df):,} satır, {len(df.columns)} sütun")
+        print()
+    except Exception as e:
+        print(f"❌ HATA: Dataset yüklenemedi - {e}")
+        return
+
+    fact, dimension = build_star_schema(df)
+    keys = fact[COMPANY_KEY_COLUMN]
+
+    denormalized_mb = df.memory_usage(deep=True).sum() / 1024**2
+    fact_mb = fact.memory_usage(deep=True).sum() / 1024**2
+    dimension_mb = dimension.memory_usage(deep=True).sum() / 1024**2
+
+    print(f"🏢 Şirket sütunları ({len(dimension.columns) - 1}): {', '.join(dimension.columns[1:])}")
+    print(f"📊 İlan: {len(fact):,} | Şirket: {len(dimension):,} | Şirketi belirsiz ilan: {int(keys.isna().sum()):,}")
+
+    resolution = key_resolution_report(resolve_natural_keys(df))
+    print("🔑 Doğal anahtar kaynağı: " + ", ".join(f"{col} {count:,}" for col, count in resolution.items()))
+    print(f"💾 Denormalize: {denormalized_mb:.2f} MB → fact {fact_mb:.2f} MB + dimension {dimension_mb:.2f} MB")
+
+    conflicts = dimension_conflicts(df, company_keys(df), list(dimension.columns[1:]))
+    if conflicts:
+        print("⚠️ Şirket içinde farklı değer taşıyan sütunlar (dimension ilk dolu değeri tutar):")
+        for col, count in conflicts.items():
+            print(f"   • {col}: {count:,} şirket")
+
+    if 'has_company_logo' in fact.columns:
+        # Logo ilan seviyesinde (fact); şirket, en az bir ilanı logo'lu ise sayılır
+        has_logo = fact['has_company_logo'].fillna(False).astype(bool)
+        logo_companies = int(keys[has_logo].nunique())
+        print(f"🖼️ Logo'lu ilan: %{has_logo.mean() * 100:.1f} | "
+              f"logo'lu ilanı olan şirket: {logo_companies:,}/{len(dimension):,}")
+
+    try:
+        write_star_schema(fact, dimension)
+        print(f"✅ Yazıldı: {FACT_PATH}, {DIMENSION_PATH}")
+    except Exception as e:
+        print(f"❌ HATA: Star schema yazılamadı - {e}")
+
+if __name__ == "__main__":
+    main()
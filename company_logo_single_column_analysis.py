@@ -10,8 +10,9 @@ import numpy as np
 from collections import Counter
 import re
 import urllib.parse
-from urllib.parse import urlparse
 import warnings
+from url_vectorized import decompose_urls
+from company_dimension import build_company_dimension, company_coverage, company_keys
 warnings.filterwarnings('ignore')
 
 def analyze_company_logo_column(df):
@@ -108,23 +109,11 @@ def analyze_company_logo_column(df):
         pct = (count / non_null_count) * 100 if non_null_count > 0 else 0
         print(f"   {format_type}: {count:,} ({pct:.1f}%)")
     
-    # Domain analysis for URLs
-    domains = []
-    invalid_urls = 0
-    
-    for url in non_null_data:
-        try:
-            if str(url).startswith(('http://', 'https://')):
-                parsed = urlparse(str(url))
-                if parsed.netloc:
-                    domains.append(parsed.netloc.lower())
-                else:
-                    invalid_urls += 1
-            else:
-                # Non-URL entries
-                pass
-        except:
-            invalid_urls += 1
+    # Domain analysis for URLs (tüm sütun, vektörel decomposition)
+    is_web_url = non_null_data.astype(str).str.startswith(('http://', 'https://'))
+    url_parts = decompose_urls(non_null_data[is_web_url])
+    domains = url_parts['host'].dropna().tolist()
+    invalid_urls = int(url_parts['host'].isna().sum())
     
     if domains:
         domain_counts = Counter(domains)
@@ -136,16 +125,11 @@ def analyze_company_logo_column(df):
     if invalid_urls > 0:
         print(f"\n⚠️ Invalid URL formats: {invalid_urls:,}")
     
-    # File extension analysis
-    extensions = []
-    for url in non_null_data:
-        url_str = str(url).lower()
-        # Extract extension from URL path
-        path = urlparse(url_str).path if url_str.startswith(('http://', 'https://')) else url_str
-        if '.' in path:
-            ext = path.split('.')[-1].split('?')[0].split('#')[0]  # Remove query params
-            if len(ext) <= 5:  # Reasonable extension length
-                extensions.append(ext)
+    # File extension analysis (URL'lerde path'in son segmenti, diğerlerinde değerin kendisi)
+    non_url_extensions = non_null_data[~is_web_url].astype(str).str.lower().str.extract(
+        r'\.([a-z0-9]{1,5})(?:[?#].*)?$', expand=False
+    )
+    extensions = pd.concat([url_parts['extension'], non_url_extensions]).dropna().tolist()
     
     if extensions:
         ext_counts = Counter(extensions)
@@ -208,15 +192,12 @@ def analyze_company_logo_column(df):
     if null_percentage > 0:
         # Analyze null pattern by company
         if 'company/name' in df.columns:
-            company_logo_stats = df.groupby('company/name').agg({
-                column_name: ['count', lambda x: x.isnull().sum()]
-            }).round(2)
+            # Şirket başına tek satır: coverage O(şirket) dimension üzerinden
+            dimension = build_company_dimension(df, company_keys(df, ['company/name']), [column_name])
+            coverage = company_coverage(dimension, column_name)
             
-            companies_with_logos = len(df[df['company/name'].notna() & df[column_name].notna()]['company/name'].unique())
-            total_companies = len(df[df['company/name'].notna()]['company/name'].unique())
-            
-            print(f"   🏢 Logo'lu şirket sayısı: {companies_with_logos:,}/{total_companies:,}")
-            print(f"   📈 Şirket logo coverage: {(companies_with_logos/total_companies)*100:.1f}%")
+            print(f"   🏢 Logo'lu şirket sayısı: {coverage['companies_with_value']:,}/{coverage['total_companies']:,}")
+            print(f"   📈 Şirket logo coverage: {coverage['coverage_pct']:.1f}%")
     
     print(f"\n💡 Doldurma Önerileri:")
     if null_percentage > 50:
@@ -255,22 +236,12 @@ def analyze_company_logo_column(df):
             format_issues['case_variations'] = len(original_domains) - len(normalized_domains)
             print(f"⚠️ Case variations detected in domains")
     
-    # Malformed URL detection
-    malformed_count = 0
-    for url in non_null_data.head(100):  # Sample check
-        url_str = str(url)
-        if url_str.startswith(('http://', 'https://')):
-            try:
-                parsed = urlparse(url_str)
-                if not parsed.netloc or not parsed.scheme:
-                    malformed_count += 1
-            except:
-                malformed_count += 1
+    # Malformed URL detection (tüm sütun; scheme/host çıkarılamayan http(s) değerleri)
+    malformed_count = int(url_parts['host'].isna().sum())
     
     if malformed_count > 0:
-        estimated_malformed = (malformed_count / 100) * non_null_count
-        print(f"⚠️ Estimated malformed URLs: ~{estimated_malformed:.0f}")
-        format_issues['malformed_urls'] = estimated_malformed
+        print(f"⚠️ Malformed URLs: {malformed_count:,}")
+        format_issues['malformed_urls'] = malformed_count
     
     # Standardization recommendations
     print(f"\n💡 Standardization Önerileri:")
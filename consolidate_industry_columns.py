@@ -6,12 +6,15 @@ Eksiksiz birleştirme: formattedIndustries/0,1,2 → industries (consolidated)
 Silme: company/industry/0 (redundant)
 """
 
-import pandas as pd
-import numpy as np
 from collections import Counter
 import warnings
+from pipeline_profiler import profile_step
+from schema_validator import checkpoint_gate
+from string_columns import clean_strings, join_string_columns
+from fast_loader import read_csv_fast
 warnings.filterwarnings('ignore')
 
+@profile_step
 def consolidate_industry_columns(df):
     """Industry sütunlarını eksiksiz birleştir ve optimize et"""
     
@@ -60,28 +63,12 @@ def consolidate_industry_columns(df):
     # Create consolidated column
     df_consolidated = df.copy()
     
-    def consolidate_industries_row(row):
-        """Her satır için industry bilgilerini eksiksiz birleştir"""
-        values = []
-        
-        # formattedIndustries/0,1,2 sırasıyla kontrol et
-        for col in formatted_cols:
-            val = row[col]
-            if pd.notna(val) and str(val).strip():
-                val_clean = str(val).strip()
-                if val_clean not in values:  # Duplicate check
-                    values.append(val_clean)
-        
-        if values:
-            return ' | '.join(values)  # Multi-value separator
-        else:
-            return np.nan
-    
     print("🔧 Consolidation işlemi başlatılıyor...")
     
-    # Apply consolidation
-    df_consolidated['industries_consolidated'] = df_consolidated[formatted_cols].apply(
-        consolidate_industries_row, axis=1
+    # formattedIndustries/0,1,2 sırasıyla, boş ve satır içi tekrar değerler atlanarak
+    # ' | ' ile birleştirilir (string[pyarrow] üzerinde vektörel)
+    df_consolidated['industries_consolidated'] = join_string_columns(
+        df_consolidated, formatted_cols, sep=' | ', dedupe=True
     )
     
     # 2. CONSOLIDATION VERIFICATION
@@ -97,12 +84,12 @@ def consolidate_industry_columns(df):
     
     for i, col in enumerate(formatted_cols):
         # Count how many values from this column made it to consolidated
-        preserved_count = 0
-        for idx, row in df.iterrows():
-            if pd.notna(row[col]):
-                consolidated_val = df_consolidated.loc[idx, 'industries_consolidated']
-                if pd.notna(consolidated_val) and str(row[col]).strip() in str(consolidated_val):
-                    preserved_count += 1
+        both_present = (df[col].notna() & df_consolidated['industries_consolidated'].notna()).to_numpy()
+        source_values = clean_strings(df[col])[both_present].fillna('')
+        consolidated_values = df_consolidated['industries_consolidated'][both_present]
+        preserved_count = sum(
+            value in consolidated for value, consolidated in zip(source_values, consolidated_values)
+        )
         
         original_count = df[col].notna().sum()
         preservation_rate = (preserved_count / original_count * 100) if original_count > 0 else 0
@@ -207,7 +194,7 @@ def main():
     
     # Dataset'i yükle
     try:
-        df = pd.read_csv('linkedin_jobs_dataset_optimized_step2.csv')
+        df = read_csv_fast('linkedin_jobs_dataset_optimized_step2.csv')
         print(f"✅ Dataset yüklendi: {len(df):,} satır, {len(df.columns)} sütun")
         print()
     except Exception as e:
@@ -221,6 +208,7 @@ def main():
         # Save the consolidated dataset
         output_filename = 'linkedin_jobs_dataset_optimized_step3.csv'
         df_consolidated.to_csv(output_filename, index=False)
+        checkpoint_gate(output_filename, df_consolidated)
         
         print(f"\n💾 DATASET SAVED:")
         print(f"   📁 File: {output_filename}")
@@ -5,14 +5,21 @@ LinkedIn Jobs Dataset - contentSource Business Insight Analysis
 ContentSource sütununun business anlamı ve insight potansiyeli analizi
 """
 
-import pandas as pd
 import numpy as np
 from collections import Counter
 import warnings
+from lazy_query import collect, count_by, scan_csv, select_available
 warnings.filterwarnings('ignore')
 
-def analyze_contentSource_business_insights(df):
-    """contentSource sütununun business meaning ve insight analizi"""
+INPUT_FILE = 'linkedin_jobs_dataset_insights_completed.csv'
+REPORT_COLUMNS = ['contentSource', 'salary/max', 'company_size_category',
+                  'formattedExperienceLevel', 'formattedIndustries/0']
+
+def analyze_contentSource_business_insights(df, jobs=None):
+    """contentSource sütununun business meaning ve insight analizi
+
+    jobs (lazy_query planı) verilirse dağılım plandan count_by ile okunur.
+    """
     
     print("💼 CONTENTSOURCE - BUSINESS MEANING & INSIGHT ANALYSIS")
     print("=" * 65)
@@ -54,7 +61,7 @@ def analyze_contentSource_business_insights(df):
         }
     }
     
-    value_counts = df[column_name].value_counts()
+    value_counts = count_by(jobs, column_name) if jobs is not None else df[column_name].value_counts()
     
     for value, count in value_counts.items():
         if value in business_meanings:
@@ -237,11 +244,12 @@ def analyze_contentSource_business_insights(df):
 if __name__ == "__main__":
     try:
         print("📂 Dataset yükleniyor...")
-        df = pd.read_csv('linkedin_jobs_dataset_insights_completed.csv')
+        jobs = scan_csv(INPUT_FILE)
+        df = collect(select_available(jobs, REPORT_COLUMNS))
         print(f"✅ Dataset yüklendi: {len(df):,} kayıt, {len(df.columns)} sütun")
         print()
         
-        result = analyze_contentSource_business_insights(df)
+        result = analyze_contentSource_business_insights(df, jobs)
         
         if result:
             print("✅ Business insight analizi tamamlandı!")
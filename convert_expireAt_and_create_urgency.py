@@ -9,8 +9,12 @@ import pandas as pd
 import numpy as np
 from datetime import datetime
 import warnings
+from pipeline_profiler import profile_step
+from schema_validator import checkpoint_gate
+from fast_loader import read_csv_fast
 warnings.filterwarnings('ignore')
 
+@profile_step
 def convert_expireAt_and_create_urgency(df):
     """ExpireAt'i datetime'a çevirir ve urgency kategorileri oluşturur"""
     
@@ -133,7 +137,7 @@ if __name__ == "__main__":
     try:
         # Load the dataset
         print("📂 Dataset yükleniyor...")
-        df = pd.read_csv('linkedin_jobs_dataset_optimized_step12.csv')
+        df = read_csv_fast('linkedin_jobs_dataset_optimized_step12.csv')
         print(f"✅ Dataset yüklendi: {len(df):,} satır, {len(df.columns)} sütun")
         print()
         
@@ -144,6 +148,7 @@ if __name__ == "__main__":
         output_filename = 'linkedin_jobs_dataset_optimized_step13.csv'
         print(f"💾 Saving converted dataset: {output_filename}")
         df_converted.to_csv(output_filename, index=False)
+        checkpoint_gate(output_filename, df_converted)
         
         # File size comparison
         import os
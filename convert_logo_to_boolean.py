@@ -5,11 +5,14 @@ LinkedIn Jobs Dataset - Logo URL to Boolean Conversion
 company_logo_url → has_company_logo (boolean) + URL column deletion
 """
 
-import pandas as pd
 import numpy as np
 import warnings
+from pipeline_profiler import profile_step
+from schema_validator import checkpoint_gate
+from fast_loader import read_csv_fast
 warnings.filterwarnings('ignore')
 
+@profile_step
 def convert_logo_to_boolean(df):
     """Logo URL sütununu boolean flag'e çevir ve URL sütununu sil"""
     
@@ -225,7 +228,7 @@ def main():
     
     # Dataset'i yükle
     try:
-        df = pd.read_csv('linkedin_jobs_dataset_optimized_step4.csv')
+        df = read_csv_fast('linkedin_jobs_dataset_optimized_step4.csv')
         print(f"✅ Dataset yüklendi: {len(df):,} satır, {len(df.columns)} sütun")
         print()
     except Exception as e:
@@ -241,6 +244,7 @@ def main():
         # Save optimized dataset
         output_filename = 'linkedin_jobs_dataset_optimized_step5.csv'
         df_optimized.to_csv(output_filename, index=False)
+        checkpoint_gate(output_filename, df_optimized)
         
         print(f"\n💾 OPTIMIZED DATASET SAVED:")
         print(f"   📁 File: {output_filename}")
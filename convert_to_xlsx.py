@@ -9,6 +9,7 @@ Kullanıcı kontrolü ve analizi için XLSX format sağlar.
 import pandas as pd
 import numpy as np
 from datetime import datetime
+from fast_loader import read_csv_fast
 
 def convert_csv_to_xlsx():
     """CSV dosyasını XLSX formatına dönüştür"""
@@ -23,7 +24,7 @@ def convert_csv_to_xlsx():
     try:
         # CSV dosyasını yükle
         print(f"📂 CSV dosyası yükleniyor: {input_file}")
-        df = pd.read_csv(input_file)
+        df = read_csv_fast(input_file)
         
         print(f"✅ Dataset başarıyla yüklendi:")
         print(f"   • Kayıt sayısı: {len(df):,}")
@@ -14,6 +14,8 @@ Hiçbir ekleme/çıkarma yapılmaz, sadece format kopyalama.
 import pandas as pd
 import json
 import os
+from string_columns import to_arrow_strings
+from schema_validator import checkpoint_gate
 
 def copy_step13_to_fixed_formats():
     """Step13'ü fixed_all_company_colums formatlarına kopyala"""
@@ -33,7 +35,7 @@ def copy_step13_to_fixed_formats():
     
     try:
         print(f"📂 Loading source file: {source_file}")
-        df = pd.read_excel(source_file)
+        df = to_arrow_strings(pd.read_excel(source_file))
         print(f"✅ Source loaded successfully:")
         print(f"   📊 Records: {len(df):,}")
         print(f"   📊 Columns: {len(df.columns)}")
@@ -59,6 +61,7 @@ def copy_step13_to_fixed_formats():
     try:
         csv_file = target_files['csv']
         df.to_csv(csv_file, index=False)
+        checkpoint_gate(csv_file, df)
         csv_size = os.path.getsize(csv_file) / (1024*1024)
         conversion_results['csv'] = {
             'success': True,
@@ -441,32 +441,26 @@ df['job_urgency_category'] = df['days_to_expire'].apply(categorize_urgency)
 
 **NASIL OLUŞTURULDU:**
 ```python
-def classify_investment_type(row):
-    # Extract salary information
-    salary_min = row.get('salaryInsights/salaryDisplayMinRange', 0)
-    salary_max = row.get('salaryInsights/salaryDisplayMaxRange', 0)
-    
-    # Company size factor
-    company_size = row.get('company/staffCount', 0)
-    
-    # Experience requirements
-    experience_level = row.get('experienceLevel', 'UNKNOWN')
-    
-    # Multi-factor analysis
-    salary_avg = (salary_min + salary_max) / 2 if salary_max > 0 else 0
-    
-    if salary_avg > 150000 or company_size > 10000 or experience_level == 'DIRECTOR':
-        return 'HIGH_INVESTMENT'
-    elif salary_avg > 80000 or company_size > 1000 or experience_level == 'MID_SENIOR':
-        return 'MODERATE_INVESTMENT'
-    else:
-        return 'LOW_INVESTMENT'
-
-df['job_investment_type'] = df.apply(classify_investment_type, axis=1)
+# classification_rules.py: kural tablosu → np.select (satır başına Python çağrısı yok)
+INVESTMENT_RULES = [
+    {'label': 'HIGH_INVESTMENT', 'any': [
+        ('salary_avg', '>', 150000),
+        ('company_size', '>', 10000),
+        ('experience_level', '==', 'DIRECTOR'),
+    ]},
+    {'label': 'MODERATE_INVESTMENT', 'any': [
+        ('salary_avg', '>', 80000),
+        ('company_size', '>', 1000),
+        ('experience_level', '==', 'MID_SENIOR'),
+    ]},
+]
+
+classify_investment_type = compile_rules(INVESTMENT_RULES, default='LOW_INVESTMENT')
+df['job_investment_type'] = classify_investment_type(df)  # categorical
 ```
 
 **TEKNIK DETAYLAR:**
-- **Veri Türü**: object (string)
+- **Veri Türü**: category
 - **Classification Factors**: Salary range, company size, experience level
 - **Algorithm**: Multi-criteria decision analysis
 - **Thresholds**: Dynamic based on multiple factors
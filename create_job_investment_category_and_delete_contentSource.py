@@ -5,11 +5,15 @@ LinkedIn Jobs Dataset - Job Investment Category Creation & ContentSource Deletio
 ContentSource sütunundan business-friendly kategori oluşturup orijinal sütunu silen script yazıyorum.
 """
 
-import pandas as pd
 import numpy as np
 import warnings
+from pipeline_profiler import profile_step
+from schema_validator import checkpoint_gate
+from classification_rules import CONTENT_SOURCE_RULES, map_content_source
+from fast_loader import read_csv_fast
 warnings.filterwarnings('ignore')
 
+@profile_step
 def create_job_investment_category_and_delete_source(df):
     """ContentSource'dan yeni kategori oluştur ve orijinal sütunu sil"""
     
@@ -41,10 +45,9 @@ def create_job_investment_category_and_delete_source(df):
     
     print("💡 Business-Friendly Kategori Mapping:")
     
+    # contentSource → kategori eşlemesi classification_rules kural tablosundan
     category_mapping = {
-        'JOBS_PREMIUM_OFFLINE': 'PREMIUM_OFFLINE',
-        'JOBS_PREMIUM': 'PREMIUM_ONLINE', 
-        'JOBS_CREATE': 'ORGANIC'
+        value: rule['label'] for rule in CONTENT_SOURCE_RULES for _, _, value in rule['any']
     }
     
     business_explanations = {
@@ -91,8 +94,8 @@ def create_job_investment_category_and_delete_source(df):
     
     print(f"📝 Yeni sütun oluşturuluyor: {new_column}")
     
-    # Apply mapping
-    df[new_column] = df[source_column].map(category_mapping)
+    # Apply mapping (vektörel kural motoru, doğrudan category tipinde)
+    df[new_column] = map_content_source(df)
     
     # Verify mapping success
     unmapped_count = df[new_column].isnull().sum()
@@ -103,10 +106,7 @@ def create_job_investment_category_and_delete_source(df):
     else:
         print("✅ Tüm değerler başarıyla map edildi!")
     
-    # Convert to category type for memory optimization
-    df[new_column] = df[new_column].astype('category')
-    
-    print(f"✅ Yeni sütun oluşturuldu ve 'category' tipine çevrildi")
+    print(f"✅ Yeni sütun oluşturuldu ('category' tipinde)")
     print()
     
     # 4. NEW COLUMN VERIFICATION
@@ -114,6 +114,7 @@ def create_job_investment_category_and_delete_source(df):
     print("-" * 30)
     
     new_stats = df[new_column].value_counts()
+    new_stats = new_stats[new_stats > 0]  # kural tablosundaki gözlenmeyen kategoriler
     new_memory = df[new_column].memory_usage(deep=True) / 1024**2
     
     print("📊 Yeni Job Investment Type Dağılımı:")
@@ -248,7 +249,7 @@ def create_job_investment_category_and_delete_source(df):
 if __name__ == "__main__":
     try:
         print("📂 Dataset yükleniyor...")
-        df = pd.read_csv('linkedin_jobs_dataset_optimized_step6.csv')
+        df = read_csv_fast('linkedin_jobs_dataset_optimized_step6.csv')
         print(f"✅ Dataset yüklendi: {len(df):,} kayıt, {len(df.columns)} sütun")
         print()
         
@@ -263,6 +264,7 @@ if __name__ == "__main__":
             # Save the updated dataset
             output_file = 'linkedin_jobs_dataset_optimized_step7.csv'
             df.to_csv(output_file, index=False)
+            checkpoint_gate(output_file, df)
             print(f"💾 Güncellenmiş dataset kaydedildi: {output_file}")
         else:
             print("❌ İşlem başarısız!")
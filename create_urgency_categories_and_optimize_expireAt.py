@@ -9,8 +9,14 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 import warnings
+from pipeline_profiler import profile_step
+from schema_validator import checkpoint_gate
+from derived_columns import add_derived_columns, classify_application_window, classify_urgency
+from fast_loader import read_csv_fast
+from aggregate_cube import build_cube, cube_crosstab
 warnings.filterwarnings('ignore')
 
+@profile_step
 def create_urgency_categories_and_optimize_expireAt(df):
     """ExpireAt sütununu urgency kategorilerine dönüştürür ve optimize eder"""
     
@@ -46,30 +52,14 @@ def create_urgency_categories_and_optimize_expireAt(df):
     print("🎯 2. BUSINESS INTELLIGENCE BASED URGENCY CATEGORIES")
     print("-" * 55)
     
-    def categorize_urgency(days):
-        """Business logic based urgency categorization"""
-        if pd.isna(days):
-            return 'UNKNOWN'
-        elif days < 0:
-            return 'EXPIRED'
-        elif days <= 3:
-            return 'CRITICAL_URGENT'      # Apply immediately
-        elif days <= 7:
-            return 'HIGH_URGENT'          # Apply within week
-        elif days <= 14:
-            return 'MODERATE_URGENT'      # Apply within 2 weeks
-        elif days <= 30:
-            return 'NORMAL'               # Standard application timing
-        elif days <= 60:
-            return 'EXTENDED'             # Quality-focused positions
-        else:
-            return 'LONG_TERM'            # Strategic/specialized roles
-    
-    # Create urgency categories
-    df['job_urgency_level'] = df['days_to_expire'].apply(categorize_urgency)
+    # Business logic based urgency categorization (derived_columns.URGENCY_RULES):
+    # EXPIRED < 0 ≤ CRITICAL_URGENT ≤ 3 < HIGH_URGENT ≤ 7 < MODERATE_URGENT ≤ 14
+    # < NORMAL ≤ 30 < EXTENDED ≤ 60 < LONG_TERM, NaN → UNKNOWN
+    df['job_urgency_level'] = classify_urgency(df)
     
     # Analyze urgency distribution
     urgency_dist = df['job_urgency_level'].value_counts()
+    urgency_dist = urgency_dist[urgency_dist > 0]
     print(f"📊 Urgency Level Distribution:")
     
     urgency_business_meanings = {
@@ -94,8 +84,9 @@ def create_urgency_categories_and_optimize_expireAt(df):
     print("-" * 50)
     
     if 'job_investment_type' in df.columns:
-        # Analyze urgency by investment type
-        investment_urgency = pd.crosstab(df['job_investment_type'], df['job_urgency_level'], normalize='index') * 100
+        # Analyze urgency by investment type (tek geçişte kurulan küpten)
+        cube = build_cube(df, ['investment', 'urgency'])
+        investment_urgency = cube_crosstab(cube, 'investment', 'urgency', normalize='index') * 100
         
         print(f"📊 Urgency Distribution by Investment Type:")
         for inv_type in investment_urgency.index:
@@ -123,22 +114,15 @@ def create_urgency_categories_and_optimize_expireAt(df):
     print("📅 4. TEMPORAL INTELLIGENCE FEATURES")
     print("-" * 40)
     
-    # Extract temporal features
-    df['expire_month'] = df['expire_datetime'].dt.month
-    df['expire_quarter'] = df['expire_datetime'].dt.quarter
-    df['expire_day_of_week'] = df['expire_datetime'].dt.day_name()
-    df['expire_season'] = df['expire_month'].map({
-        12: 'Winter', 1: 'Winter', 2: 'Winter',
-        3: 'Spring', 4: 'Spring', 5: 'Spring', 
-        6: 'Summer', 7: 'Summer', 8: 'Summer',
-        9: 'Fall', 10: 'Fall', 11: 'Fall'
-    })
+    # Extract temporal features (tek vektörel geçiş, lookup dizileri)
+    add_derived_columns(df, source='expire_datetime')
     
     print(f"📊 Temporal Features Created:")
     print(f"   📅 expire_month: Monthly posting patterns")
     print(f"   📈 expire_quarter: Quarterly hiring trends") 
     print(f"   📊 expire_day_of_week: Weekly posting patterns")
     print(f"   🌍 expire_season: Seasonal hiring analysis")
+    print(f"   🗓️ is_business_day / is_month_end / is_quarter_end: Calendar flags")
     print()
     
     # Analyze temporal patterns
@@ -161,10 +145,7 @@ def create_urgency_categories_and_optimize_expireAt(df):
     print("🔧 5. MEMORY OPTIMIZATION AND DATA TYPE CONVERSION")
     print("-" * 55)
     
-    # Convert urgency to categorical for memory efficiency
-    df['job_urgency_level'] = df['job_urgency_level'].astype('category')
-    df['expire_season'] = df['expire_season'].astype('category')
-    df['expire_day_of_week'] = df['expire_day_of_week'].astype('category')
+    # job_urgency_level, expire_season ve expire_day_of_week doğrudan categorical üretildi
     
     # Calculate memory savings
     expireAt_memory_before = df['expireAt'].memory_usage(deep=True) / 1024**2
@@ -188,13 +169,7 @@ def create_urgency_categories_and_optimize_expireAt(df):
     print("-" * 40)
     
     # Create application timing intelligence
-    df['optimal_application_window'] = df['days_to_expire'].apply(
-        lambda days: 'IMMEDIATE' if days <= 3 else 
-                    'PRIORITY' if days <= 7 else
-                    'STANDARD' if days <= 21 else
-                    'QUALITY_FOCUS' if days <= 60 else
-                    'STRATEGIC'
-    ).astype('category')
+    df['optimal_application_window'] = classify_application_window(df)
     
     # Create competition level indicator
     df['competition_level'] = df['job_urgency_level'].map({
@@ -246,8 +221,8 @@ def create_urgency_categories_and_optimize_expireAt(df):
     # New features created
     new_features = [
         'job_urgency_level', 'expire_month', 'expire_quarter', 
-        'expire_day_of_week', 'expire_season', 'optimal_application_window', 
-        'competition_level'
+        'expire_day_of_week', 'expire_season', 'is_business_day', 'is_month_end',
+        'is_quarter_end', 'optimal_application_window', 'competition_level'
     ]
     
     print(f"📊 Transformation Results:")
@@ -263,6 +238,9 @@ def create_urgency_categories_and_optimize_expireAt(df):
         'expire_quarter': 'Quarterly business cycle correlation', 
         'expire_day_of_week': 'Weekly posting behavior analysis',
         'expire_season': 'Seasonal hiring trend identification',
+        'is_business_day': 'Weekday vs weekend expiration',
+        'is_month_end': 'Month-end (day >= 25) expiration',
+        'is_quarter_end': 'Quarter-end month expiration',
         'optimal_application_window': 'Strategic application timing guidance',
         'competition_level': 'Expected application competition assessment'
     }
@@ -289,7 +267,7 @@ if __name__ == "__main__":
     try:
         # Load the dataset
         print("📂 Dataset yükleniyor...")
-        df = pd.read_csv('linkedin_jobs_dataset_optimized_step7.csv')
+        df = read_csv_fast('linkedin_jobs_dataset_optimized_step7.csv')
         print(f"✅ Dataset yüklendi: {len(df):,} satır, {len(df.columns)} sütun")
         print()
         
@@ -300,6 +278,7 @@ if __name__ == "__main__":
         output_filename = 'linkedin_jobs_dataset_optimized_step8.csv'
         print(f"💾 Saving transformed dataset: {output_filename}")
         df_transformed.to_csv(output_filename, index=False)
+        checkpoint_gate(output_filename, df_transformed)
         
         # File size comparison
         import os
@@ -10,6 +10,7 @@ import numpy as np
 import json
 from pathlib import Path
 import warnings
+from mmap_dataset import load_dataset
 warnings.filterwarnings('ignore')
 
 def analyze_linkedin_dataset():
@@ -21,7 +22,7 @@ def analyze_linkedin_dataset():
     try:
         # Dataset'i yükle
         print("📂 Dataset yükleniyor...")
-        df = pd.read_csv('linkedin_jobs_dataset_insights_completed.csv')
+        df = load_dataset('linkedin_jobs_dataset_insights_completed.csv')
         
         print(f"✅ Dataset başarıyla yüklendi!")
         print()
@@ -111,7 +112,7 @@ def analyze_linkedin_dataset():
         # Text Kolonları - Uzunluk Analizi
         print("📝 TEXT KOLONLARI ANALİZİ")
         print("-" * 25)
-        text_cols = df.select_dtypes(include=['object']).columns
+        text_cols = df.select_dtypes(include=['object', 'string']).columns
         print(f"📄 Text kolon sayısı: {len(text_cols)}")
         
         # Önemli text kolonlarının uzunluk analizi
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+LinkedIn Jobs Dataset - Datetime Column Comparison Engine
+Datetime sütunlarını int64 epoch (saniye) dizileri olarak hizalar ve tüm
+sütun çiftlerini tek bir NumPy işlemiyle karşılaştırır.
+
+Her çift için (ikisi de dolu satırlarda):
+- exact_match_rate: aynı an (fark = 0)
+- tolerance_match_rate: |fark| <= tolerans (ör. 1 saat)
+- median_offset / offset_match_rate: sabit offset tespiti
+  (ör. expireAt = listedAt + 30 gün → farkların çoğu medyan offset'te)
+- null_pattern_agreement: iki sütunun aynı satırlarda boş / dolu olma oranı
+
+Duplicate kararı yalnızca ortak dolu satırlardaki eşleşmeye dayanır; null
+pattern uyumu ayrı raporlanır (seyrek bir kopya da duplicate'tir). Ortak
+satırlar yine de yeterli olmalıdır: mutlak sayı (MIN_JOINT_ROWS) ve az dolu
+sütunun dolu satırlarına oranı (MIN_JOINT_SHARE).
+"""
+
+import warnings
+import numpy as np
+import pandas as pd
+from datetime_detection import detect_datetime_columns, detect_datetime_format, parse_datetime_column
+from null_bitmap_index import null_agreement, null_index_from_mask
+
+DEFAULT_TOLERANCE_SECONDS = 3600
+DUPLICATE_THRESHOLD = 95.0
+CONSTANT_OFFSET_THRESHOLD = 95.0
+MIN_JOINT_ROWS = 30
+MIN_JOINT_SHARE = 50.0
+
+OFFSET_UNITS = [('d', 86400), ('h', 3600), ('m', 60), ('s', 1)]
+
+
+def to_epoch_seconds(series):
+    """Sütunu epoch saniye (int64) ve geçerlilik maskesine çevirir"""
+    detection = detect_datetime_format(series)
+    parsed = pd.to_datetime(parse_datetime_column(series, detection), errors='coerce')
+    if getattr(parsed.dt, 'tz', None) is not None:
+        parsed = parsed.dt.tz_convert(None)
+    valid = parsed.notna().to_numpy()
+    seconds = np.zeros(len(parsed), dtype='int64')
+    seconds[valid] = parsed[valid].to_numpy(dtype='datetime64[s]').astype('int64')
+    return seconds, valid
+
+
+def datetime_matrix(df, columns):
+    """(sütun × satır) epoch saniye matrisi ve geçerlilik maskesi"""
+    values = np.empty((len(columns), len(df)), dtype='int64')
+    valid = np.empty((len(columns), len(df)), dtype=bool)
+    for i, col in enumerate(columns):
+        values[i], valid[i] = to_epoch_seconds(df[col])
+    return values, valid
+
+
+def format_offset(seconds):
+    """Saniye cinsinden offset'i okunabilir hale getirir (ör. +30d, -2h)"""
+    if seconds is None:
+        return 'N/A'
+    sign = '-' if seconds < 0 else '+'
+    seconds = abs(seconds)
+    for suffix, size in OFFSET_UNITS:
+        if seconds >= size:
+            return f"{sign}{round(seconds / size, 1):g}{suffix}"
+    return f"{sign}0s"
+
+
+def compare_datetime_columns(df, columns, tolerance_seconds=DEFAULT_TOLERANCE_SECONDS):
+    """Tüm datetime sütun çiftlerini tek seferde karşılaştırır
+
+    Returns:
+        dict: (sütun_a, sütun_b) → metrikler; offset = sütun_b - sütun_a (saniye)
+    """
+    columns = list(columns)
+    if len(columns) < 2 or len(df) == 0:
+        return {}
+
+    values, valid = datetime_matrix(df, columns)
+    left, right = np.triu_indices(len(columns), k=1)
+
+    # (çift × satır) fark matrisi
+    both_valid = valid[left] & valid[right]
+    diffs = values[right] - values[left]
+    joint_counts = both_valid.sum(axis=1)
+    non_null_counts = valid.sum(axis=1)
+    min_non_null = np.minimum(non_null_counts[left], non_null_counts[right])
+
+    abs_diffs = np.abs(diffs)
+    exact = ((diffs == 0) & both_valid).sum(axis=1)
+    within_tolerance = ((abs_diffs <= tolerance_seconds) & both_valid).sum(axis=1)
+
+    masked = np.where(both_valid, diffs, np.nan)
+    with warnings.catch_warnings():
+        # Ortak dolu satırı olmayan çiftlerde medyan NaN (All-NaN slice uyarısı)
+        warnings.simplefilter('ignore', RuntimeWarning)
+        median_offsets = np.nanmedian(masked, axis=1)
+    near_median = (np.abs(diffs - np.nan_to_num(median_offsets)[:, None]) <= tolerance_seconds) & both_valid
+    offset_matches = near_median.sum(axis=1)
+
+    # Null pattern uyumu: paketlenmiş geçersizlik bitmap'leri üzerinde popcount
+    agreements = null_agreement(null_index_from_mask(columns, ~valid))[left, right]
+
+    denominator = np.maximum(joint_counts, 1)
+    exact_rates = exact / denominator * 100
+    tolerance_rates = within_tolerance / denominator * 100
+    offset_rates = offset_matches / denominator * 100
+    joint_shares = joint_counts / np.maximum(min_non_null, 1) * 100
+
+    results = {}
+    for k, (i, j) in enumerate(zip(left, right)):
+        median_offset = float(median_offsets[k]) if joint_counts[k] > 0 else None
+        constant_offset = (
+            median_offset is not None
+            and abs(median_offset) > tolerance_seconds
+            and offset_rates[k] >= CONSTANT_OFFSET_THRESHOLD
+        )
+        results[(columns[i], columns[j])] = {
+            'joint_count': int(joint_counts[k]),
+            'min_non_null_count': int(min_non_null[k]),
+            # Ortak dolu satırların az dolu sütunun dolu satırlarına oranı
+            'joint_share': float(joint_shares[k]),
+            'exact_match_rate': float(exact_rates[k]),
+            'tolerance_match_rate': float(tolerance_rates[k]),
+            'median_offset': median_offset,
+            'offset_match_rate': float(offset_rates[k]),
+            'constant_offset': bool(constant_offset),
+            'null_pattern_agreement': float(agreements[k]),
+            # Benzerlik: ortak dolu satırlarda tolerans içi eşleşme (null pattern ayrı metrik)
+            'similarity': float(tolerance_rates[k])
+        }
+    return results
+
+
+def pair_metrics(comparison, col_a, col_b):
+    """Çift metrikleri; ters sırada kayıtlıysa offset işareti çevrilir"""
+    if (col_a, col_b) in comparison:
+        return comparison[(col_a, col_b)]
+    metrics = dict(comparison[(col_b, col_a)])
+    if metrics['median_offset'] is not None:
+        metrics['median_offset'] = -metrics['median_offset']
+    return metrics
+
+
+def is_duplicate_pair(metrics, threshold=DUPLICATE_THRESHOLD, min_joint_rows=MIN_JOINT_ROWS,
+                      min_joint_share=MIN_JOINT_SHARE):
+    """Yeterli ortak dolu satırı olan ve bu satırlarda tolerans içinde eşleşen çift
+
+    Birkaç tesadüfi ortak satır kanıt sayılmaz: ortak satır sayısı en az
+    min_joint_rows (az dolu sütun daha kısaysa onun dolu satır sayısı) ve
+    az dolu sütunun dolu satırlarının en az %min_joint_share'i olmalı.
+    """
+    joint_count = metrics['joint_count']
+    return (
+        joint_count > 0
+        and joint_count >= min(min_joint_rows, metrics['min_non_null_count'])
+        and metrics['joint_share'] >= min_joint_share
+        and metrics['tolerance_match_rate'] >= threshold
+    )
+
+
+def find_redundant_datetime_columns(comparison, threshold=DUPLICATE_THRESHOLD):
+    """Duplicate (aynı an) ve sabit offset ile türetilmiş sütun çiftleri"""
+    duplicates = []
+    derived = []
+    for (col_a, col_b), metrics in comparison.items():
+        if is_duplicate_pair(metrics, threshold):
+            duplicates.append({
+                'columns': (col_a, col_b),
+                'match_rate': metrics['tolerance_match_rate'],
+                'exact_match_rate': metrics['exact_match_rate'],
+                'null_pattern_agreement': metrics['null_pattern_agreement']
+            })
+        elif metrics['constant_offset']:
+            derived.append({
+                'columns': (col_a, col_b),
+                'offset': format_offset(metrics['median_offset']),
+                'match_rate': metrics['offset_match_rate']
+            })
+    return {'duplicates': duplicates, 'constant_offsets': derived}
+
+
+def main():
+    """Dataset'teki tüm datetime sütun çiftlerini karşılaştırır"""
+
+    print("🔍 LinkedIn Jobs Dataset - Datetime Column Comparison")
+    print("=" * 60)
+
+    try:
+        df = pd.read_csv('linkedin_jobs_dataset_with_job_investment_category.csv')
+        print(f"✅ Dataset yüklendi: {len(df):,} satır, {len(df.columns)} sütun")
+    except Exception as e:
+        print(f"❌ HATA: Dataset yüklenemedi - {e}")
+        return
+
+    columns = list(detect_datetime_columns(df))
+    print(f"📅 Datetime sütunları: {columns}")
+    print()
+
+    comparison = compare_datetime_columns(df, columns)
+    for (col_a, col_b), metrics in comparison.items():
+        print(f"⏰ {col_a} ↔ {col_b}:")
+        print(f"   Ortak dolu satır: {metrics['joint_count']:,} "
+              f"(az dolu sütunun %{metrics['joint_share']:.1f}'i)")
+        print(f"   Exact match: %{metrics['exact_match_rate']:.1f} | "
+              f"Tolerans içi: %{metrics['tolerance_match_rate']:.1f}")
+        print(f"   Medyan offset: {format_offset(metrics['median_offset'])} "
+              f"(%{metrics['offset_match_rate']:.1f} satırda)")
+        print(f"   Null pattern uyumu: %{metrics['null_pattern_agreement']:.1f}")
+
+    redundant = find_redundant_datetime_columns(comparison)
+    print()
+    print(f"🔗 Duplicate çiftler: {len(redundant['duplicates'])}")
+    for item in redundant['duplicates']:
+        print(f"   • {' = '.join(item['columns'])} (%{item['match_rate']:.1f}, "
+              f"null pattern uyumu %{item['null_pattern_agreement']:.1f})")
+    print(f"📐 Sabit offset çiftleri: {len(redundant['constant_offsets'])}")
+    for item in redundant['constant_offsets']:
+        col_a, col_b = item['columns']
+        print(f"   • {col_b} = {col_a} {item['offset']} (%{item['match_rate']:.1f})")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+LinkedIn Jobs Dataset - Full-Column Datetime Format Detection
+Sütunların datetime formatını sample yerine tüm sütun üzerinde, vektörel
+olarak tespit eder.
+
+- Sayısal sütunlar: epoch s / ms / us / ns birimi değer büyüklüğünden
+  (makul tarih aralığı 2000-2040) np.select ile sınıflandırılır.
+- String sütunlar: ISO 8601 ve yaygın açık formatlar sırayla
+  pd.to_datetime(format=..., errors='coerce') ile yalnızca benzersiz
+  değerlerde denenir; her format bir öncekinin parse edemediği değerlere
+  uygulanır (karışık formatlı sütunlarda format bazında satır sayıları).
+- Tespit edilen format sütun fingerprint'i ile cache'lenir; aynı sütun
+  tekrar parse edilirken format aranmaz. Cache LRU olarak sınırlıdır.
+- is_datetime_candidate: format aramadan önce benzersiz değerlerin uzunluk
+  ve rakam oranı profiliyle serbest metin sütunlarını ucuzca eler.
+"""
+
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+MIN_DATETIME = pd.Timestamp('2000-01-01')
+MAX_DATETIME = pd.Timestamp('2040-01-01')
+
+# birim → saniye çarpanı (epoch değeri = saniye × çarpan)
+EPOCH_UNITS = {
+    's': ('Unix timestamp (seconds)', 1),
+    'ms': ('Unix timestamp (milliseconds)', 1_000),
+    'us': ('Unix timestamp (microseconds)', 1_000_000),
+    'ns': ('Unix timestamp (nanoseconds)', 1_000_000_000),
+}
+
+# Sıra önemli: daha spesifik formatlar önce denenir
+STRING_FORMATS = [
+    ('ISO 8601 UTC', '%Y-%m-%dT%H:%M:%SZ'),
+    ('ISO 8601 UTC', '%Y-%m-%dT%H:%M:%S.%fZ'),
+    ('ISO 8601 offset', '%Y-%m-%dT%H:%M:%S%z'),
+    ('ISO 8601 offset', '%Y-%m-%dT%H:%M:%S.%f%z'),
+    ('ISO 8601', '%Y-%m-%dT%H:%M:%S'),
+    ('ISO 8601', '%Y-%m-%dT%H:%M:%S.%f'),
+    ('Standard datetime', '%Y-%m-%d %H:%M:%S'),
+    ('Standard datetime', '%Y-%m-%d %H:%M:%S.%f'),
+    ('Standard datetime', '%Y-%m-%d %H:%M'),
+    ('Date', '%Y-%m-%d'),
+    ('Turkish datetime', '%d.%m.%Y %H:%M:%S'),
+    ('Turkish datetime', '%d.%m.%Y %H:%M'),
+    ('Turkish date', '%d.%m.%Y'),
+    ('Slash date (day first)', '%d/%m/%Y'),
+    ('Slash date (month first)', '%m/%d/%Y'),
+]
+
+# Ön eleme: STRING_FORMATS değerleri 6-40 karakter, çoğunluğu rakam
+CANDIDATE_SAMPLE_ROWS = 10_000
+DATETIME_LENGTH_RANGE = (6, 40)
+MIN_DIGIT_SHARE = 0.4
+MIN_CANDIDATE_SHARE = 0.5
+
+# (sütun adı, fingerprint) → tespit sonucu; en son kullanılan FORMAT_CACHE_SIZE kayıt tutulur
+FORMAT_CACHE_SIZE = 256
+_FORMAT_CACHE = OrderedDict()
+
+
+def _fingerprint(series):
+    hashes = pd.util.hash_pandas_object(series, index=False).to_numpy()
+    return len(series), str(series.dtype), int(hashes.sum(dtype=np.uint64))
+
+
+def _epoch_bounds(multiplier):
+    return MIN_DATETIME.timestamp() * multiplier, MAX_DATETIME.timestamp() * multiplier
+
+
+def _detect_epoch(values):
+    """Sayısal değerlerin epoch birimini büyüklüğe göre belirler"""
+    numbers = values.to_numpy(dtype='float64')
+    conditions = []
+    for _, multiplier in EPOCH_UNITS.values():
+        low, high = _epoch_bounds(multiplier)
+        conditions.append((numbers >= low) & (numbers < high))
+    unit_codes = np.select(conditions, range(len(EPOCH_UNITS)), default=-1)
+
+    counts = np.bincount(unit_codes[unit_codes >= 0], minlength=len(EPOCH_UNITS))
+    units = list(EPOCH_UNITS)
+    format_counts = {EPOCH_UNITS[unit][0]: int(count) for unit, count in zip(units, counts) if count > 0}
+    if counts.sum() == 0:
+        return None, format_counts, 0
+
+    best = units[int(counts.argmax())]
+    return best, format_counts, int(counts.max())
+
+
+def _to_datetime(values, fmt):
+    """Tek format ile parse; UTC offset'li formatlar UTC naive'e çevrilir"""
+    if '%z' in fmt:
+        return pd.to_datetime(values, format=fmt, errors='coerce', utc=True).dt.tz_convert(None)
+    return pd.to_datetime(values, format=fmt, errors='coerce')
+
+
+def _detect_string_formats(values):
+    """Formatları benzersiz değerlerde kaskad halinde dener
+
+    Returns:
+        (format_counts, chosen): format adı → satır sayısı ve
+        [(strptime formatı, satır sayısı), ...] (çoktan aza)
+    """
+    codes, uniques = pd.factorize(values.astype(str).str.strip())
+    unique_rows = np.bincount(codes, minlength=len(uniques))
+    remaining = pd.Series(uniques)
+    remaining_rows = unique_rows
+
+    format_counts = {}
+    chosen = []
+    for name, fmt in STRING_FORMATS:
+        if len(remaining) == 0:
+            break
+        parsed = _to_datetime(remaining, fmt)
+        matched = parsed.notna().to_numpy()
+        if not matched.any():
+            continue
+        rows = int(remaining_rows[matched].sum())
+        format_counts[name] = format_counts.get(name, 0) + rows
+        chosen.append((fmt, rows))
+        remaining = remaining[~matched]
+        remaining_rows = remaining_rows[~matched]
+
+    chosen.sort(key=lambda item: item[1], reverse=True)
+    return format_counts, chosen
+
+
+def is_datetime_candidate(series):
+    """Format aramaya değer mi? (ilk CANDIDATE_SAMPLE_ROWS satırın benzersiz değerleri)
+
+    Sayısal ve datetime sütunlar her zaman aday; metin sütunlarında benzersiz
+    değerlerin çoğu tarih uzunluğunda ve ağırlıklı rakamdan oluşmalı.
+    """
+    values = series.dropna()
+    if len(values) == 0 or pd.api.types.is_bool_dtype(values):
+        return False
+    if pd.api.types.is_datetime64_any_dtype(values) or pd.api.types.is_numeric_dtype(values):
+        return True
+
+    sample = pd.Series(pd.unique(values.head(CANDIDATE_SAMPLE_ROWS).astype(str).str.strip()))
+    lengths = sample.str.len()
+    digits = sample.str.count(r'\d')
+    plausible = lengths.between(*DATETIME_LENGTH_RANGE) & (digits >= lengths * MIN_DIGIT_SHARE)
+    return plausible.mean() >= MIN_CANDIDATE_SHARE
+
+
+def detect_datetime_format(series, use_cache=True):
+    """Sütunun datetime formatını tüm dolu değerler üzerinde tespit eder
+
+    Returns:
+        dict: kind ('datetime' / 'epoch' / 'string' / None), detected_format,
+        unit (epoch), formats (string strptime formatları), format_counts,
+        non_null, parsed_count, parse_success_rate (%)
+    """
+    key = None
+    if use_cache:
+        key = (series.name, _fingerprint(series))
+        if key in _FORMAT_CACHE:
+            _FORMAT_CACHE.move_to_end(key)
+            return _FORMAT_CACHE[key]
+
+    values = series.dropna()
+    detection = {
+        'kind': None,
+        'detected_format': 'Unknown',
+        'unit': None,
+        'formats': [],
+        'format_counts': {},
+        'non_null': len(values),
+        'parsed_count': 0,
+        'parse_success_rate': 0.0
+    }
+
+    if len(values) == 0 or pd.api.types.is_bool_dtype(values):
+        pass
+    elif pd.api.types.is_datetime64_any_dtype(values):
+        detection.update(kind='datetime', detected_format='datetime64', parsed_count=len(values))
+    else:
+        numeric = values if pd.api.types.is_numeric_dtype(values) else pd.to_numeric(values, errors='coerce')
+        # ArrowDtype string'lerde coerce edilemeyen değerler NA değil NaN olur
+        if not np.isnan(numeric.to_numpy(dtype='float64', na_value=np.nan)).any():
+            unit, format_counts, parsed_count = _detect_epoch(numeric)
+            if unit is not None:
+                detection.update(kind='epoch', detected_format=EPOCH_UNITS[unit][0], unit=unit,
+                                 format_counts=format_counts, parsed_count=parsed_count)
+        elif values.dtype == object or pd.api.types.is_string_dtype(values):
+            format_counts, chosen = _detect_string_formats(values)
+            if chosen:
+                best_name = max(format_counts, key=format_counts.get)
+                detection.update(kind='string', detected_format=best_name,
+                                 formats=[fmt for fmt, _ in chosen], format_counts=format_counts,
+                                 parsed_count=sum(rows for _, rows in chosen))
+
+    if detection['non_null'] > 0:
+        detection['parse_success_rate'] = detection['parsed_count'] / detection['non_null'] * 100
+
+    if key is not None:
+        _FORMAT_CACHE[key] = detection
+        while len(_FORMAT_CACHE) > FORMAT_CACHE_SIZE:
+            _FORMAT_CACHE.popitem(last=False)
+    return detection
+
+
+def parse_datetime_column(series, detection=None):
+    """Tespit edilen format(lar) ile tüm sütunu datetime'a çevirir (başarısız → NaT)"""
+    detection = detection or detect_datetime_format(series)
+    kind = detection['kind']
+
+    if kind == 'datetime':
+        return series
+    if kind == 'epoch':
+        numbers = pd.to_numeric(series, errors='coerce')
+        low, high = _epoch_bounds(EPOCH_UNITS[detection['unit']][1])
+        numbers = numbers.where((numbers >= low) & (numbers < high))
+        return pd.to_datetime(numbers, unit=detection['unit'])
+    if kind == 'string':
+        text = series.astype('string').str.strip()
+        parsed = pd.Series(pd.NaT, index=series.index, dtype='datetime64[ns]')
+        for fmt in detection['formats']:
+            missing = parsed.isna() & text.notna()
+            if not missing.any():
+                break
+            parsed[missing] = _to_datetime(text[missing], fmt)
+        return parsed
+    return pd.Series(pd.NaT, index=series.index, dtype='datetime64[ns]')
+
+
+def detect_datetime_columns(df, columns=None, min_success_rate=90.0):
+    """Datetime olarak parse edilebilen sütunlar {column: detection}"""
+    columns = df.columns if columns is None else columns
+    detected = {}
+    for col in columns:
+        detection = detect_datetime_format(df[col])
+        if detection['kind'] is not None and detection['parse_success_rate'] >= min_success_rate:
+            detected[col] = detection
+    return detected
+
+
+def clear_format_cache():
+    _FORMAT_CACHE.clear()
+
+
+def main():
+    """Tüm sütunlar için datetime format taraması"""
+
+    print("📅 LinkedIn Jobs Dataset - Datetime Format Detection")
+    print("=" * 60)
+
+    try:
+        df = pd.read_csv('linkedin_jobs_dataset_with_job_investment_category.csv')
+        print(f"✅ Dataset yüklendi: {len(df):,} satır, {len(df.columns)} sütun")
+        print()
+    except Exception as e:
+        print(f"❌ HATA: Dataset yüklenemedi - {e}")
+        return
+
+    detected = detect_datetime_columns(df)
+    print(f"📊 Datetime sütunları: {len(detected)}")
+    for col, detection in detected.items():
+        print(f"\n⏰ {col}:")
+        print(f"   🎯 Format: {detection['detected_format']} | Parse başarı: %{detection['parse_success_rate']:.1f}")
+        for name, rows in detection['format_counts'].items():
+            print(f"   • {name}: {rows:,} satır")
+
+if __name__ == "__main__":
+    main()
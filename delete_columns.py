@@ -5,12 +5,15 @@ LinkedIn Jobs Dataset - Column Deletion Script
 merged_companyDescription ve company/followingState/followingType sütunlarını siler
 """
 
-import pandas as pd
 import numpy as np
 from pathlib import Path
 import warnings
+from pipeline_profiler import profile_step
+from schema_validator import checkpoint_gate
+from fast_loader import read_csv_fast
 warnings.filterwarnings('ignore')
 
+@profile_step
 def delete_problematic_columns():
     """Problematik sütunları siler ve sonuçları raporlar"""
     
@@ -20,7 +23,7 @@ def delete_problematic_columns():
     try:
         # Dataset'i yükle
         print("📂 Dataset yükleniyor...")
-        df = pd.read_csv('linkedin_jobs_dataset_insights_completed.csv')
+        df = read_csv_fast('linkedin_jobs_dataset_insights_completed.csv')
         
         # İlk durum
         initial_rows = len(df)
@@ -128,6 +131,7 @@ def delete_problematic_columns():
             
             output_filename = 'linkedin_jobs_dataset_cleaned_columns.csv'
             df_cleaned.to_csv(output_filename, index=False)
+            checkpoint_gate(output_filename, df_cleaned)
             
             # Dosya boyutu kontrolü
             file_size = Path(output_filename).stat().st_size / 1024**2
@@ -6,13 +6,16 @@ LinkedIn Jobs Dataset - Delete company/name duplicate and analyze companyName fo
 2. Detailed format analysis of companyName standardization needs
 """
 
-import pandas as pd
 import numpy as np
 from collections import Counter
 import re
 import warnings
+from pipeline_profiler import profile_step
+from schema_validator import checkpoint_gate
+from fast_loader import read_csv_fast
 warnings.filterwarnings('ignore')
 
+@profile_step
 def delete_company_name_duplicate_and_analyze_format(df):
     """company/name sütununu sil ve companyName format issues'larını analiz et"""
     
@@ -300,7 +303,7 @@ def main():
     
     # Load dataset
     try:
-        df = pd.read_csv('linkedin_jobs_dataset_optimized_step5.csv')
+        df = read_csv_fast('linkedin_jobs_dataset_optimized_step5.csv')
         print(f"✅ Dataset loaded: {len(df):,} rows, {len(df.columns)} columns")
         print()
     except Exception as e:
@@ -315,6 +318,7 @@ def main():
         try:
             output_file = 'linkedin_jobs_dataset_optimized_step6.csv'
             df_cleaned.to_csv(output_file, index=False)
+            checkpoint_gate(output_file, df_cleaned)
             print(f"✅ Cleaned dataset saved: {output_file}")
             print(f"📊 Final shape: {df_cleaned.shape}")
         except Exception as e:
@@ -6,11 +6,13 @@ Bu script perfect redundancy tespit edilen link sütununu siler.
 URL'ler tamamen 'id' sütunundan türetilebilir olduğu için eliminasyon güvenlidir.
 """
 
-import pandas as pd
 import numpy as np
-import re
-from urllib.parse import urlparse
+from pipeline_profiler import profile_step
+from schema_validator import checkpoint_gate
+from job_id_index import verify_url_id_redundancy, LINKEDIN_JOB_URL_TEMPLATE
+from fast_loader import read_csv_fast
 
+@profile_step
 def delete_link_column():
     """link sütununu perfect redundancy nedeniyle sil"""
     
@@ -19,7 +21,7 @@ def delete_link_column():
     
     # Dataset yükle
     try:
-        df = pd.read_csv('linkedin_jobs_dataset_optimized_step11.csv')
+        df = read_csv_fast('linkedin_jobs_dataset_optimized_step11.csv')
         print(f"✅ Dataset yüklendi: {len(df):,} kayıt, {len(df.columns)} sütun")
     except Exception as e:
         print(f"❌ Dataset yükleme hatası: {e}")
@@ -72,28 +74,15 @@ def delete_link_column():
     # URL-ID mapping validation
     print(f"\n🔗 URL-ID MAPPING VALİDASYONU:")
     
-    sample_size = min(1000, len(df))
-    sample_df = df.head(sample_size)
+    # Tam sütun vektörel doğrulama (job id index'i üzerinden)
+    proof = verify_url_id_redundancy(df, url_column=target_column, id_column=replacement_column)
+    mapping_success = proof['matched']
+    total_checked = proof['checked']
+    mapping_rate = proof['mapping_rate']
     
-    mapping_success = 0
-    total_checked = 0
-    
-    for idx, row in sample_df.iterrows():
-        link_val = str(row[target_column])
-        id_val = str(row[replacement_column])
-        
-        # LinkedIn URL'den ID çıkar
-        match = re.search(r'/jobs/view/(\d+)', link_val)
-        if match:
-            extracted_id = match.group(1)
-            if extracted_id == id_val:
-                mapping_success += 1
-            total_checked += 1
-    
-    mapping_rate = (mapping_success / total_checked * 100) if total_checked > 0 else 0
-    
-    print(f"   • İncelenen örnek: {total_checked:,}")
+    print(f"   • İncelenen satır: {total_checked:,} (tam sütun)")
     print(f"   • Başarılı mapping: {mapping_success:,}")
+    print(f"   • Parse edilemeyen URL: {proof['unparsed']:,}")
     print(f"   • Mapping başarı oranı: %{mapping_rate:.2f}")
     
     if mapping_rate < 95:
@@ -104,24 +93,20 @@ def delete_link_column():
     
     # Derivation rule test
     print(f"\n🧪 TÜRETİM KURALI TESTİ:")
-    derivation_rule = "https://www.linkedin.com/jobs/view/{id}"
-    
-    test_samples = sample_df.head(5)
-    derivation_success = 0
+    derivation_rule = LINKEDIN_JOB_URL_TEMPLATE
     
-    for idx, row in test_samples.iterrows():
+    for idx, row in df.head(5).iterrows():
         original_url = str(row[target_column])
         job_id = str(row[replacement_column])
         derived_url = derivation_rule.format(id=job_id)
         
         if original_url == derived_url:
-            derivation_success += 1
             print(f"   ✅ ID {job_id}: Perfect match")
         else:
             print(f"   ⚠️  ID {job_id}: '{original_url}' vs '{derived_url}'")
     
-    derivation_rate = (derivation_success / len(test_samples)) * 100
-    print(f"\n   📊 Türetim başarı oranı: %{derivation_rate:.1f}")
+    derivation_rate = proof['derivation_rate']
+    print(f"\n   📊 Türetim başarı oranı (tam sütun): %{derivation_rate:.1f} ({proof['derivable']:,}/{proof['url_count']:,})")
     
     if derivation_rate < 80:
         print("   ⚠️  Türetim kuralı tam uyumlu değil, ama eliminasyon devam edebilir")
@@ -161,6 +146,7 @@ def delete_link_column():
     # Yeni dosya kaydet
     output_file = 'linkedin_jobs_dataset_optimized_step12.csv'
     df_cleaned.to_csv(output_file, index=False)
+    checkpoint_gate(output_file, df_cleaned)
     
     print(f"\n💾 DOSYA KAYDI:")
     print(f"   ✅ Yeni dataset: {output_file}")
@@ -5,12 +5,15 @@ LinkedIn Jobs Dataset - preDashFollowingInfoUrn Column Deletion
 company/followingState/preDashFollowingInfoUrn sütununu siler ve sonuçları raporlar
 """
 
-import pandas as pd
 import numpy as np
 from pathlib import Path
 import warnings
+from pipeline_profiler import profile_step
+from schema_validator import checkpoint_gate
+from fast_loader import read_csv_fast
 warnings.filterwarnings('ignore')
 
+@profile_step
 def delete_predash_following_info_urn():
     """preDashFollowingInfoUrn sütununu siler ve sonuçları raporlar"""
     
@@ -20,7 +23,7 @@ def delete_predash_following_info_urn():
     try:
         # Dataset'i yükle
         print("📂 Cleaned dataset yükleniyor...")
-        df = pd.read_csv('linkedin_jobs_dataset_cleaned_columns.csv')
+        df = read_csv_fast('linkedin_jobs_dataset_cleaned_columns.csv')
         
         # İlk durum
         initial_rows = len(df)
@@ -120,6 +123,7 @@ def delete_predash_following_info_urn():
             
             output_filename = 'linkedin_jobs_dataset_optimized_step2.csv'
             df_cleaned.to_csv(output_filename, index=False)
+            checkpoint_gate(output_filename, df_cleaned)
             
             # Dosya boyutu kontrolü
             file_size = Path(output_filename).stat().st_size / 1024**2
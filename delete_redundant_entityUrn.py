@@ -1,131 +1,155 @@
-import pandas as pd
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+LinkedIn Jobs Dataset - Redundant entityUrn Deletion
+jobApplicantInsights/entityUrn sütununu id ile redundancy doğrulandıktan
+sonra siler (step 10).
+"""
+
 import warnings
+from schema_validator import checkpoint_gate
+from fast_loader import read_csv_fast
 warnings.filterwarnings('ignore')
 
-print("🗑️ REDUNDANT ENTITY URN DELETION")
-print("="*40)
-
-# Load the dataset
-df = pd.read_csv('linkedin_jobs_dataset_optimized_step9.csv')
+def delete_redundant_entity_urn(df):
+    """jobApplicantInsights/entityUrn sütununu doğrulayıp siler"""
+
+    print("1. PRE-DELETION VALIDATION")
+    print("-"*30)
+
+    target_column = 'jobApplicantInsights/entityUrn'
+
+    print(f"📊 Mevcut durum:")
+    print(f"   Toplam sütun: {len(df.columns)}")
+    print(f"   Toplam kayıt: {len(df):,}")
+    print(f"   Target sütun: {target_column}")
+    print(f"   Target unique: {df[target_column].nunique():,}")
+    print(f"   Target duplicates: {df[target_column].duplicated().sum():,}")
+
+    # Backup critical info
+    print(f"\n2. BACKUP & SAFETY CHECK")
+    print("-"*30)
+
+    # Ensure id column is sufficient replacement
+    id_unique = df['id'].nunique()
+    id_duplicates = df['id'].duplicated().sum()
+
+    print(f"✅ Replacement column validation:")
+    print(f"   'id' unique count: {id_unique:,}")
+    print(f"   'id' duplicates: {id_duplicates}")
+    print(f"   'id' null count: {df['id'].isna().sum()}")
+
+    if id_unique == df[target_column].nunique() and id_duplicates == 0:
+        print(f"   ✅ 'id' sütunu mükemmel replacement!")
+    else:
+        print(f"   ⚠️  Dikkat: Replacement validation başarısız!")
+
+    print(f"\n3. DELETION OPERATION")
+    print("-"*30)
+
+    # Memory usage before deletion
+    memory_before = df.memory_usage(deep=True).sum() / 1024 / 1024  # MB
+    target_memory = df[target_column].memory_usage(deep=True) / 1024 / 1024  # MB
+
+    print(f"💾 Memory usage before deletion:")
+    print(f"   Total memory: {memory_before:.2f} MB")
+    print(f"   Target column: {target_memory:.2f} MB")
+
+    # Delete the redundant column
+    print(f"\n🗑️ Deleting '{target_column}'...")
+    df_cleaned = df.drop(columns=[target_column])
+
+    print(f"✅ Deletion completed!")
+
+    print(f"\n4. POST-DELETION VALIDATION")
+    print("-"*30)
+
+    # Memory usage after deletion
+    memory_after = df_cleaned.memory_usage(deep=True).sum() / 1024 / 1024  # MB
+    memory_saved = memory_before - memory_after
+
+    print(f"📊 Post-deletion metrics:")
+    print(f"   Yeni sütun sayısı: {len(df_cleaned.columns)} (önceki: {len(df.columns)})")
+    print(f"   Kayıt sayısı: {len(df_cleaned):,} (değişmedi)")
+    print(f"   Memory kullanımı: {memory_after:.2f} MB")
+    print(f"   Memory tasarrufu: {memory_saved:.2f} MB")
+
+    # Verify target column is gone
+    if target_column not in df_cleaned.columns:
+        print(f"   ✅ '{target_column}' başarıyla silindi")
+    else:
+        print(f"   ❌ Silme işlemi başarısız!")
+
+    # Verify id column still exists and functional
+    if 'id' in df_cleaned.columns:
+        print(f"   ✅ 'id' sütunu korundu")
+        print(f"   ✅ 'id' unique count: {df_cleaned['id'].nunique():,}")
+    else:
+        print(f"   ❌ 'id' sütunu kayıp!")
+
+    print(f"\n5. QUALITY ASSURANCE")
+    print("-"*30)
+
+    # Check if any analytics depend on deleted column
+    problematic_columns = []
+    for col in df_cleaned.columns:
+        if 'applicant' in col.lower() and 'insights' in col.lower():
+            problematic_columns.append(col)
+
+    if problematic_columns:
+        print(f"⚠️  İlgili sütunlar hala mevcut: {problematic_columns}")
+        print(f"   Bu sütunlar da silinebilir olabilir.")
+    else:
+        print(f"✅ İlgili başka problemli sütun yok")
+
+    print(f"\n6. IMPACT SUMMARY")
+    print("-"*30)
+
+    print(f"🎯 İYİLEŞTİRME METRIKLERI:")
+    print(f"   ✅ Sütun azalması: {len(df.columns)} → {len(df_cleaned.columns)} (-1)")
+    print(f"   ✅ Memory tasarrufu: {memory_saved:.2f} MB")
+    print(f"   ✅ Redundancy eliminasyonu: %65.8 duplicate temizlendi")
+    print(f"   ✅ Data quality artışı: Duplicate contamination giderildi")
+    print(f"   ✅ Query performance: Gereksiz column scan'ı eliminasyonu")
+
+    print(f"\n7. RECOMMENDATIONS")
+    print("-"*30)
+
+    print(f"📋 Sonraki adımlar:")
+    print(f"   1. ✅ Analytics'leri test et - 'id' kullanarak")
+    print(f"   2. ⚡ Performance improvement'ı ölç")
+    print(f"   3. 🔍 Diğer benzer redundant columns'ları da kontrol et")
+    print(f"   4. 📊 Memory usage monitoring")
+
+    print(f"\n" + "="*40)
+    print(f"REDUNDANT COLUMN DELETION: SUCCESS!")
+    print(f"🎉 KULLANICI KARARI: MÜKEMMEL VE GEREKLİYDİ!") 
+
+    return df_cleaned
+
+
+def main():
+    """Step 9 → step 10 dönüşümü"""
+
+    print("🗑️ REDUNDANT ENTITY URN DELETION")
+    print("="*40)
+
+    # Load the dataset
+    df = read_csv_fast('linkedin_jobs_dataset_optimized_step9.csv')
+
+    df_cleaned = delete_redundant_entity_urn(df)
+
+    print(f"\n💾 SAVE CLEANED DATASET")
+    print("-"*30)
 
-print("1. PRE-DELETION VALIDATION")
-print("-"*30)
+    # Save the cleaned dataset
+    output_file = 'linkedin_jobs_dataset_optimized_step10.csv'
+    df_cleaned.to_csv(output_file, index=False)
+    checkpoint_gate(output_file, df_cleaned)
 
-target_column = 'jobApplicantInsights/entityUrn'
-
-print(f"📊 Mevcut durum:")
-print(f"   Toplam sütun: {len(df.columns)}")
-print(f"   Toplam kayıt: {len(df):,}")
-print(f"   Target sütun: {target_column}")
-print(f"   Target unique: {df[target_column].nunique():,}")
-print(f"   Target duplicates: {df[target_column].duplicated().sum():,}")
+    print(f"💾 Temizlenmiş dataset kaydedildi: {output_file}")
+    print(f"   Dosya boyutu optimize edildi")
+    print(f"   Redundant column eliminasyonu tamamlandı")
 
-# Backup critical info
-print(f"\n2. BACKUP & SAFETY CHECK")
-print("-"*30)
-
-# Ensure id column is sufficient replacement
-id_unique = df['id'].nunique()
-id_duplicates = df['id'].duplicated().sum()
-
-print(f"✅ Replacement column validation:")
-print(f"   'id' unique count: {id_unique:,}")
-print(f"   'id' duplicates: {id_duplicates}")
-print(f"   'id' null count: {df['id'].isna().sum()}")
-
-if id_unique == df[target_column].nunique() and id_duplicates == 0:
-    print(f"   ✅ 'id' sütunu mükemmel replacement!")
-else:
-    print(f"   ⚠️  Dikkat: Replacement validation başarısız!")
-
-print(f"\n3. DELETION OPERATION")
-print("-"*30)
-
-# Memory usage before deletion
-memory_before = df.memory_usage(deep=True).sum() / 1024 / 1024  # MB
-target_memory = df[target_column].memory_usage(deep=True) / 1024 / 1024  # MB
-
-print(f"💾 Memory usage before deletion:")
-print(f"   Total memory: {memory_before:.2f} MB")
-print(f"   Target column: {target_memory:.2f} MB")
-
-# Delete the redundant column
-print(f"\n🗑️ Deleting '{target_column}'...")
-df_cleaned = df.drop(columns=[target_column])
-
-print(f"✅ Deletion completed!")
-
-print(f"\n4. POST-DELETION VALIDATION")
-print("-"*30)
-
-# Memory usage after deletion
-memory_after = df_cleaned.memory_usage(deep=True).sum() / 1024 / 1024  # MB
-memory_saved = memory_before - memory_after
-
-print(f"📊 Post-deletion metrics:")
-print(f"   Yeni sütun sayısı: {len(df_cleaned.columns)} (önceki: {len(df.columns)})")
-print(f"   Kayıt sayısı: {len(df_cleaned):,} (değişmedi)")
-print(f"   Memory kullanımı: {memory_after:.2f} MB")
-print(f"   Memory tasarrufu: {memory_saved:.2f} MB")
-
-# Verify target column is gone
-if target_column not in df_cleaned.columns:
-    print(f"   ✅ '{target_column}' başarıyla silindi")
-else:
-    print(f"   ❌ Silme işlemi başarısız!")
-
-# Verify id column still exists and functional
-if 'id' in df_cleaned.columns:
-    print(f"   ✅ 'id' sütunu korundu")
-    print(f"   ✅ 'id' unique count: {df_cleaned['id'].nunique():,}")
-else:
-    print(f"   ❌ 'id' sütunu kayıp!")
-
-print(f"\n5. QUALITY ASSURANCE")
-print("-"*30)
-
-# Check if any analytics depend on deleted column
-problematic_columns = []
-for col in df_cleaned.columns:
-    if 'applicant' in col.lower() and 'insights' in col.lower():
-        problematic_columns.append(col)
-
-if problematic_columns:
-    print(f"⚠️  İlgili sütunlar hala mevcut: {problematic_columns}")
-    print(f"   Bu sütunlar da silinebilir olabilir.")
-else:
-    print(f"✅ İlgili başka problemli sütun yok")
-
-print(f"\n6. SAVE CLEANED DATASET")
-print("-"*30)
-
-# Save the cleaned dataset
-output_file = 'linkedin_jobs_dataset_optimized_step10.csv'
-df_cleaned.to_csv(output_file, index=False)
-
-print(f"💾 Temizlenmiş dataset kaydedildi: {output_file}")
-print(f"   Dosya boyutu optimize edildi")
-print(f"   Redundant column eliminasyonu tamamlandı")
-
-print(f"\n7. IMPACT SUMMARY")
-print("-"*30)
-
-print(f"🎯 İYİLEŞTİRME METRIKLERI:")
-print(f"   ✅ Sütun azalması: {len(df.columns)} → {len(df_cleaned.columns)} (-1)")
-print(f"   ✅ Memory tasarrufu: {memory_saved:.2f} MB")
-print(f"   ✅ Redundancy eliminasyonu: %65.8 duplicate temizlendi")
-print(f"   ✅ Data quality artışı: Duplicate contamination giderildi")
-print(f"   ✅ Query performance: Gereksiz column scan'ı eliminasyonu")
-
-print(f"\n8. RECOMMENDATIONS")
-print("-"*30)
-
-print(f"📋 Sonraki adımlar:")
-print(f"   1. ✅ Analytics'leri test et - 'id' kullanarak")
-print(f"   2. ⚡ Performance improvement'ı ölç")
-print(f"   3. 🔍 Diğer benzer redundant columns'ları da kontrol et")
-print(f"   4. 📊 Memory usage monitoring")
-
-print(f"\n" + "="*40)
-print(f"REDUNDANT COLUMN DELETION: SUCCESS!")
-print(f"🎉 KULLANICI KARARI: MÜKEMMEL VE GEREKLİYDİ!") 
\ No newline at end of file
+if __name__ == "__main__":
+    main()
@@ -8,7 +8,11 @@ jobWorkplaceTypes/0/localizedName sütunu daha zengin bilgi sağladığı için
 
 import pandas as pd
 import numpy as np
+from pipeline_profiler import profile_step
+from schema_validator import checkpoint_gate
+from fast_loader import read_csv_fast
 
+@profile_step
 def delete_workRemoteAllowed_column():
     """workRemoteAllowed sütununu sil"""
     
@@ -17,7 +21,7 @@ def delete_workRemoteAllowed_column():
     
     # Dataset yükle
     try:
-        df = pd.read_csv('linkedin_jobs_dataset_optimized_step10.csv')
+        df = read_csv_fast('linkedin_jobs_dataset_optimized_step10.csv')
         print(f"✅ Dataset yüklendi: {len(df):,} kayıt, {len(df.columns)} sütun")
     except Exception as e:
         print(f"❌ Dataset yükleme hatası: {e}")
@@ -86,6 +90,7 @@ def delete_workRemoteAllowed_column():
     # Yeni dosya kaydet
     output_file = 'linkedin_jobs_dataset_optimized_step11.csv'
     df_cleaned.to_csv(output_file, index=False)
+    checkpoint_gate(output_file, df_cleaned)
     
     print(f"\n💾 DOSYA KAYDI:")
     print(f"   ✅ Yeni dataset: {output_file}")
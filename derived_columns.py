@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+LinkedIn Jobs Dataset - Declarative Derived-Column Engine
+expireAt'ten türetilen zamansal sütunları (expire_month, expire_season,
+is_business_day, ...) bildirimsel spec'lerden tek vektörel geçişte üretir.
+
+Her spec bir datetime bileşeni (month / quarter / dayofweek / day), opsiyonel
+bir lookup tablosu ve çıktı tipi tanımlar:
+    'expire_season': {'component': 'month', 'lookup': {12: 'Winter', ...},
+                      'categories': SEASONS}
+Derleme aşamasında lookup'lar bileşen değeriyle indekslenen numpy dizilerine
+çevrilir; çalışırken her .dt bileşeni bir kez hesaplanır ve tüm özellikler
+tek bir dizi indekslemesiyle (categorical ise doğrudan kodlarla) üretilir.
+Yeni bir zamansal özellik eklemek satır başına Python çağrısı eklemez.
+
+Sayısal eşik kategorileri (job_urgency_level, optimal_application_window)
+classification_rules kural tablolarıyla tanımlanır.
+"""
+
+import numpy as np
+import pandas as pd
+
+from classification_rules import compile_rules
+
+EXPIRE_COLUMN = 'expireAt'
+DAYS_TO_EXPIRE_COLUMN = 'days_to_expire'
+
+# Bileşen → en büyük değer (lookup dizisi boyutu; son eleman eksik değer slotu)
+COMPONENT_MAX = {'month': 12, 'quarter': 4, 'dayofweek': 6, 'day': 31}
+
+SEASONS = ['Winter', 'Spring', 'Summer', 'Fall']
+DAY_NAMES = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+MONTH_SEASONS = {
+    12: 'Winter', 1: 'Winter', 2: 'Winter',
+    3: 'Spring', 4: 'Spring', 5: 'Spring',
+    6: 'Summer', 7: 'Summer', 8: 'Summer',
+    9: 'Fall', 10: 'Fall', 11: 'Fall'
+}
+
+# create_column_report.py'deki zamansal özelliklerin spec'leri
+TEMPORAL_FEATURES = {
+    'expire_month': {'component': 'month', 'dtype': 'Int8'},
+    'expire_quarter': {'component': 'quarter', 'dtype': 'Int8'},
+    'expire_day_of_week': {'component': 'dayofweek', 'lookup': dict(enumerate(DAY_NAMES)),
+                           'categories': DAY_NAMES},
+    'expire_season': {'component': 'month', 'lookup': MONTH_SEASONS, 'categories': SEASONS},
+    'is_business_day': {'component': 'dayofweek', 'lookup': {d: d < 5 for d in range(7)}, 'dtype': 'bool'},
+    'is_month_end': {'component': 'day', 'lookup': {d: d >= 25 for d in range(1, 32)}, 'dtype': 'bool'},
+    'is_quarter_end': {'component': 'month', 'lookup': {m: m in (3, 6, 9, 12) for m in range(1, 13)},
+                       'dtype': 'bool'},
+}
+
+# create_urgency_categories_and_optimize_expireAt.py'deki categorize_urgency
+URGENCY_RULES = [
+    {'label': 'UNKNOWN', 'any': [(DAYS_TO_EXPIRE_COLUMN, 'isna', None)]},
+    {'label': 'EXPIRED', 'any': [(DAYS_TO_EXPIRE_COLUMN, '<', 0)]},
+    {'label': 'CRITICAL_URGENT', 'any': [(DAYS_TO_EXPIRE_COLUMN, '<=', 3)]},
+    {'label': 'HIGH_URGENT', 'any': [(DAYS_TO_EXPIRE_COLUMN, '<=', 7)]},
+    {'label': 'MODERATE_URGENT', 'any': [(DAYS_TO_EXPIRE_COLUMN, '<=', 14)]},
+    {'label': 'NORMAL', 'any': [(DAYS_TO_EXPIRE_COLUMN, '<=', 30)]},
+    {'label': 'EXTENDED', 'any': [(DAYS_TO_EXPIRE_COLUMN, '<=', 60)]},
+]
+
+APPLICATION_WINDOW_RULES = [
+    {'label': 'IMMEDIATE', 'any': [(DAYS_TO_EXPIRE_COLUMN, '<=', 3)]},
+    {'label': 'PRIORITY', 'any': [(DAYS_TO_EXPIRE_COLUMN, '<=', 7)]},
+    {'label': 'STANDARD', 'any': [(DAYS_TO_EXPIRE_COLUMN, '<=', 21)]},
+    {'label': 'QUALITY_FOCUS', 'any': [(DAYS_TO_EXPIRE_COLUMN, '<=', 60)]},
+]
+
+classify_urgency = compile_rules(URGENCY_RULES, default='LONG_TERM', name='job_urgency_level')
+classify_application_window = compile_rules(APPLICATION_WINDOW_RULES, default='STRATEGIC',
+                                            name='optimal_application_window')
+
+
+def to_datetime_column(values):
+    """expireAt → datetime64 (ms epoch int veya datetime string kabul eder)"""
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values
+    if pd.api.types.is_numeric_dtype(values):
+        return pd.to_datetime(values, unit='ms')
+    return pd.to_datetime(values, errors='coerce')
+
+
+def _compile_spec(name, spec):
+    component = spec['component']
+    if component not in COMPONENT_MAX:
+        raise ValueError(f"{name}: desteklenmeyen bileşen {component}")
+
+    lookup = spec.get('lookup')
+    if lookup is None:
+        return {'component': component, 'kind': 'raw', 'dtype': spec.get('dtype', 'Int64')}
+
+    # Son eleman (-1 indeksi) NaT satırları için eksik değer slotu
+    size = COMPONENT_MAX[component] + 2
+    categories = spec.get('categories')
+    if categories is not None:
+        table = np.full(size, -1, dtype='int64')
+        for key, label in lookup.items():
+            table[key] = categories.index(label)
+        return {'component': component, 'kind': 'categorical', 'table': table, 'categories': list(categories)}
+
+    dtype = spec.get('dtype', 'object')
+    table = np.full(size, False if dtype == 'bool' else None, dtype=dtype)
+    for key, value in lookup.items():
+        table[key] = value
+    return {'component': component, 'kind': 'lookup', 'table': table}
+
+
+def compile_derived_columns(specs=TEMPORAL_FEATURES):
+    """Spec'leri derler; datetime Series → {sütun: Series} üreten fonksiyon döndürür"""
+    compiled = {name: _compile_spec(name, spec) for name, spec in specs.items()}
+    components = list(dict.fromkeys(plan['component'] for plan in compiled.values()))
+
+    def derive(timestamps):
+        timestamps = to_datetime_column(timestamps)
+        # Her .dt bileşeni bir kez; NaT → -1 (lookup dizisinin eksik değer slotu)
+        values = {
+            component: getattr(timestamps.dt, component).fillna(-1).astype('int64').to_numpy()
+            for component in components
+        }
+
+        derived = {}
+        for name, plan in compiled.items():
+            component_values = values[plan['component']]
+            if plan['kind'] == 'raw':
+                series = pd.Series(component_values, index=timestamps.index)
+                derived[name] = series.where(component_values >= 0).astype(plan['dtype'])
+            elif plan['kind'] == 'categorical':
+                codes = plan['table'][component_values]
+                derived[name] = pd.Series(pd.Categorical.from_codes(codes, categories=plan['categories']),
+                                          index=timestamps.index)
+            else:
+                derived[name] = pd.Series(plan['table'][component_values], index=timestamps.index)
+        return derived
+
+    derive.columns = list(compiled)
+    return derive
+
+
+derive_temporal_features = compile_derived_columns(TEMPORAL_FEATURES)
+
+
+def add_derived_columns(df, source=EXPIRE_COLUMN, derive=derive_temporal_features):
+    """Türetilmiş sütunları DataFrame'e tek seferde ekler"""
+    derived = derive(df[source])
+    for name, series in derived.items():
+        df[name] = series
+    return df
+
+
+def main():
+    """Zamansal özellikleri türetir ve dağılımlarını gösterir"""
+
+    print("🧩 LinkedIn Jobs Dataset - Derived-Column Engine")
+    print("=" * 60)
+
+    try:
+        df = pd.read_csv('linkedin_jobs_dataset_optimized_step7.csv')
+        print(f"✅ Dataset yüklendi: {len(df):,} satır, {len(df.columns)} sütun")
+        print()
+    except Exception as e:
+        print(f"❌ HATA: Dataset yüklenemedi - {e}")
+        return
+
+    add_derived_columns(df)
+    print(f"📅 Türetilen sütunlar: {', '.join(derive_temporal_features.columns)}")
+    print()
+
+    for name in ('expire_season', 'expire_day_of_week'):
+        print(f"📊 {name}: {df[name].value_counts(sort=False).to_dict()}")
+    for name in ('is_business_day', 'is_month_end', 'is_quarter_end'):
+        print(f"✅ {name}: %{df[name].mean() * 100:.1f}")
+
+if __name__ == "__main__":
+    main()
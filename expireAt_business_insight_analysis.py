@@ -9,8 +9,13 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 import warnings
+from lazy_query import collect, dataset_columns, scan_csv, select_available
 warnings.filterwarnings('ignore')
 
+INPUT_FILE = 'linkedin_jobs_dataset_with_job_investment_category.csv'
+# Raporun okuduğu sütunlar (salary sütunları şemadan isimle eklenir)
+REPORT_COLUMNS = ['expireAt', 'job_investment_type', 'company_size_category', 'desc_experience_years']
+
 def analyze_expireAt_business_intelligence(df):
     """expireAt sütunu için iş zekası analizi"""
     
@@ -476,7 +481,9 @@ if __name__ == "__main__":
     try:
         # Load the latest dataset
         print("📂 Dataset yükleniyor...")
-        df = pd.read_csv('linkedin_jobs_dataset_with_job_investment_category.csv')
+        jobs = scan_csv(INPUT_FILE)
+        salary_columns = [col for col in dataset_columns(jobs) if 'salary' in col.lower()]
+        df = collect(select_available(jobs, REPORT_COLUMNS + salary_columns))
         print(f"✅ Dataset yüklendi: {len(df):,} satır, {len(df.columns)} sütun")
         print()
         
@@ -10,8 +10,9 @@ import numpy as np
 from collections import Counter
 import re
 import warnings
-from datetime import datetime, timedelta
-import dateutil.parser
+from mmap_dataset import load_dataset
+from datetime_detection import detect_datetime_columns, detect_datetime_format, is_datetime_candidate, parse_datetime_column
+from datetime_comparison import compare_datetime_columns, format_offset, is_duplicate_pair, pair_metrics
 warnings.filterwarnings('ignore')
 
 def analyze_expireAt_comprehensive(df):
@@ -169,18 +170,26 @@ def analyze_expireAt_comprehensive(df):
     
     if datetime_columns:
         print(f"📅 Benzer DateTime sütunları bulundu:")
+        comparison = compare_datetime_columns(df, [column_name] + datetime_columns)
         for sim_col in datetime_columns:
-            similarity_score = calculate_datetime_similarity(col_data, df[sim_col])
-            print(f"   📊 {sim_col}: Similarity {similarity_score:.1f}%")
+            metrics = pair_metrics(comparison, column_name, sim_col)
+            print(f"   📊 {sim_col}: Similarity {metrics['similarity']:.1f}% "
+                  f"(exact {metrics['exact_match_rate']:.1f}%, "
+                  f"offset {format_offset(metrics['median_offset'])}, "
+                  f"null pattern {metrics['null_pattern_agreement']:.1f}%)")
             
         print(f"\n🔍 Duplicate Detection:")
-        duplicate_analysis = detect_datetime_duplicates(df, column_name, datetime_columns)
+        duplicate_analysis = detect_datetime_duplicates(df, column_name, datetime_columns, comparison)
         if duplicate_analysis['duplicates_found']:
             print(f"   ⚠️ Potential duplicates detected!")
             for dup in duplicate_analysis['duplicate_pairs']:
-                print(f"     🔗 {dup['column']}: {dup['match_rate']:.1f}% match")
+                print(f"     🔗 {dup['column']}: {dup['match_rate']:.1f}% match "
+                      f"(null pattern uyumu {dup['null_pattern_agreement']:.1f}%)")
         else:
             print(f"   ✅ No duplicate datetime columns detected")
+        for derived in duplicate_analysis['constant_offsets']:
+            print(f"   📐 {derived['column']} = {column_name} {derived['offset']} "
+                  f"({derived['match_rate']:.1f}% satır)")
     else:
         print(f"✅ Unique datetime column - no similar columns found")
     print()
@@ -238,57 +247,26 @@ def analyze_expireAt_comprehensive(df):
     }
 
 def analyze_datetime_formats(series):
-    """DateTime formatlarını analiz eder"""
-    
-    sample_size = min(1000, len(series))
-    sample_data = series.sample(n=sample_size) if len(series) > sample_size else series
-    
-    parsed_dates = []
-    detected_format = 'Unknown'
-    parse_success_count = 0
-    
-    for value in sample_data:
-        try:
-            # Try to parse as datetime
-            if isinstance(value, str):
-                parsed_date = dateutil.parser.parse(value)
-                parsed_dates.append(parsed_date)
-                parse_success_count += 1
-            elif isinstance(value, (int, float)):
-                # Try as timestamp (convert from milliseconds if needed)
-                timestamp_val = value
-                if timestamp_val > 1e10:  # Milliseconds timestamp
-                    timestamp_val = timestamp_val / 1000
-                parsed_date = datetime.fromtimestamp(timestamp_val)
-                parsed_dates.append(parsed_date)
-                parse_success_count += 1
-                detected_format = 'Unix timestamp (milliseconds)'
-            else:
-                # Already datetime
-                parsed_dates.append(value)
-                parse_success_count += 1
-        except:
-            continue
+    """DateTime formatlarını tüm sütun üzerinde analiz eder (datetime_detection)"""
     
-    if parse_success_count > 0 and detected_format == 'Unknown':
-        # Try to detect format from successful parses
-        first_valid = str(sample_data.iloc[0])
-        if 'T' in first_valid and 'Z' in first_valid:
-            detected_format = 'ISO 8601 UTC'
-        elif 'T' in first_valid:
-            detected_format = 'ISO 8601'
-        else:
-            detected_format = 'Standard datetime'
+    detection = detect_datetime_format(series)
+    parsed_dates = parse_datetime_column(series, detection).dropna()
     
-    parse_success_rate = (parse_success_count / len(sample_data)) * 100 if len(sample_data) > 0 else 0
+    if detection['kind'] == 'epoch':
+        timezone_info = 'UTC (epoch)'
+    elif detection['detected_format'] in ('ISO 8601 UTC', 'ISO 8601 offset'):
+        timezone_info = 'UTC (normalized)'
+    else:
+        timezone_info = 'Local/Unknown'
     
     result = {
-        'detected_format': detected_format,
-        'parse_success_rate': parse_success_rate,
+        'detected_format': detection['detected_format'],
+        'parse_success_rate': detection['parse_success_rate'],
+        'format_counts': detection['format_counts'],
         'parsed_dates': parsed_dates,
-        'min_date': min(parsed_dates).strftime('%Y-%m-%d %H:%M:%S') if parsed_dates else None,
-        'max_date': max(parsed_dates).strftime('%Y-%m-%d %H:%M:%S') if parsed_dates else None,
-        'timezone_info': 'Local/Unknown'
+        'min_date': parsed_dates.min().strftime('%Y-%m-%d %H:%M:%S') if len(parsed_dates) > 0 else None,
+        'max_date': parsed_dates.max().strftime('%Y-%m-%d %H:%M:%S') if len(parsed_dates) > 0 else None,
+        'timezone_info': timezone_info
     }
     
     return result
@@ -296,23 +274,23 @@ def analyze_datetime_formats(series):
 def analyze_expiry_business_logic(parsed_dates):
     """Expiry tarihlerinin iş mantığını analiz eder"""
     
-    if not parsed_dates:
+    if len(parsed_dates) == 0:
         return {'logic_score': 0, 'expired_count': 0, 'future_count': 0, 'today_count': 0, 
                 'expired_percentage': 0, 'future_percentage': 0, 'avg_days_to_expiry': 0}
     
-    now = datetime.now()
+    now = pd.Timestamp.now()
     
-    expired_count = sum(1 for date in parsed_dates if date < now)
-    future_count = sum(1 for date in parsed_dates if date > now)
-    today_count = sum(1 for date in parsed_dates if date.date() == now.date())
+    expired_count = int((parsed_dates < now).sum())
+    future_count = int((parsed_dates > now).sum())
+    today_count = int((parsed_dates.dt.normalize() == now.normalize()).sum())
     
     total_dates = len(parsed_dates)
     expired_percentage = (expired_count / total_dates) * 100
     future_percentage = (future_count / total_dates) * 100
     
     # Calculate average days to expiry
-    days_to_expiry = [(date - now).days for date in parsed_dates]
-    avg_days_to_expiry = sum(days_to_expiry) / len(days_to_expiry)
+    days_to_expiry = (parsed_dates - now).dt.days
+    avg_days_to_expiry = float(days_to_expiry.mean())
     
     # Business logic score (higher score for more future dates)
     logic_score = future_percentage * 0.8 + (20 if avg_days_to_expiry > 0 else 0)
@@ -331,11 +309,11 @@ def analyze_expiry_business_logic(parsed_dates):
 def analyze_urgency_patterns(parsed_dates):
     """Urgency patterns analizi"""
     
-    if not parsed_dates:
+    if len(parsed_dates) == 0:
         return {'urgency_score': 0, 'urgency_distribution': {}, 
                 'median_days_remaining': 0, 'std_days_remaining': 0}
     
-    now = datetime.now()
+    now = pd.Timestamp.now()
     
     urgency_categories = {
         'EXPIRED': {'count': 0, 'emoji': '🔴', 'days_threshold': 0, 'comparison': 'less'},
@@ -346,24 +324,17 @@ def analyze_urgency_patterns(parsed_dates):
         'FUTURE_LONG': {'count': 0, 'emoji': '🔵', 'days_threshold': 30, 'comparison': 'greater'}
     }
     
-    days_remaining = []
+    days_remaining = (parsed_dates - now).dt.days.to_numpy()
     
-    for date in parsed_dates:
-        days_diff = (date - now).days
-        days_remaining.append(days_diff)
-        
-        if days_diff < 0:
-            urgency_categories['EXPIRED']['count'] += 1
-        elif days_diff == 0:
-            urgency_categories['URGENT_TODAY']['count'] += 1
-        elif days_diff <= 3:
-            urgency_categories['URGENT_1_3_DAYS']['count'] += 1
-        elif days_diff <= 7:
-            urgency_categories['MODERATE_1_WEEK']['count'] += 1
-        elif days_diff <= 30:
-            urgency_categories['NORMAL_1_MONTH']['count'] += 1
-        else:
-            urgency_categories['FUTURE_LONG']['count'] += 1
+    # Kategoriler urgency_categories sırasıyla: np.select ile tek geçişte sayılır
+    category_codes = np.select(
+        [days_remaining < 0, days_remaining == 0, days_remaining <= 3,
+         days_remaining <= 7, days_remaining <= 30],
+        [0, 1, 2, 3, 4], default=5
+    )
+    category_counts = np.bincount(category_codes, minlength=len(urgency_categories))
+    for category, count in zip(urgency_categories, category_counts):
+        urgency_categories[category]['count'] = int(count)
     
     total_dates = len(parsed_dates)
     
@@ -394,73 +365,67 @@ def analyze_urgency_patterns(parsed_dates):
     }
 
 def find_similar_datetime_columns(df, exclude_col):
-    """Benzer datetime sütunlarını bulur"""
+    """Benzer datetime sütunlarını bulur (isim veya tam sütun format tespiti)"""
     
+    datetime_keywords = ['date', 'time', 'expire', 'created', 'updated', 'posted', 'deadline', 'start', 'end']
     datetime_columns = []
+    content_candidates = []
     
     for col in df.columns:
         if col == exclude_col:
             continue
             
         # Check for datetime-related column names
-        datetime_keywords = ['date', 'time', 'expire', 'created', 'updated', 'posted', 'deadline', 'start', 'end']
         if any(keyword in col.lower() for keyword in datetime_keywords):
             datetime_columns.append(col)
-            continue
-        
-        # Check data type
-        if df[col].dtype in ['datetime64[ns]', 'object']:
-            # Sample check if it might be datetime
-            sample = df[col].dropna().head(10)
-            if len(sample) > 0:
-                try:
-                    pd.to_datetime(sample.iloc[0])
-                    datetime_columns.append(col)
-                except:
-                    pass
+        elif is_datetime_candidate(df[col]):
+            # Sayısal sütunlar da aday: epoch s / ms değerleri (ör. listedAt) isimden yakalanmaz;
+            # serbest metin sütunları format denemeden elenir
+            content_candidates.append(col)
+    
+    # İçerik kontrolü: tüm sütun parse başarı oranı (format sütun başına cache'lenir)
+    datetime_columns.extend(detect_datetime_columns(df, content_candidates))
     
     return datetime_columns
 
 def calculate_datetime_similarity(col1, col2):
-    """İki datetime sütunu arasındaki similarity hesaplar"""
+    """İki datetime sütunu arasındaki similarity hesaplar (datetime_comparison)"""
     
-    # Compare non-null values
-    valid_data1 = col1.dropna()
-    valid_data2 = col2.dropna()
-    
-    if len(valid_data1) == 0 or len(valid_data2) == 0:
-        return 0.0
-    
-    # Simple comparison - this would need more sophisticated logic in production
-    similarity = 50.0  # Base similarity for datetime columns
-    
-    # Same null pattern bonus
-    null_pattern_similarity = 100 - abs(col1.isnull().sum() - col2.isnull().sum()) / len(col1) * 100
-    similarity += null_pattern_similarity * 0.3
-    
-    return min(100.0, similarity)
+    pair = pd.DataFrame({'left': col1.reset_index(drop=True), 'right': col2.reset_index(drop=True)})
+    comparison = compare_datetime_columns(pair, ['left', 'right'])
+    return comparison[('left', 'right')]['similarity']
 
-def detect_datetime_duplicates(df, target_col, similar_cols):
-    """Datetime duplicate detection"""
+def detect_datetime_duplicates(df, target_col, similar_cols, comparison=None):
+    """Datetime duplicate ve sabit offset tespiti (tüm çiftler tek batch'te)"""
     
-    duplicates_found = False
-    duplicate_pairs = []
+    if comparison is None:
+        comparison = compare_datetime_columns(df, [target_col] + list(similar_cols))
     
-    target_data = df[target_col]
+    duplicate_pairs = []
+    constant_offsets = []
     
     for col in similar_cols:
-        similarity_score = calculate_datetime_similarity(target_data, df[col])
+        metrics = pair_metrics(comparison, target_col, col)
         
-        if similarity_score > 95:  # Very high similarity threshold
-            duplicates_found = True
+        # Ortak dolu satırlarda eşleşme; seyrek kopya da duplicate sayılır
+        if is_duplicate_pair(metrics):
             duplicate_pairs.append({
                 'column': col,
-                'match_rate': similarity_score
+                'match_rate': metrics['tolerance_match_rate'],
+                'exact_match_rate': metrics['exact_match_rate'],
+                'null_pattern_agreement': metrics['null_pattern_agreement']
+            })
+        elif metrics['constant_offset']:
+            constant_offsets.append({
+                'column': col,
+                'offset': format_offset(metrics['median_offset']),
+                'match_rate': metrics['offset_match_rate']
             })
     
     return {
-        'duplicates_found': duplicates_found,
-        'duplicate_pairs': duplicate_pairs
+        'duplicates_found': len(duplicate_pairs) > 0,
+        'duplicate_pairs': duplicate_pairs,
+        'constant_offsets': constant_offsets
     }
 
 def suggest_datetime_optimizations(col_data, datetime_analysis):
@@ -536,7 +501,7 @@ if __name__ == "__main__":
     try:
         # Load the latest dataset
         print("📂 Dataset yükleniyor...")
-        df = pd.read_csv('linkedin_jobs_dataset_with_job_investment_category.csv')
+        df = load_dataset('linkedin_jobs_dataset_with_job_investment_category.csv')
         print(f"✅ Dataset yüklendi: {len(df):,} satır, {len(df.columns)} sütun")
         print()
         
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+LinkedIn Jobs Dataset - Multithreaded Arrow CSV Loader
+Pipeline adımlarının büyük stepN CSV'lerini pd.read_csv'nin tek thread'li
+C parser'ı yerine pyarrow.csv ile tüm core'larda parse eder.
+
+- Bilinen sütunlar için açık tipler (COLUMN_TYPES): ağır metin sütunları
+  doğrudan string, id int64 - bu sütunlarda tip çıkarımı yapılmaz.
+- usecols: yalnızca istenen sütunlar parse edilir (liste veya callable).
+- Ağır metin sütunları (string_columns.ARROW_STRING_COLUMNS) pandas'a
+  string[pyarrow] olarak geçer; ara Python str nesneleri oluşmaz
+  (arrow_strings=True → tüm string sütunlar, False → object).
+- Arrow'un ISO tarih çıkarımı pandas davranışından farklı olduğundan
+  tarih / zaman olarak çıkarılan sütunlar string olarak okunur.
+
+pyarrow yoksa veya PIPELINE_ARROW_CSV=0 ise pd.read_csv'ye düşülür.
+"""
+
+import os
+import sys
+import time
+
+import pandas as pd
+
+from string_columns import ARROW_STRING_COLUMNS, to_arrow_strings
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = None
+    pa_csv = None
+
+ARROW_CSV_ENV = 'PIPELINE_ARROW_CSV'
+BLOCK_SIZE = 16 << 20
+
+# Sütun → tip ismi; dosyada olmayan sütunlar yok sayılır
+COLUMN_TYPES = {
+    'id': 'int64',
+    'title': 'string',
+    'description': 'string',
+    'companyName': 'string',
+    'companyDescription': 'string',
+    'company/name': 'string',
+    'companyLinkedinUrl': 'string',
+    'link': 'string',
+    'contentSource': 'string',
+    'experienceLevel': 'string',
+    'industries_consolidated': 'string',
+    'job_functions_combined': 'string',
+}
+
+
+def arrow_csv_enabled():
+    return pa_csv is not None and os.environ.get(ARROW_CSV_ENV, '1') != '0'
+
+
+def _arrow_type(name):
+    return {
+        'string': pa.string(),
+        'int64': pa.int64(),
+        'float64': pa.float64(),
+        'bool': pa.bool_(),
+    }[name]
+
+
+def _string_dtype_mapper(arrow_type):
+    if arrow_type in (pa.string(), pa.large_string()):
+        return pd.StringDtype('pyarrow')
+    return None
+
+
+def _resolve_usecols(path, usecols):
+    """pandas usecols (liste / callable) → Arrow include_columns"""
+    if usecols is None:
+        return None
+    if callable(usecols):
+        from schema_validator import read_columns
+        return [column for column in read_columns(path) if usecols(column)]
+    return list(usecols)
+
+
+def _temporal_columns(path, read_options, parse_options, convert_options):
+    """İlk blokta tarih / zaman çıkarılan sütunlar (pandas bunları string okur)"""
+    reader = pa_csv.open_csv(path, read_options=read_options, parse_options=parse_options,
+                             convert_options=convert_options)
+    try:
+        return [
+            field.name for field in reader.schema
+            if pa.types.is_timestamp(field.type) or pa.types.is_date(field.type) or pa.types.is_time(field.type)
+        ]
+    finally:
+        reader.close()
+
+
+def read_arrow_table(path, usecols=None, column_types=None):
+    """CSV'yi multithreaded Arrow reader ile Arrow Table olarak okur"""
+    column_types = COLUMN_TYPES if column_types is None else column_types
+    include_columns = _resolve_usecols(path, usecols)
+
+    read_options = pa_csv.ReadOptions(use_threads=True, block_size=BLOCK_SIZE)
+    # companyDescription gibi sütunlarda tırnak içinde satır sonu var
+    parse_options = pa_csv.ParseOptions(newlines_in_values=True)
+    types = {column: _arrow_type(name) for column, name in column_types.items()}
+
+    def convert_options(arrow_types):
+        kwargs = {'column_types': arrow_types, 'strings_can_be_null': True}
+        if include_columns is not None:
+            kwargs['include_columns'] = include_columns
+        return pa_csv.ConvertOptions(**kwargs)
+
+    for column in _temporal_columns(path, read_options, parse_options, convert_options(types)):
+        types.setdefault(column, pa.string())
+
+    try:
+        return pa_csv.read_csv(path, read_options=read_options, parse_options=parse_options,
+                               convert_options=convert_options(types))
+    except pa.ArrowInvalid:
+        # Açık sayısal tip bu dosyada tutmadı (ör. id string): yalnızca string tiplerle tekrar dene
+        types = {column: arrow_type for column, arrow_type in types.items() if arrow_type == pa.string()}
+        return pa_csv.read_csv(path, read_options=read_options, parse_options=parse_options,
+                               convert_options=convert_options(types))
+
+
+def read_csv_fast(path, usecols=None, column_types=None, arrow_strings=ARROW_STRING_COLUMNS):
+    """pd.read_csv yerine kullanılan paylaşımlı loader
+
+    Args:
+        usecols: okunacak sütunlar (liste veya sütun ismi → bool callable)
+        column_types: sütun → 'string' / 'int64' / 'float64' / 'bool'
+            (None → COLUMN_TYPES)
+        arrow_strings: string[pyarrow] olarak gelecek sütunlar (varsayılan
+            ağır metin sütunları); True → tüm string sütunlar, False → hiçbiri
+    """
+    if not arrow_csv_enabled():
+        df = pd.read_csv(path, usecols=usecols)
+        if arrow_strings is True:
+            return to_arrow_strings(df, [c for c in df.columns if df[c].dtype == object])
+        return to_arrow_strings(df, arrow_strings) if arrow_strings else df
+
+    table = read_arrow_table(path, usecols=usecols, column_types=column_types)
+    # self_destruct: dönüştürülen sütunların Arrow buffer'ları hemen bırakılır (düşük peak memory)
+    if arrow_strings is True or not arrow_strings:
+        types_mapper = _string_dtype_mapper if arrow_strings else None
+        return table.to_pandas(types_mapper=types_mapper, split_blocks=True, self_destruct=True)
+
+    column_order = table.column_names
+    arrow_columns = [c for c in column_order if c in set(arrow_strings)
+                     and pa.types.is_string(table.schema.field(c).type)]
+    strings = table.select(arrow_columns).to_pandas(types_mapper=_string_dtype_mapper)
+    rest = table.drop(arrow_columns).to_pandas(split_blocks=True, self_destruct=True)
+    return pd.concat([rest, strings], axis=1)[column_order]
+
+
+def main(argv=None):
+    """pd.read_csv ile Arrow loader sürelerini karşılaştırır"""
+
+    print("⚡ LinkedIn Jobs Dataset - Multithreaded Arrow CSV Loader")
+    print("=" * 60)
+
+    argv = sys.argv[1:] if argv is None else argv
+    csv_path = argv[0] if argv else 'linkedin_jobs_dataset_insights_completed.csv'
+
+    if not arrow_csv_enabled():
+        print("❌ HATA: pyarrow kurulu değil veya PIPELINE_ARROW_CSV=0 - Arrow loader kullanılamaz")
+        return
+
+    try:
+        start = time.perf_counter()
+        df_pandas = pd.read_csv(csv_path)
+        pandas_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        df_arrow = read_csv_fast(csv_path)
+        arrow_seconds = time.perf_counter() - start
+    except Exception as e:
+        print(f"❌ HATA: Dataset okunamadı - {e}")
+        return
+
+    pandas_memory = df_pandas.memory_usage(deep=True).sum() / 1024**2
+    arrow_memory = df_arrow.memory_usage(deep=True).sum() / 1024**2
+
+    print(f"📄 pd.read_csv: {pandas_seconds:.2f} s | {pandas_memory:.2f} MB")
+    print(f"⚡ Arrow loader: {arrow_seconds:.2f} s | {arrow_memory:.2f} MB "
+          f"({pandas_seconds / max(arrow_seconds, 1e-9):.1f}x, {os.cpu_count()} core)")
+    print(f"🔍 Sütunlar aynı: {list(df_pandas.columns) == list(df_arrow.columns)}")
+    print(f"🔤 string[pyarrow] sütun: {sum(str(dtype) == 'string' for dtype in df_arrow.dtypes)}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+LinkedIn Jobs Dataset - Format Signature Profiler
+String sütunlarındaki her değeri kompakt bir shape sınıfına (format signature)
+çevirir ve signature'ları hash aggregation ile sayar.
+
+Signature kuralları (run'lar tek karaktere indirgenir):
+    büyük harf run'ı → 'A'   küçük harf run'ı → 'a'   rakam run'ı → '9'
+    boşluk run'ı     → ' '   diğer karakterler olduğu gibi kalır
+    Örnek: 'urn:li:jobPosting:3712' → 'a:a:aAa:9'
+           'Yazılım Mühendisi'      → 'Aa Aa'
+
+Regex'ler yalnızca benzersiz değerlere uygulanır (factorize); satır sayıları
+np.bincount ile toplanıp signature bazında groupby ile birleştirilir.
+Böylece tüm dataset'teki format tutarsızlıkları sample almadan tek geçişte
+bulunur.
+"""
+
+import numpy as np
+import pandas as pd
+
+UPPER_CHARS = 'A-ZÇĞİÖŞÜ'
+LOWER_CHARS = 'a-zçğıöşü'
+
+# Sıra önemli: yerleştirilen 'A' / 'a' / '9' sonraki adımlarda tekrar eşleşmez
+SIGNATURE_STEPS = [
+    (r'\d+', '9'),
+    (rf'[{UPPER_CHARS}]+', 'A'),
+    (rf'[{LOWER_CHARS}]+', 'a'),
+    (r'\s+', ' '),
+]
+
+DEFAULT_MAX_LENGTH = 64
+
+
+def format_signatures(values, max_length=DEFAULT_MAX_LENGTH):
+    """String Series'ini signature Series'ine çevirir (null → NA)
+
+    max_length'ten uzun signature'lar kesilip '…' ile işaretlenir
+    (uzun serbest metin sütunlarında signature uzayını sınırlar).
+    """
+    signatures = values.astype('string')
+    for pattern, replacement in SIGNATURE_STEPS:
+        signatures = signatures.str.replace(pattern, replacement, regex=True)
+    if max_length is not None:
+        too_long = signatures.str.len() > max_length
+        signatures = signatures.where(~too_long.fillna(False), signatures.str.slice(0, max_length) + '…')
+    return signatures
+
+
+def signature_counts(series, max_length=DEFAULT_MAX_LENGTH):
+    """Sütundaki signature → satır sayısı (çoktan aza)
+
+    Returns:
+        (counts, examples): counts signature bazında satır sayıları,
+        examples her signature için ilk görülen örnek değer
+    """
+    codes, uniques = pd.factorize(series, use_na_sentinel=True)
+    valid = codes >= 0
+    if not valid.any():
+        empty = pd.Series(dtype='int64', name='rows')
+        return empty, pd.Series(dtype='object', name='example')
+
+    unique_counts = np.bincount(codes[valid], minlength=len(uniques))
+    unique_signatures = format_signatures(pd.Series(uniques).astype(str), max_length=max_length)
+
+    frame = pd.DataFrame({
+        'signature': unique_signatures.to_numpy(),
+        'rows': unique_counts,
+        'example': uniques
+    })
+    grouped = frame.groupby('signature', sort=False)
+    counts = grouped['rows'].sum().sort_values(ascending=False)
+    examples = grouped['example'].first().reindex(counts.index)
+    return counts, examples
+
+
+def profile_column(series, max_length=DEFAULT_MAX_LENGTH):
+    """Tek sütunun format profili
+
+    Returns:
+        dict: signature_count, dominant_signature, dominant_share (%),
+        inconsistent_rows (dominant dışı satırlar), signatures (top counts),
+        examples, mixed_alnum_rows (harf + rakam içeren satırlar)
+    """
+    counts, examples = signature_counts(series, max_length=max_length)
+    total = int(counts.sum())
+
+    if total == 0:
+        return {
+            'signature_count': 0,
+            'dominant_signature': None,
+            'dominant_share': 0.0,
+            'inconsistent_rows': 0,
+            'signatures': counts,
+            'examples': examples,
+            'mixed_alnum_rows': 0
+        }
+
+    has_letters = counts.index.str.contains('[Aa]', regex=True)
+    has_digits = counts.index.str.contains('9', regex=False)
+
+    return {
+        'signature_count': len(counts),
+        'dominant_signature': counts.index[0],
+        'dominant_share': counts.iloc[0] / total * 100,
+        'inconsistent_rows': total - int(counts.iloc[0]),
+        'signatures': counts,
+        'examples': examples,
+        'mixed_alnum_rows': int(counts[has_letters & has_digits].sum())
+    }
+
+
+def profile_dataset(df, columns=None, max_length=DEFAULT_MAX_LENGTH):
+    """Tüm string sütunlarının format profilleri {column: profile}"""
+    if columns is None:
+        columns = [col for col in df.columns
+                   if df[col].dtype == object or pd.api.types.is_string_dtype(df[col])]
+    return {col: profile_column(df[col], max_length=max_length) for col in columns}
+
+
+def find_format_inconsistencies(profiles, min_dominant_share=95.0, max_signatures=50):
+    """Dominant signature payı düşük (ama serbest metin olmayan) sütunlar
+
+    Çok sayıda signature'ı olan sütunlar (açıklama gibi serbest metin)
+    tutarsızlık değil doğal çeşitlilik kabul edilir.
+    """
+    issues = []
+    for col, profile in profiles.items():
+        if 1 < profile['signature_count'] <= max_signatures and profile['dominant_share'] < min_dominant_share:
+            issues.append((col, profile))
+    return sorted(issues, key=lambda item: item[1]['dominant_share'])
+
+
+def main():
+    """Tüm dataset için format signature taraması"""
+
+    print("🧬 LinkedIn Jobs Dataset - Format Signature Profiler")
+    print("=" * 60)
+
+    try:
+        df = pd.read_csv('linkedin_jobs_dataset_insights_completed.csv')
+        print(f"✅ Dataset yüklendi: {len(df):,} satır, {len(df.columns)} sütun")
+        print()
+    except Exception as e:
+        print(f"❌ HATA: Dataset yüklenemedi - {e}")
+        return
+
+    profiles = profile_dataset(df)
+    print(f"📊 {len(profiles)} string sütun profillendi")
+    print()
+
+    issues = find_format_inconsistencies(profiles)
+    print(f"⚠️ FORMAT TUTARSIZLIKLARI: {len(issues)} sütun")
+    for col, profile in issues:
+        print(f"\n📋 {col}: {profile['signature_count']} signature, dominant %{profile['dominant_share']:.1f}")
+        for signature, rows in profile['signatures'].head(5).items():
+            example = str(profile['examples'][signature])[:40]
+            print(f"   • '{signature}' → {rows:,} satır (örn: '{example}')")
+
+if __name__ == "__main__":
+    main()
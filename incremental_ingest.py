@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+LinkedIn Jobs Dataset - Incremental Ingest (Dedup + Upsert by Job ID)
+Yeni bir scrape batch'ini mevcut job id index'ine karşı dedup eder,
+sütun dönüşümlerini (industry consolidation, logo sütun kararı, logo boolean,
+investment type, urgency) yalnızca yeni veya değişmiş satırlara uygular ve sonucu
+Parquet store'a upsert eder.
+
+Store yapısı (STORE_DIR):
+    part-00001.parquet, part-00002.parquet, ...  → her ingest'in dönüştürülmüş delta'sı
+    _job_index.parquet                           → job id → (ham satır hash'i, part)
+
+Her çalıştırma yalnızca delta kadar satırı dönüştürür ve yalnızca yeni bir
+part dosyası yazar; geçmiş part'lar yeniden yazılmaz. Aynı job id birden fazla
+part'ta varsa en yeni part geçerlidir. compact_store() part'ları tek dosyada
+birleştirir.
+
+Değişiklik tespiti ham (dönüştürülmemiş) satırın
+pd.util.hash_pandas_object fingerprint'i ile yapılır. Not: days_to_expire /
+job_urgency_level batch pipeline'daki gibi satırın dönüştürüldüğü andaki
+zamana göre hesaplanır; değişmeyen satırlar yeniden hesaplanmaz.
+
+Batch CSV'si ingest_projection ile yalnızca final dataset'te kalan sütunlar
+ve türetilmiş sütunların kaynaklarıyla okunur (PIPELINE_PROJECTION=0 kapatır).
+"""
+
+import contextlib
+import glob
+import importlib
+import io
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+from ingest_projection import EXPIRE_SOURCE_COLUMNS, INDUSTRY_SOURCE_COLUMNS, default_projection, read_projected_csv
+from job_id_index import JOB_ID_COLUMN, normalize_job_ids
+
+STORE_DIR = 'linkedin_jobs_store'
+INDEX_FILE = '_job_index.parquet'
+PART_PATTERN = 'part-*.parquet'
+ROW_HASH_COLUMN = '_row_hash'
+PART_COLUMN = '_part'
+
+# Batch pipeline sırasıyla uygulanan satır bazlı dönüşümler (module, function)
+INCREMENTAL_TRANSFORMS = [
+    ('consolidate_industry_columns', 'consolidate_industry_columns'),
+    ('logo_columns_comparison_and_deletion', 'apply_logo_column_decision'),
+    ('convert_logo_to_boolean', 'convert_logo_to_boolean'),
+    ('create_job_investment_category_and_delete_contentSource', 'create_job_investment_category_and_delete_source'),
+    ('create_urgency_categories_and_optimize_expireAt', 'create_urgency_categories_and_optimize_expireAt'),
+]
+
+# Dönüşümlerin okuduğu ham sütunlar; seyrek scrape batch'lerinde eksik olanlar NA ile eklenir
+TRANSFORM_SOURCE_COLUMNS = (INDUSTRY_SOURCE_COLUMNS + ['company/logo', 'companyLogo', 'contentSource']
+                            + EXPIRE_SOURCE_COLUMNS)
+
+
+def ensure_source_columns(df, columns=TRANSFORM_SOURCE_COLUMNS):
+    """Eksik kaynak sütunları tamamen NA olarak ekler (mevcut sütunlara dokunmaz)"""
+    missing = [col for col in columns if col not in df.columns]
+    if not missing:
+        return df
+    filler = pd.DataFrame({col: pd.Series(pd.NA, index=df.index, dtype=object) for col in missing})
+    return pd.concat([df, filler], axis=1)
+
+
+def compute_row_hashes(df):
+    """Ham satırların uint64 fingerprint'i
+
+    CSV okumaları arasında dtype farkı (int ↔ float, object ↔ string) hash'i
+    değiştirmesin diye sütunlar isim sırasıyla normalize edilir:
+    numeric → float64, diğerleri → string.
+    """
+    normalized = {}
+    for col in sorted(df.columns):
+        series = df[col]
+        if pd.api.types.is_bool_dtype(series) or pd.api.types.is_numeric_dtype(series):
+            normalized[col] = series.astype('float64')
+        else:
+            normalized[col] = series.astype('string')
+    frame = pd.DataFrame(normalized, index=df.index)
+    return pd.util.hash_pandas_object(frame, index=False).astype('uint64')
+
+
+def _part_paths(store_dir):
+    return sorted(glob.glob(os.path.join(store_dir, PART_PATTERN)))
+
+
+def load_job_index(store_dir=STORE_DIR):
+    """job id → (row hash, part) index'ini yükler (store yoksa boş)"""
+    path = os.path.join(store_dir, INDEX_FILE)
+    if not os.path.exists(path):
+        return pd.DataFrame({
+            ROW_HASH_COLUMN: pd.Series(dtype='uint64'),
+            PART_COLUMN: pd.Series(dtype='int64')
+        }, index=pd.Index([], dtype='Int64', name=JOB_ID_COLUMN))
+
+    index = pd.read_parquet(path)
+    index.index = index.index.astype('Int64')
+    return index
+
+
+def plan_delta(batch, job_index):
+    """Batch'i mevcut index'e karşı sınıflandırır
+
+    Returns:
+        dict: delta (dönüştürülecek satırlar), job_ids, row_hashes (delta için)
+        ve new / changed / unchanged / duplicate_in_batch / missing_id sayıları
+    """
+    job_ids = normalize_job_ids(batch[JOB_ID_COLUMN])
+    has_id = job_ids.notna().to_numpy()
+
+    # Batch içi tekrarlar: aynı job id için son gözlem geçerli
+    duplicated = (job_ids.duplicated(keep='last') & job_ids.notna()).to_numpy()
+    keep = has_id & ~duplicated
+
+    candidates = batch.loc[keep]
+    candidate_ids = job_ids[keep]
+    hashes = compute_row_hashes(candidates)
+
+    positions = job_index.index.get_indexer(candidate_ids.astype('int64'))
+    is_new = positions < 0
+    stored_hashes = np.zeros(len(positions), dtype='uint64')
+    stored_hashes[~is_new] = job_index[ROW_HASH_COLUMN].to_numpy()[positions[~is_new]]
+    is_changed = ~is_new & (stored_hashes != hashes.to_numpy())
+
+    in_delta = is_new | is_changed
+    return {
+        'delta': candidates.loc[in_delta],
+        'job_ids': candidate_ids[in_delta],
+        'row_hashes': hashes[in_delta],
+        'new': int(is_new.sum()),
+        'changed': int(is_changed.sum()),
+        'unchanged': int((~in_delta).sum()),
+        'duplicate_in_batch': int(duplicated.sum()),
+        'missing_id': int((~has_id).sum())
+    }
+
+
+def _unwrap_transform_result(df, result, name):
+    """Dönüşümlerin farklı dönüş şekillerini DataFrame'e indirger"""
+    if isinstance(result, tuple):
+        result = result[0]
+    if isinstance(result, pd.DataFrame):
+        return result
+    if isinstance(result, dict) and result.get('success', True):
+        # In-place çalışan adımlar (ör. investment category) özet dict döner
+        return df
+    raise RuntimeError(f"{name} dönüşümü başarısız oldu")
+
+
+def run_transforms(df, transforms=INCREMENTAL_TRANSFORMS, quiet=True):
+    """Dönüşümleri sırayla uygular (quiet=True iken adımların çıktısı bastırılır)
+
+    Varsayılan zincirde eksik kaynak sütunlar önce NA ile eklenir; böylece
+    step-2 veya ham batch'lerde adımlar sütun yokluğu yüzünden durmaz.
+    """
+    if transforms is INCREMENTAL_TRANSFORMS:
+        df = ensure_source_columns(df)
+    for module_name, function_name in transforms:
+        func = getattr(importlib.import_module(module_name), function_name)
+        redirect = contextlib.redirect_stdout(io.StringIO()) if quiet else contextlib.nullcontext()
+        with redirect:
+            result = func(df)
+        df = _unwrap_transform_result(df, result, function_name)
+    return df
+
+
+def upsert_delta(transformed, job_ids, row_hashes, store_dir=STORE_DIR, job_index=None):
+    """Dönüştürülmüş delta'yı yeni part olarak yazar ve index'i günceller
+
+    Returns:
+        int: yazılan part numarası (delta boşsa None)
+    """
+    if len(transformed) == 0:
+        return None
+
+    os.makedirs(store_dir, exist_ok=True)
+    if job_index is None:
+        job_index = load_job_index(store_dir)
+
+    parts = _part_paths(store_dir)
+    part = int(os.path.basename(parts[-1])[5:10]) + 1 if parts else 1
+
+    output = transformed.assign(**{PART_COLUMN: part})
+    output.to_parquet(os.path.join(store_dir, f'part-{part:05d}.parquet'), index=False)
+
+    delta_index = pd.DataFrame({
+        ROW_HASH_COLUMN: row_hashes.to_numpy(),
+        PART_COLUMN: np.full(len(job_ids), part, dtype='int64')
+    }, index=pd.Index(job_ids.to_numpy(), dtype='Int64', name=JOB_ID_COLUMN))
+
+    updated = pd.concat([job_index.drop(index=delta_index.index, errors='ignore'), delta_index])
+    updated.to_parquet(os.path.join(store_dir, INDEX_FILE))
+    return part
+
+
+def incremental_ingest(batch, store_dir=STORE_DIR, transforms=INCREMENTAL_TRANSFORMS, quiet=True):
+    """Ham batch'i store'a incremental olarak ekler
+
+    Returns:
+        dict: plan sayıları + transformed_rows ve part
+    """
+    job_index = load_job_index(store_dir)
+    plan = plan_delta(batch, job_index)
+
+    transformed = plan['delta']
+    if len(transformed) > 0:
+        transformed = run_transforms(transformed.copy(), transforms=transforms, quiet=quiet)
+
+    part = upsert_delta(transformed, plan['job_ids'], plan['row_hashes'],
+                        store_dir=store_dir, job_index=job_index)
+
+    summary = {key: value for key, value in plan.items() if key not in ('delta', 'job_ids', 'row_hashes')}
+    summary['transformed_rows'] = len(transformed)
+    summary['part'] = part
+    return summary
+
+
+def load_store(store_dir=STORE_DIR):
+    """Store'un güncel görünümü: her job id için en yeni part'taki satır"""
+    parts = _part_paths(store_dir)
+    if not parts:
+        return pd.DataFrame()
+
+    snapshot = pd.concat([pd.read_parquet(path) for path in parts], ignore_index=True)
+    job_ids = normalize_job_ids(snapshot[JOB_ID_COLUMN])
+    superseded = job_ids.duplicated(keep='last') & job_ids.notna()
+    return snapshot.loc[~superseded.to_numpy()].drop(columns=[PART_COLUMN]).reset_index(drop=True)
+
+
+def compact_store(store_dir=STORE_DIR):
+    """Tüm part'ları güncel görünümle tek part'a indirger"""
+    parts = _part_paths(store_dir)
+    if len(parts) <= 1:
+        return len(parts)
+
+    snapshot = load_store(store_dir)
+    job_index = load_job_index(store_dir)
+    compacted_part = int(os.path.basename(parts[-1])[5:10])
+
+    snapshot.assign(**{PART_COLUMN: compacted_part}).to_parquet(
+        os.path.join(store_dir, f'part-{compacted_part:05d}.parquet'), index=False
+    )
+    for path in parts[:-1]:
+        os.remove(path)
+
+    job_index[PART_COLUMN] = compacted_part
+    job_index.to_parquet(os.path.join(store_dir, INDEX_FILE))
+    return 1
+
+
+def main():
+    """Ham batch CSV'sini store'a incremental olarak ekler"""
+
+    print("🔄 LinkedIn Jobs Dataset - Incremental Ingest")
+    print("=" * 60)
+
+    batch_file = sys.argv[1] if len(sys.argv) > 1 else 'linkedin_jobs_dataset_optimized_step2.csv'
+    store_dir = sys.argv[2] if len(sys.argv) > 2 else STORE_DIR
+
+    try:
+        batch = read_projected_csv(batch_file, default_projection())
+        print(f"✅ Batch yüklendi: {batch_file} ({len(batch):,} satır, {len(batch.columns)} sütun)")
+        print()
+    except Exception as e:
+        print(f"❌ HATA: Batch yüklenemedi - {e}")
+        return
+
+    try:
+        summary = incremental_ingest(batch, store_dir=store_dir)
+    except Exception as e:
+        print(f"❌ HATA: Incremental ingest başarısız - {e}")
+        return
+
+    print(f"📊 DELTA PLANI:")
+    print(f"   🆕 Yeni job: {summary['new']:,}")
+    print(f"   ✏️ Değişmiş job: {summary['changed']:,}")
+    print(f"   ⏭️ Değişmemiş (atlandı): {summary['unchanged']:,}")
+    print(f"   🔁 Batch içi tekrar: {summary['duplicate_in_batch']:,}")
+    print(f"   ❓ Job id'siz satır: {summary['missing_id']:,}")
+    print()
+    print(f"🔧 Dönüştürülen satır: {summary['transformed_rows']:,}")
+    if summary['part'] is not None:
+        print(f"💾 Yazılan part: {store_dir}/part-{summary['part']:05d}.parquet")
+    else:
+        print("✅ Store güncel - yazılacak delta yok")
+
+if __name__ == "__main__":
+    main()
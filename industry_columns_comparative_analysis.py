@@ -10,6 +10,8 @@ import numpy as np
 from collections import Counter
 import re
 import warnings
+from sampling import (DEFAULT_SAMPLE_SIZE, format_ci, sample_seed, strata_column, strata_values,
+                      stratified_proportion, stratified_sample)
 warnings.filterwarnings('ignore')
 
 def analyze_industry_columns_comparative(df):
@@ -189,28 +191,29 @@ def analyze_industry_columns_comparative(df):
     print("🎯 4. RECORD-LEVEL DATA COMPARISON")
     print("-" * 35)
     
-    # Sample records comparison
-    sample_size = min(100, len(df))
-    sample_df = df[existing_columns].head(sample_size)
-    
-    identical_records = 0
-    partial_matches = 0
-    
-    for idx, row in sample_df.iterrows():
-        non_null_values = [str(val).strip().lower() for val in row.dropna()]
-        unique_non_null = set(non_null_values)
-        
-        if len(non_null_values) > 1:
-            if len(unique_non_null) == 1:
-                identical_records += 1
-            elif len(unique_non_null) < len(non_null_values):
-                partial_matches += 1
-    
-    print(f"📊 Sample analysis ({sample_size} records):")
-    print(f"   🔄 Completely identical records: {identical_records}")
-    print(f"   ⚡ Partial match records: {partial_matches}")
-    print(f"   📈 Complete duplication rate: {(identical_records/sample_size)*100:.1f}%")
-    print(f"   📈 Partial duplication rate: {(partial_matches/sample_size)*100:.1f}%")
+    # Seed'li, industry katmanlı örnek (dosya sırasına bağlı head() yerine)
+    strata = strata_column(df, 'industry') or existing_columns[0]
+    sample_columns = list(dict.fromkeys(existing_columns + [strata]))
+    sample_df, design = stratified_sample(df[sample_columns], strata_values(df, strata), DEFAULT_SAMPLE_SIZE)
+    sample_size = len(sample_df)
+    
+    normalized = pd.DataFrame({
+        col: sample_df[col].astype('string').str.strip().str.lower() for col in existing_columns
+    })
+    non_null_counts = normalized.notna().sum(axis=1)
+    unique_counts = normalized.nunique(axis=1)
+    multi_valued = non_null_counts > 1
+    identical_mask = multi_valued & (unique_counts == 1)
+    partial_mask = multi_valued & (unique_counts > 1) & (unique_counts < non_null_counts)
+    
+    identical_estimate = stratified_proportion(identical_mask, design)
+    partial_estimate = stratified_proportion(partial_mask, design)
+    
+    print(f"📊 Sample analysis ({sample_size} records, {len(design['labels'])} katman: {strata}, seed {sample_seed()}):")
+    print(f"   🔄 Completely identical records: {int(identical_mask.sum())}")
+    print(f"   ⚡ Partial match records: {int(partial_mask.sum())}")
+    print(f"   📈 Complete duplication rate: {format_ci(identical_estimate)}")
+    print(f"   📈 Partial duplication rate: {format_ci(partial_estimate)}")
     print()
     
     # 5. FORMAT TUTARSIZLIKLARI
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+LinkedIn Jobs Dataset - Ingest Projection Pushdown
+Final dataset'te kalan sütun listesini, türetilmiş sütunların ham kaynak
+bağımlılıklarıyla (ör. contentSource → job_investment_type) birlikte ham
+path kümesine genişletir. Ingest katmanı bu kümenin dışındaki her path'i
+okuma sırasında atlar:
+
+- raw_json_ingest: JSON kaydının gereksiz alt ağaçlarına hiç inilmez,
+  sütun listesi / batch oluşturulmaz
+- incremental_ingest: read_csv(usecols=...) ile yalnızca gerekli sütunlar
+  parse edilir
+
+Böylece delete_*.py adımlarının sildiği sütunlar (preDashFollowingInfoUrn,
+entityUrn, workRemoteAllowed, link, ...) parse, bellek ve stepN I/O maliyeti
+oluşturmaz. PIPELINE_PROJECTION=0 projeksiyonu kapatır.
+"""
+
+import os
+
+from schema_validator import FINAL_DELETED_COLUMNS, PIPELINE_STEPS, read_columns
+
+PROJECTION_ENV = 'PIPELINE_PROJECTION'
+FINAL_DATASET_CSV = 'fixed_all_company_colums.csv'
+JOB_ID_COLUMN = 'id'
+
+INDUSTRY_SOURCE_COLUMNS = ['formattedIndustries/0', 'formattedIndustries/1', 'formattedIndustries/2',
+                           'company/industry/0']
+EXPIRE_SOURCE_COLUMNS = ['expireAt']
+
+# Türetilmiş sütun → oluşturulurken okunan sütunlar (zincirler çözülür)
+DERIVED_COLUMN_SOURCES = {
+    'industries_consolidated': INDUSTRY_SOURCE_COLUMNS,
+    'company_logo_url': ['company/logo', 'companyLogo'],
+    'has_company_logo': ['company_logo_url'],
+    'job_investment_type': ['contentSource'],
+    'job_urgency_level': EXPIRE_SOURCE_COLUMNS,
+    'job_urgency_category': EXPIRE_SOURCE_COLUMNS,
+    'optimal_application_window': EXPIRE_SOURCE_COLUMNS,
+    'expire_month': EXPIRE_SOURCE_COLUMNS,
+    'expire_quarter': EXPIRE_SOURCE_COLUMNS,
+    'expire_day_of_week': EXPIRE_SOURCE_COLUMNS,
+    'expire_season': EXPIRE_SOURCE_COLUMNS,
+    'is_business_day': EXPIRE_SOURCE_COLUMNS,
+    'is_month_end': EXPIRE_SOURCE_COLUMNS,
+    'is_quarter_end': EXPIRE_SOURCE_COLUMNS,
+    'job_functions_combined': ['formattedJobFunctions/0', 'formattedJobFunctions/1', 'formattedJobFunctions/2'],
+}
+
+
+def projection_enabled():
+    return os.environ.get(PROJECTION_ENV, '1') != '0'
+
+
+def resolve_projection(columns):
+    """Final sütun listesini ham path projeksiyonuna genişletir
+
+    Returns:
+        dict: 'paths' (okunacak sütun / path'ler, job id dahil) ve
+        'prefixes' (bu path'lere giden ara JSON düğümleri: 'company',
+        'company/industry', ...)
+    """
+    paths = set()
+    pending = list(columns) + [JOB_ID_COLUMN]
+    while pending:
+        column = pending.pop()
+        if column in paths:
+            continue
+        paths.add(column)
+        pending.extend(DERIVED_COLUMN_SOURCES.get(column, []))
+
+    prefixes = set()
+    for path in paths:
+        parts = path.split('/')
+        for end in range(1, len(parts)):
+            prefixes.add('/'.join(parts[:end]))
+
+    return {'paths': frozenset(paths), 'prefixes': frozenset(prefixes)}
+
+
+def raw_projection_columns(projection):
+    """Projeksiyondaki ham sütunlar (türetilmiş sütunlar hariç, sıralı)
+
+    Ham batch'ler bu listeye reindex edilir: hiçbir kayıtta bulunmayan path'ler
+    de NA sütun olarak batch şemasında yer alır.
+    """
+    return sorted(path for path in projection['paths'] if path not in DERIVED_COLUMN_SOURCES)
+
+
+def retained_columns_from_file(path=FINAL_DATASET_CSV):
+    """Final dataset'in sütunları (yalnızca header / Parquet schema okunur)"""
+    return read_columns(path)
+
+
+def default_projection(final_path=FINAL_DATASET_CSV):
+    """Final dataset mevcutsa ve projeksiyon kapatılmamışsa onun projeksiyonu, değilse None"""
+    if not projection_enabled() or not os.path.exists(final_path):
+        return None
+    return resolve_projection(retained_columns_from_file(final_path))
+
+
+def pipeline_deleted_columns():
+    """Pipeline boyunca silinen ham sütunlar (projeksiyon raporu için)"""
+    deleted = []
+    for _, _, step_deleted in PIPELINE_STEPS:
+        deleted.extend(step_deleted)
+    deleted.extend(FINAL_DELETED_COLUMNS)
+    return list(dict.fromkeys(deleted))
+
+
+def read_projected_csv(path, projection=None):
+    """CSV'yi yalnızca projeksiyondaki sütunlarla okur (projection None → tüm sütunlar)"""
+    from fast_loader import read_csv_fast
+
+    if projection is None:
+        return read_csv_fast(path)
+    paths = projection['paths']
+    return read_csv_fast(path, usecols=lambda column: column in paths)
+
+
+def main():
+    """Final dataset'ten projeksiyon raporu"""
+
+    print("✂️ LinkedIn Jobs Dataset - Ingest Projection")
+    print("=" * 60)
+
+    try:
+        retained = retained_columns_from_file()
+    except Exception as e:
+        print(f"❌ HATA: Final dataset header okunamadı - {e}")
+        return
+
+    projection = resolve_projection(retained)
+    deleted = pipeline_deleted_columns()
+    skipped = [column for column in deleted if column not in projection['paths']]
+    kept_sources = [column for column in deleted if column in projection['paths']]
+
+    print(f"📋 Final sütun: {len(retained)} | Okunacak path: {len(projection['paths'])}")
+    print(f"⏭️ Ingest sırasında atlanan silinmiş sütunlar ({len(skipped)}):")
+    for column in skipped:
+        print(f"   • {column}")
+    print(f"🔗 Türetilmiş sütun kaynağı olarak okunanlar ({len(kept_sources)}):")
+    for column in kept_sources:
+        print(f"   • {column}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+LinkedIn Jobs Dataset - Job ID Extraction Index
+URL taşıyan tüm sütunlardan tek vektörel geçişte int64 job id sütunu üretir
+ve job id → satır hash index'i kurar.
+
+Bu index ile:
+- link ↔ id redundancy ispatı (satır satır re.search yerine) tam sütunda,
+- scrape batch'leri arasında join,
+- ilan bazında dedup
+O(N) vektörel işlemler olarak yapılır.
+"""
+
+import numpy as np
+import pandas as pd
+
+from url_vectorized import extract_url_job_ids
+
+JOB_ID_COLUMN = 'id'
+LINKEDIN_JOB_URL_TEMPLATE = 'https://www.linkedin.com/jobs/view/{id}'
+
+
+def find_url_columns(df):
+    """Job id taşıyabilecek URL sütunlarını isimden tespit eder"""
+    return [col for col in df.columns if 'link' in col.lower() or 'url' in col.lower()]
+
+
+def normalize_job_ids(series):
+    """id sütununu (int, float veya string olabilir) nullable Int64'e çevirir"""
+    return pd.to_numeric(series, errors='coerce').astype('Int64')
+
+
+def _column_job_ids(series):
+    """Tek URL sütununun job id'leri; tamamen boş sütun (read_csv'de float64) parse edilmez"""
+    if series.isna().all():
+        return pd.Series(pd.NA, index=series.index, dtype='Int64')
+    return extract_url_job_ids(series)
+
+
+def extract_job_ids(df, columns=None):
+    """URL sütunlarından job id çıkarır
+
+    Her sütun kendi içinde benzersiz değerler üzerinden parse edilir (tamamen
+    boş sütunlar atlanır);
+    sonuç sütunların ilk dolu değeriyle tek bir Int64 sütunda birleştirilir.
+
+    Returns:
+        (job_ids, per_column): job_ids birleşik Int64 Series,
+        per_column ise sütun bazında çıkarılan Int64 DataFrame'i.
+    """
+    columns = find_url_columns(df) if columns is None else list(columns)
+    per_column = pd.DataFrame(
+        {col: _column_job_ids(df[col]) for col in columns},
+        index=df.index
+    )
+
+    if per_column.shape[1] == 0:
+        return pd.Series(pd.NA, index=df.index, dtype='Int64', name='url_job_id'), per_column
+
+    job_ids = per_column.bfill(axis=1).iloc[:, 0].astype('Int64')
+    job_ids.name = 'url_job_id'
+    return job_ids, per_column
+
+
+def build_job_id_index(job_ids):
+    """job id → ilk satır pozisyonu hash index'i
+
+    Returns:
+        dict: 'index' (pd.Series, index=job id, değer=satır pozisyonu),
+        'duplicate_ids' (birden fazla satırda geçen id'ler),
+        'null_count' (id'si olmayan satır sayısı)
+    """
+    job_ids = normalize_job_ids(job_ids)
+    values = job_ids.to_numpy(dtype='float64', na_value=np.nan)
+    valid = ~np.isnan(values)
+
+    positions = np.flatnonzero(valid)
+    keys = values[valid].astype(np.int64)
+
+    duplicated = pd.Index(keys).duplicated(keep='first')
+    index = pd.Series(positions[~duplicated], index=pd.Index(keys[~duplicated], name='job_id'), name='row')
+
+    return {
+        'index': index,
+        'duplicate_ids': np.unique(keys[duplicated]),
+        'null_count': int((~valid).sum())
+    }
+
+
+def lookup_rows(job_index, job_ids):
+    """Verilen job id'lerin satır pozisyonları (bulunamayanlar -1)"""
+    keys = normalize_job_ids(pd.Series(job_ids)).to_numpy(dtype='float64', na_value=np.nan)
+    positions = np.full(len(keys), -1, dtype=np.int64)
+    valid = ~np.isnan(keys)
+    indexer = job_index['index'].index.get_indexer(keys[valid].astype(np.int64))
+    found = indexer >= 0
+    valid_positions = np.full(len(indexer), -1, dtype=np.int64)
+    valid_positions[found] = job_index['index'].to_numpy()[indexer[found]]
+    positions[valid] = valid_positions
+    return positions
+
+
+def verify_url_id_redundancy(df, url_column='link', id_column=JOB_ID_COLUMN,
+                             template=LINKEDIN_JOB_URL_TEMPLATE):
+    """URL sütununun id sütunundan türetilebilirliğini tam sütunda doğrular
+
+    Returns:
+        dict: checked, matched, mismatched, unparsed, mapping_rate,
+        derivable (template ile birebir string eşleşme) ve derivation_rate
+    """
+    url_ids = _column_job_ids(df[url_column])
+    ids = normalize_job_ids(df[id_column])
+
+    has_url = df[url_column].notna()
+    parsed = url_ids.notna()
+    comparable = parsed & ids.notna()
+
+    matched = int((url_ids[comparable] == ids[comparable]).sum())
+    checked = int(comparable.sum())
+
+    derived_urls = template.replace('{id}', '') + ids.astype('string')
+    derivable = (df[url_column].astype('string').str.strip() == derived_urls).fillna(False)
+    url_count = int(has_url.sum())
+
+    return {
+        'url_count': url_count,
+        'checked': checked,
+        'matched': matched,
+        'mismatched': checked - matched,
+        'unparsed': int((has_url & ~parsed).sum()),
+        'mapping_rate': (matched / checked * 100) if checked > 0 else 0.0,
+        'derivable': int(derivable.sum()),
+        'derivation_rate': (int(derivable.sum()) / url_count * 100) if url_count > 0 else 0.0
+    }
+
+
+def dedup_by_job_id(df, job_ids=None, keep='last'):
+    """İlan bazında dedup (job id'siz satırlar korunur)"""
+    job_ids = normalize_job_ids(df[JOB_ID_COLUMN] if job_ids is None else job_ids)
+    duplicated = job_ids.duplicated(keep=keep) & job_ids.notna()
+    return df.loc[~duplicated.to_numpy()]
+
+
+def join_batches_on_job_id(left, right, how='inner', suffixes=('_old', '_new')):
+    """İki scrape batch'ini job id üzerinden (Int64 key) birleştirir"""
+    left_keyed = left.assign(_job_key=normalize_job_ids(left[JOB_ID_COLUMN]))
+    right_keyed = right.assign(_job_key=normalize_job_ids(right[JOB_ID_COLUMN]))
+    merged = left_keyed.merge(right_keyed, on='_job_key', how=how, suffixes=suffixes)
+    return merged.drop(columns=['_job_key'])
+
+
+def main():
+    """URL → job id index özeti"""
+
+    print("🆔 LinkedIn Jobs Dataset - Job ID Extraction Index")
+    print("=" * 60)
+
+    try:
+        df = pd.read_csv('linkedin_jobs_cleaned_no_redundant_workplace.csv')
+        print(f"✅ Dataset yüklendi: {len(df):,} satır, {len(df.columns)} sütun")
+        print()
+    except Exception as e:
+        print(f"❌ HATA: Dataset yüklenemedi - {e}")
+        return
+
+    job_ids, per_column = extract_job_ids(df)
+    print(f"🔗 URL sütunları: {list(per_column.columns)}")
+    for col in per_column.columns:
+        print(f"   📋 {col}: {per_column[col].notna().sum():,} job id çıkarıldı")
+
+    job_index = build_job_id_index(job_ids)
+    print(f"\n📊 Job ID Index:")
+    print(f"   🎯 Benzersiz job id: {len(job_index['index']):,}")
+    print(f"   🔁 Tekrarlanan job id: {len(job_index['duplicate_ids']):,}")
+    print(f"   ❓ Job id'siz satır: {job_index['null_count']:,}")
+
+    if 'link' in df.columns and JOB_ID_COLUMN in df.columns:
+        proof = verify_url_id_redundancy(df)
+        print(f"\n🔍 link ↔ id redundancy (tam sütun):")
+        print(f"   📊 Karşılaştırılan: {proof['checked']:,}")
+        print(f"   ✅ Eşleşen: {proof['matched']:,} (%{proof['mapping_rate']:.2f})")
+        print(f"   🧪 Template ile türetilebilir: {proof['derivable']:,} (%{proof['derivation_rate']:.2f})")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+LinkedIn Jobs Dataset - Lazy Query Layer
+Final dataset'in Parquet kopyası üzerinde lazy sorgu katmanı.
+
+Sorgular bir plan dict'i olarak kurulur (scan_jobs → filter_* → select)
+ve yalnızca collect / count_by / crosstab çağrıldığında çalıştırılır:
+- Polars kuruluysa plan pl.scan_parquet LazyFrame'ine çevrilir
+  (predicate + projection pushdown Polars optimizer'ında).
+- Değilse pandas fallback'i pd.read_parquet(columns=..., filters=...) kullanır;
+  pyarrow filtreleri row group min/max istatistikleriyle ilgisiz row group'ları
+  okumadan atlar, columns ise yalnızca gereken sütunları okur.
+
+Her rapor yalnızca ihtiyaç duyduğu sütunları ve row group'ları okur.
+Filtreler pyarrow DNF formatındadır: (column, op, value).
+
+Ara pipeline CSV'leri üzerinde çalışan raporlar scan_csv kullanır: CSV bir
+kez yanındaki Parquet cache'ine çevrilir (CSV değişince yenilenir), sonraki
+çalıştırmalar yalnızca gereken sütunları okur.
+"""
+
+import os
+import sys
+
+import pandas as pd
+
+from mmap_dataset import is_cache_fresh, read_csv_table
+
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+FINAL_DATASET_CSV = 'fixed_all_company_colums.csv'
+FINAL_DATASET_PARQUET = 'linkedin_jobs_final.parquet'
+ROW_GROUP_SIZE = 50_000
+
+# Domain sütunları
+URGENCY_COLUMN = 'job_urgency_level'
+INVESTMENT_COLUMN = 'job_investment_type'
+WORKPLACE_COLUMN = 'jobWorkplaceTypes/0/localizedName'
+INDUSTRY_COLUMN = 'industries_consolidated'
+JOB_FUNCTIONS_COLUMN = 'job_functions_combined'
+EXPIRE_COLUMN = 'expireAt'
+
+TECH_FUNCTIONS_REGEX = 'Information Technology|Engineering'
+
+PUSHDOWN_OPS = ('==', '!=', '<', '<=', '>', '>=', 'in', 'not in')
+
+
+def export_final_parquet(csv_path=FINAL_DATASET_CSV, parquet_path=FINAL_DATASET_PARQUET,
+                         sort_by=EXPIRE_COLUMN, row_group_size=ROW_GROUP_SIZE):
+    """Final CSV'yi Parquet'e çevirir
+
+    expireAt'e göre sıralanarak yazılır; böylece tarih aralığı filtreleri
+    row group istatistikleriyle budanabilir. Düşük kardinaliteli domain
+    sütunları category olarak saklanır.
+    """
+    df = pd.read_csv(csv_path)
+
+    if EXPIRE_COLUMN in df.columns:
+        if pd.api.types.is_numeric_dtype(df[EXPIRE_COLUMN]):
+            df[EXPIRE_COLUMN] = pd.to_datetime(df[EXPIRE_COLUMN], unit='ms')
+        else:
+            df[EXPIRE_COLUMN] = pd.to_datetime(df[EXPIRE_COLUMN], errors='coerce')
+
+    for col in (URGENCY_COLUMN, INVESTMENT_COLUMN, WORKPLACE_COLUMN):
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+
+    if sort_by in df.columns:
+        df = df.sort_values(sort_by, kind='stable').reset_index(drop=True)
+
+    df.to_parquet(parquet_path, index=False, row_group_size=row_group_size)
+    return parquet_path
+
+
+def parquet_cache_path(csv_path):
+    """'dataset.csv' → 'dataset.parquet'"""
+    root, _ = os.path.splitext(csv_path)
+    return root + '.parquet'
+
+
+def export_parquet_cache(csv_path, parquet_path=None, row_group_size=ROW_GROUP_SIZE):
+    """CSV'yi tip dönüşümü yapmadan Parquet'e çevirir (karışık tipli sütunlar string)"""
+    import pyarrow.parquet as pq
+
+    parquet_path = parquet_path or parquet_cache_path(csv_path)
+    tmp_path = f'{parquet_path}.tmp-{os.getpid()}'
+    try:
+        pq.write_table(read_csv_table(csv_path), tmp_path, row_group_size=row_group_size)
+        os.replace(tmp_path, parquet_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return parquet_path
+
+
+def scan_csv(csv_path, backend=None):
+    """CSV için lazy plan: Parquet cache yoksa veya bayatsa önce üretilir"""
+    parquet_path = parquet_cache_path(csv_path)
+    if not is_cache_fresh(csv_path, parquet_path):
+        export_parquet_cache(csv_path, parquet_path)
+    return scan_jobs(parquet_path, backend=backend)
+
+
+def dataset_columns(plan):
+    """Plan kaynağının sütunları (yalnızca Parquet footer'ı okunur)"""
+    import pyarrow.parquet as pq
+
+    return list(pq.read_schema(plan['path']).names)
+
+
+def scan_jobs(path=FINAL_DATASET_PARQUET, backend=None):
+    """Lazy sorgu planı başlatır (backend: 'polars' / 'pandas', None → otomatik)"""
+    if backend is None:
+        backend = 'polars' if pl is not None else 'pandas'
+    if backend == 'polars' and pl is None:
+        raise ImportError("polars backend için polars gerekli")
+    return {'path': path, 'backend': backend, 'filters': [], 'columns': None}
+
+
+def where(plan, column, op, value):
+    """Plana (column, op, value) predicate'i ekler
+
+    op PUSHDOWN_OPS'tan biri veya 'contains' olabilir; 'contains'
+    row group istatistikleriyle budanamaz ve okuma sonrası uygulanır.
+    """
+    if op not in PUSHDOWN_OPS and op != 'contains':
+        raise ValueError(f"Desteklenmeyen operatör: {op}")
+    if op in ('in', 'not in'):
+        value = list(value)
+    return {**plan, 'filters': plan['filters'] + [(column, op, value)]}
+
+
+def select(plan, columns):
+    """Projection: yalnızca verilen sütunlar okunur"""
+    return {**plan, 'columns': list(dict.fromkeys(columns))}
+
+
+def select_available(plan, columns):
+    """Projection: verilen sütunlardan kaynakta bulunanlar (opsiyonel sütunlu raporlar için)"""
+    available = set(dataset_columns(plan))
+    return select(plan, [col for col in columns if col in available])
+
+
+def filter_urgency(plan, levels):
+    return where(plan, URGENCY_COLUMN, 'in', [levels] if isinstance(levels, str) else levels)
+
+
+def filter_investment(plan, investment_types):
+    return where(plan, INVESTMENT_COLUMN, 'in',
+                 [investment_types] if isinstance(investment_types, str) else investment_types)
+
+
+def filter_workplace(plan, workplace_types):
+    return where(plan, WORKPLACE_COLUMN, 'in',
+                 [workplace_types] if isinstance(workplace_types, str) else workplace_types)
+
+
+def filter_industry(plan, industry):
+    """industries_consolidated 'A | B' çoklu değer olduğundan substring eşleşmesi"""
+    return where(plan, INDUSTRY_COLUMN, 'contains', industry)
+
+
+def filter_expiring_between(plan, start=None, end=None):
+    """expireAt aralığı (row group pruning'e uygun)"""
+    if start is not None:
+        plan = where(plan, EXPIRE_COLUMN, '>=', pd.Timestamp(start))
+    if end is not None:
+        plan = where(plan, EXPIRE_COLUMN, '<', pd.Timestamp(end))
+    return plan
+
+
+def _required_columns(plan, extra=()):
+    if plan['columns'] is None and not extra:
+        return None
+    columns = list(plan['columns'] or []) + list(extra)
+    columns += [column for column, _, _ in plan['filters']]
+    return list(dict.fromkeys(columns))
+
+
+def _polars_predicate(column, op, value):
+    expr = pl.col(column)
+    if op == 'contains':
+        return expr.cast(pl.Utf8).str.contains(value, literal=True)
+    if op == 'in':
+        return expr.cast(pl.Utf8).is_in([str(v) for v in value]) if _is_text(value) else expr.is_in(value)
+    if op == 'not in':
+        return ~(expr.cast(pl.Utf8).is_in([str(v) for v in value]) if _is_text(value) else expr.is_in(value))
+    return {
+        '==': expr == value, '!=': expr != value,
+        '<': expr < value, '<=': expr <= value,
+        '>': expr > value, '>=': expr >= value
+    }[op]
+
+
+def _is_text(values):
+    return all(isinstance(v, str) for v in values)
+
+
+def _collect_polars(plan, columns):
+    lazy = pl.scan_parquet(plan['path'])
+    for column, op, value in plan['filters']:
+        lazy = lazy.filter(_polars_predicate(column, op, value))
+    if columns is not None:
+        lazy = lazy.select(columns)
+    return lazy.collect().to_pandas()
+
+
+def _collect_pandas(plan, columns):
+    pushdown = [(c, '=' if op == '==' else op, v) for c, op, v in plan['filters'] if op != 'contains']
+    df = pd.read_parquet(plan['path'], columns=columns, filters=pushdown or None)
+
+    for column, op, value in plan['filters']:
+        if op == 'contains':
+            df = df[df[column].astype('string').str.contains(value, regex=False, na=False)]
+    return df
+
+
+def collect(plan, extra_columns=()):
+    """Planı çalıştırır ve pandas DataFrame döndürür"""
+    columns = _required_columns(plan, extra_columns)
+    if plan['backend'] == 'polars':
+        df = _collect_polars(plan, columns)
+    else:
+        df = _collect_pandas(plan, columns)
+
+    if plan['columns'] is not None:
+        df = df[list(dict.fromkeys(plan['columns'] + list(extra_columns)))]
+    return df.reset_index(drop=True)
+
+
+def count_by(plan, by, normalize=False):
+    """Gruplara göre satır sayısı (yalnızca by sütunları okunur)"""
+    by = [by] if isinstance(by, str) else list(by)
+    if plan['backend'] == 'polars':
+        lazy = pl.scan_parquet(plan['path'])
+        for column, op, value in plan['filters']:
+            lazy = lazy.filter(_polars_predicate(column, op, value))
+        counts = lazy.group_by(by).agg(pl.len().alias('count')).collect().to_pandas()
+        counts = counts.set_index(by)['count'].sort_values(ascending=False)
+    else:
+        df = collect(select(plan, by))
+        counts = df.value_counts(subset=by) if len(by) > 1 else df[by[0]].value_counts()
+        counts = counts[counts > 0]
+
+    counts.name = 'count'
+    if normalize:
+        counts = counts / counts.sum() * 100
+    return counts
+
+
+def crosstab(plan, index, columns, normalize=False):
+    """İki sütunun crosstab'ı (yalnızca bu iki sütun okunur)"""
+    df = collect(select(plan, [index, columns]))
+    return pd.crosstab(df[index], df[columns], normalize=normalize)
+
+
+def mean_by(plan, by, value):
+    """Gruplara göre ortalama"""
+    df = collect(select(plan, [by, value]))
+    return df.groupby(by, observed=True)[value].mean().sort_values(ascending=False)
+
+
+# Domain raporları
+def urgency_distribution(plan):
+    return count_by(plan, URGENCY_COLUMN)
+
+
+def investment_by_urgency(plan, normalize=False):
+    """create_urgency_categories'teki investment × urgency crosstab'ı"""
+    return crosstab(plan, INVESTMENT_COLUMN, URGENCY_COLUMN, normalize=normalize)
+
+
+def workplace_by_investment(plan, normalize=False):
+    return crosstab(plan, WORKPLACE_COLUMN, INVESTMENT_COLUMN, normalize=normalize)
+
+
+def days_to_expire_by_investment(plan, now=None):
+    """analyze_investment_vs_expiry'deki yatırım tipi bazında ortalama kalan gün"""
+    df = collect(select(plan, [INVESTMENT_COLUMN, EXPIRE_COLUMN]))
+    now = pd.Timestamp.now() if now is None else pd.Timestamp(now)
+    days = (pd.to_datetime(df[EXPIRE_COLUMN]) - now).dt.days
+    return days.groupby(df[INVESTMENT_COLUMN], observed=True).agg(['mean', 'count'])
+
+
+def tech_functions_by_investment(plan):
+    """advanced_job_functions_insights'taki yatırım tipi × IT/Engineering crosstab'ı"""
+    df = collect(select(plan, [INVESTMENT_COLUMN, JOB_FUNCTIONS_COLUMN]))
+    is_tech = df[JOB_FUNCTIONS_COLUMN].astype('string').str.contains(TECH_FUNCTIONS_REGEX, na=False)
+    return pd.crosstab(df[INVESTMENT_COLUMN], is_tech)
+
+
+def main():
+    """Final dataset üzerinde lazy domain raporları"""
+
+    print("🦥 LinkedIn Jobs Dataset - Lazy Query Layer")
+    print("=" * 60)
+
+    parquet_path = sys.argv[1] if len(sys.argv) > 1 else FINAL_DATASET_PARQUET
+
+    if not os.path.exists(parquet_path):
+        try:
+            print(f"🔄 {FINAL_DATASET_CSV} → {parquet_path} dönüştürülüyor...")
+            export_final_parquet(FINAL_DATASET_CSV, parquet_path)
+        except Exception as e:
+            print(f"❌ HATA: Parquet oluşturulamadı - {e}")
+            return
+
+    jobs = scan_jobs(parquet_path)
+    print(f"✅ Backend: {jobs['backend']} | Kaynak: {parquet_path}")
+    print()
+
+    reports = [
+        ('🚨 Urgency dağılımı', lambda: urgency_distribution(jobs)),
+        ('💰 Investment × Urgency', lambda: investment_by_urgency(jobs)),
+        ('🏢 Workplace × Investment', lambda: workplace_by_investment(jobs)),
+        ('⏰ Investment bazında kalan gün', lambda: days_to_expire_by_investment(jobs)),
+        ('💻 Investment × IT/Engineering', lambda: tech_functions_by_investment(jobs)),
+    ]
+
+    for title, report in reports:
+        print(f"{title}:")
+        try:
+            print(report())
+        except Exception as e:
+            print(f"   ⚠️ Rapor çalıştırılamadı - {e}")
+        print()
+
+if __name__ == "__main__":
+    main()
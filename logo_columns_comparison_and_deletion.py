@@ -9,8 +9,32 @@ import pandas as pd
 import numpy as np
 from collections import Counter
 import warnings
+from pipeline_profiler import profile_step
+from schema_validator import checkpoint_gate
+from fast_loader import read_csv_fast
 warnings.filterwarnings('ignore')
 
+# Batch pipeline kararı (step4 checkpoint): companyLogo kalır ve yeniden adlandırılır, company/logo silinir
+LOGO_KEPT_COLUMN = 'companyLogo'
+LOGO_DROPPED_COLUMN = 'company/logo'
+LOGO_URL_COLUMN = 'company_logo_url'
+
+def apply_logo_column_decision(df):
+    """Step 4 kararını karşılaştırma yapmadan uygular (incremental ingest için)
+    
+    Delta batch'lerinde doluluk oranı batch'ten batch'e değiştiği için
+    compare_and_delete_logo_columns farklı sütunu seçebilir; burada batch
+    pipeline'ın sonucu sabit olarak uygulanır.
+    """
+    df = df.drop(columns=[LOGO_DROPPED_COLUMN], errors='ignore')
+    if LOGO_URL_COLUMN in df.columns:
+        return df
+    if LOGO_KEPT_COLUMN in df.columns:
+        return df.rename(columns={LOGO_KEPT_COLUMN: LOGO_URL_COLUMN})
+    df[LOGO_URL_COLUMN] = pd.Series(pd.NA, index=df.index, dtype=object)
+    return df
+
+@profile_step
 def compare_and_delete_logo_columns(df):
     """Logo sütunlarını karşılaştır ve daha az complete olanı sil"""
     
@@ -397,7 +421,7 @@ def main():
     
     # Dataset'i yükle
     try:
-        df = pd.read_csv('linkedin_jobs_dataset_optimized_step3.csv')
+        df = read_csv_fast('linkedin_jobs_dataset_optimized_step3.csv')
         print(f"✅ Dataset yüklendi: {len(df):,} satır, {len(df.columns)} sütun")
         print()
     except Exception as e:
@@ -413,6 +437,7 @@ def main():
     # Save optimized dataset
     output_filename = 'linkedin_jobs_dataset_optimized_step4.csv'
     df_optimized.to_csv(output_filename, index=False)
+    checkpoint_gate(output_filename, df_optimized)
     
     print(f"\n💾 OPTIMIZED DATASET SAVED:")
     print(f"   📁 File: {output_filename}")
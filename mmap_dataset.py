@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+LinkedIn Jobs Dataset - Memory-Mapped Read-Only Dataset Access
+Salt okunur analiz script'leri için CSV yerine Arrow IPC (Feather v2)
+dosyasını memory-map ederek açar.
+
+- CSV'nin yanına bir kez '<isim>.arrow' (sıkıştırmasız IPC) cache'i yazılır;
+  CSV daha yeniyse cache yeniden üretilir (atomic rename ile, aynı anda
+  açan script'ler yarım dosya görmez).
+- Dosya pa.memory_map ile açılır: buffer'lar OS page cache'ine bakan
+  zero-copy view'lardır. Paralel çalışan analizler aynı sayfaları paylaşır,
+  her process yalnızca dokunduğu sütunların sayfalarını yükler.
+- Varsayılan olarak sütunlar pd.ArrowDtype ile mmap'li buffer'larda kalır
+  (string ve null içeren sütunlar dahil kopya yok). Metin sütunları
+  dtype == 'object' ile değil is_string_dtype ile seçilmelidir.
+- numpy / object semantiği gereken sütunlar numpy_columns ile yalnızca
+  o sütunlar kopyalanarak çevrilir; arrow_dtypes=False tüm tabloyu çevirir.
+
+pyarrow yoksa veya PIPELINE_MMAP_DATASET=0 ise pd.read_csv'ye düşülür.
+"""
+
+import os
+import sys
+import time
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+MMAP_ENV = 'PIPELINE_MMAP_DATASET'
+ARROW_SUFFIX = '.arrow'
+
+
+def mmap_enabled():
+    return pa is not None and os.environ.get(MMAP_ENV, '1') != '0'
+
+
+def arrow_cache_path(csv_path):
+    """'dataset.csv' → 'dataset.arrow'"""
+    root, _ = os.path.splitext(csv_path)
+    return root + ARROW_SUFFIX
+
+
+def is_cache_fresh(csv_path, arrow_path):
+    if not os.path.exists(arrow_path):
+        return False
+    if not os.path.exists(csv_path):
+        return True
+    return os.path.getmtime(arrow_path) >= os.path.getmtime(csv_path)
+
+
+def _mixed_object_columns(df):
+    """Arrow'a tek tipte çevrilemeyen (karışık tipli) object sütunları"""
+    mixed = []
+    for col in df.columns[df.dtypes == object]:
+        try:
+            pa.array(df[col], from_pandas=True)
+        except (pa.ArrowTypeError, pa.ArrowInvalid):
+            mixed.append(col)
+    return mixed
+
+
+def read_csv_table(csv_path):
+    """CSV → Arrow Table (pandas ile aynı tip çıkarımı için pandas üzerinden)
+
+    Karışık tipli object sütunlar (ör. sayı + metin) Arrow'a çevrilemezse
+    bu sütunlar string'e (NA korunarak) çevrilip tekrar denenir.
+    """
+    df = pd.read_csv(csv_path)
+    try:
+        return pa.Table.from_pandas(df, preserve_index=False)
+    except (pa.ArrowTypeError, pa.ArrowInvalid):
+        mixed = _mixed_object_columns(df)
+        if not mixed:
+            raise
+        df = df.astype({col: 'string' for col in mixed})
+        return pa.Table.from_pandas(df, preserve_index=False)
+
+
+def export_arrow_ipc(csv_path, arrow_path=None):
+    """CSV'yi sıkıştırmasız Arrow IPC dosyasına yazar (mmap için)
+
+    Returns:
+        str: yazılan dosya yolu
+    """
+    if pa is None:
+        raise ImportError("Arrow IPC cache için pyarrow gerekli")
+    arrow_path = arrow_path or arrow_cache_path(csv_path)
+    table = read_csv_table(csv_path)
+
+    tmp_path = f'{arrow_path}.tmp-{os.getpid()}'
+    try:
+        with pa.OSFile(tmp_path, 'wb') as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(tmp_path, arrow_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return arrow_path
+
+
+def ensure_arrow_cache(csv_path, arrow_path=None):
+    """Cache yoksa veya CSV'den eskiyse üretir; cache yolunu döndürür"""
+    arrow_path = arrow_path or arrow_cache_path(csv_path)
+    if not is_cache_fresh(csv_path, arrow_path):
+        export_arrow_ipc(csv_path, arrow_path)
+    return arrow_path
+
+
+def open_mapped_table(arrow_path, columns=None):
+    """IPC dosyasını memory-map ederek Arrow Table döndürür (zero-copy)"""
+    source = pa.memory_map(arrow_path, 'r')
+    table = pa.ipc.open_file(source).read_all()
+    if columns is not None:
+        table = table.select(list(columns))
+    return table
+
+
+def load_dataset(csv_path, columns=None, arrow_dtypes=True, numpy_columns=None):
+    """Analiz script'leri için salt okunur dataset yükleyici
+
+    mmap modu kapalıysa pd.read_csv(csv_path, usecols=columns) ile aynıdır.
+    Dönen DataFrame salt okunur kabul edilmelidir: zero-copy sütunlar
+    mmap'li buffer'lara bakar.
+
+    Args:
+        arrow_dtypes: True ise sütunlar pd.ArrowDtype olarak kopyasız gelir
+        numpy_columns: numpy / object dtype'a çevrilecek (kopyalanan) sütunlar
+    """
+    if not mmap_enabled():
+        return pd.read_csv(csv_path, usecols=columns)
+
+    table = open_mapped_table(ensure_arrow_cache(csv_path), columns=columns)
+    if not arrow_dtypes:
+        # split_blocks: sütunlar tek bloğa birleştirilmez → null'suz sayısal sütunlar zero-copy
+        return table.to_pandas(split_blocks=True)
+
+    df = table.to_pandas(types_mapper=pd.ArrowDtype)
+    for col in numpy_columns or []:
+        if col in df.columns:
+            df[col] = table.column(col).to_pandas()
+    return df
+
+
+def main(argv=None):
+    """Cache üretir ve CSV / mmap yükleme sürelerini karşılaştırır"""
+
+    print("🗺️ LinkedIn Jobs Dataset - Memory-Mapped Dataset Access")
+    print("=" * 60)
+
+    argv = sys.argv[1:] if argv is None else argv
+    csv_path = argv[0] if argv else 'linkedin_jobs_dataset_insights_completed.csv'
+
+    if pa is None:
+        print("❌ HATA: pyarrow kurulu değil - mmap modu kullanılamaz")
+        return
+
+    try:
+        start = time.perf_counter()
+        arrow_path = ensure_arrow_cache(csv_path)
+        print(f"✅ Arrow IPC cache: {arrow_path} ({time.perf_counter() - start:.2f} s)")
+    except Exception as e:
+        print(f"❌ HATA: Cache oluşturulamadı - {e}")
+        return
+
+    start = time.perf_counter()
+    df_csv = pd.read_csv(csv_path)
+    csv_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    df_mapped = load_dataset(csv_path)
+    mmap_seconds = time.perf_counter() - start
+
+    print(f"📄 pd.read_csv: {csv_seconds:.2f} s")
+    print(f"🗺️ mmap yükleme: {mmap_seconds:.3f} s ({len(df_mapped):,} satır, {len(df_mapped.columns)} sütun)")
+    print(f"🔍 Sütunlar aynı: {list(df_csv.columns) == list(df_mapped.columns)}")
+
+if __name__ == "__main__":
+    main()
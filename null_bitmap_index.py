@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+LinkedIn Jobs Dataset - Packed Null Bitmap Index
+Her sütunun null maskesini satır başına 1 bit olacak şekilde paketler
+(np.packbits → uint64 word'ler) ve tüm sütun çiftleri için null
+co-occurrence matrisini popcount ile hesaplar.
+
+- co-occurrence[i, j]: i ve j sütunlarının birlikte null olduğu satır sayısı
+- Jaccard: ortak null / null birleşimi
+- null pattern uyumu: iki sütunun aynı satırlarda boş / dolu olma oranı
+  (satır - popcount(a XOR b))
+- Yapısal tekrar: tam olarak aynı satırlarda null olan sütun grupları
+  (paketlenmiş bitmap'lerin hash'i ile O(sütun))
+
+Bir sütunun bitmap'i bool maskenin 1/8'i kadar yer tutar; çift başına
+karşılaştırma satır başına değil 64 satırlık word başına yapılır.
+"""
+
+import sys
+
+import numpy as np
+
+from fast_loader import read_csv_fast
+
+NEAR_DUPLICATE_THRESHOLD = 0.95
+
+# np.bitwise_count olmayan numpy sürümleri için byte popcount tablosu
+_POPCOUNT_TABLE = np.array([bin(value).count('1') for value in range(256)], dtype=np.uint8)
+
+
+def pack_bitmaps(mask):
+    """(sütun × satır) bool maskeyi (sütun × ceil(satır/64)) uint64 bitmap'e paketler"""
+    packed = np.packbits(np.asarray(mask, dtype=bool), axis=1)
+    padding = (-packed.shape[1]) % 8
+    if padding:
+        packed = np.pad(packed, ((0, 0), (0, padding)))
+    return np.ascontiguousarray(packed).view(np.uint64)
+
+
+def popcount(words):
+    """Son eksen boyunca set bit sayısı (int64)"""
+    if hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(words).sum(axis=-1, dtype=np.int64)
+    return _POPCOUNT_TABLE[np.ascontiguousarray(words).view(np.uint8)].sum(axis=-1, dtype=np.int64)
+
+
+def null_index_from_mask(columns, nulls):
+    """(sütun × satır) null maskesinden index oluşturur"""
+    bitmaps = pack_bitmaps(nulls)
+    return {
+        'columns': list(columns),
+        'rows': int(np.shape(nulls)[1]),
+        'bitmaps': bitmaps,
+        'null_counts': popcount(bitmaps)
+    }
+
+
+def build_null_index(df, columns=None):
+    """DataFrame sütunlarının null bitmap index'i
+
+    Returns:
+        dict: columns, rows, bitmaps (sütun × word uint64), null_counts
+    """
+    columns = list(df.columns) if columns is None else list(columns)
+    nulls = df[columns].isna().to_numpy(dtype=bool).T
+    return null_index_from_mask(columns, nulls)
+
+
+def null_cooccurrence(index):
+    """(sütun × sütun) birlikte null satır sayısı matrisi
+
+    Diyagonal sütunun null sayısıdır. Her satırda i. bitmap kalan tüm
+    bitmap'lerle tek vektörel AND + popcount ile karşılaştırılır.
+    """
+    bitmaps = index['bitmaps']
+    k = len(index['columns'])
+    matrix = np.zeros((k, k), dtype=np.int64)
+    for i in range(k):
+        counts = popcount(bitmaps[i] & bitmaps[i:])
+        matrix[i, i:] = counts
+        matrix[i:, i] = counts
+    return matrix
+
+
+def null_jaccard(index, cooccurrence=None):
+    """Null Jaccard matrisi; iki sütunda da hiç null yoksa NaN"""
+    cooccurrence = null_cooccurrence(index) if cooccurrence is None else cooccurrence
+    counts = index['null_counts']
+    union = counts[:, None] + counts[None, :] - cooccurrence
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(union > 0, cooccurrence / np.maximum(union, 1), np.nan)
+
+
+def null_agreement(index, cooccurrence=None):
+    """Aynı satırlarda boş / dolu olma yüzdesi matrisi (satır - |a XOR b|)"""
+    cooccurrence = null_cooccurrence(index) if cooccurrence is None else cooccurrence
+    rows = index['rows']
+    if rows == 0:
+        return np.full(cooccurrence.shape, np.nan)
+    counts = index['null_counts']
+    mismatches = counts[:, None] + counts[None, :] - 2 * cooccurrence
+    return (rows - mismatches) / rows * 100
+
+
+def structural_duplicate_groups(index):
+    """Tam olarak aynı satırlarda null olan sütun grupları (en az bir null'ı olan)"""
+    groups = {}
+    for column, bitmap, count in zip(index['columns'], index['bitmaps'], index['null_counts']):
+        if count > 0:
+            groups.setdefault(bitmap.tobytes(), []).append(column)
+    return [columns for columns in groups.values() if len(columns) > 1]
+
+
+def near_duplicate_pairs(index, threshold=NEAR_DUPLICATE_THRESHOLD, jaccard=None):
+    """Null Jaccard'ı threshold ile 1 arasında olan sütun çiftleri (büyükten küçüğe)"""
+    jaccard = null_jaccard(index) if jaccard is None else jaccard
+    left, right = np.triu_indices(len(index['columns']), k=1)
+    scores = jaccard[left, right]
+    selected = np.flatnonzero((scores >= threshold) & (scores < 1))
+    pairs = [(index['columns'][left[k]], index['columns'][right[k]], float(scores[k])) for k in selected]
+    return sorted(pairs, key=lambda pair: pair[2], reverse=True)
+
+
+def main():
+    """Dataset'teki yapısal null tekrarlarını raporlar"""
+
+    print("🧬 LinkedIn Jobs Dataset - Packed Null Bitmap Index")
+    print("=" * 60)
+
+    input_file = sys.argv[1] if len(sys.argv) > 1 else 'fixed_all_company_colums.csv'
+    try:
+        df = read_csv_fast(input_file)
+        print(f"✅ Dataset yüklendi: {len(df):,} satır, {len(df.columns)} sütun")
+        print()
+    except Exception as e:
+        print(f"❌ HATA: Dataset yüklenemedi - {e}")
+        return
+
+    index = build_null_index(df)
+    jaccard = null_jaccard(index)
+    bitmap_kb = index['bitmaps'].nbytes / 1024
+    mask_kb = len(index['columns']) * index['rows'] / 1024
+    print(f"💾 Bitmap: {bitmap_kb:.1f} KB (bool maske: {mask_kb:.1f} KB)")
+
+    groups = structural_duplicate_groups(index)
+    print(f"\n🔗 Aynı satırlarda null olan sütun grupları: {len(groups)}")
+    null_counts = dict(zip(index['columns'], index['null_counts']))
+    for group in groups:
+        print(f"   • {', '.join(group)} ({null_counts[group[0]]:,} null)")
+
+    pairs = near_duplicate_pairs(index, jaccard=jaccard)
+    print(f"\n🔍 Neredeyse aynı null pattern'ı (Jaccard ≥ {NEAR_DUPLICATE_THRESHOLD}): {len(pairs)}")
+    for col_a, col_b, score in pairs[:20]:
+        print(f"   • {col_a} ↔ {col_b}: {score:.3f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+LinkedIn Jobs Dataset - Parallel Column Analysis Runner
+(analysis, column) job listesini process pool üzerinde paralel çalıştırır.
+
+Her sütun bir kez Arrow IPC formatına çevrilip shared memory'ye yazılır;
+worker'lar yalnızca ihtiyaç duydukları sütunların shared memory bloklarına
+bağlanır. Böylece her job için tüm DataFrame pickle edilmez.
+pyarrow yoksa (veya sütun Arrow'a çevrilemezse) sadece o sütunun
+pickle'ı shared memory'ye yazılır.
+
+Kullanım:
+    jobs = [('column_deep', 'merged_companyDescription'),
+            ('contentSource', 'contentSource'),
+            ('link_consistency', 'link')]
+    results = run_parallel_analyses(df, jobs, max_workers=4)
+"""
+
+import contextlib
+import importlib
+import io
+import os
+import pickle
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+
+def _name_similar_columns(column, columns, threshold=0.3):
+    """column_deep_analysis'teki isim benzerliği kuralının aynısı"""
+    col_base = column.lower().replace('/', '_').split('_')
+    similar = []
+    for other in columns:
+        if other == column:
+            continue
+        other_base = other.lower().replace('/', '_').split('_')
+        common_words = set(col_base) & set(other_base)
+        if common_words and len(common_words) / max(len(col_base), len(other_base)) > threshold:
+            similar.append(other)
+    return similar
+
+
+def _keyword_columns(columns, keywords, exclude=()):
+    return [c for c in columns if c not in exclude and any(k in c.lower() for k in keywords)]
+
+
+# Analiz kayıt tablosu:
+#   module/function  → çağrılacak analiz fonksiyonu
+#   takes_column     → fonksiyon (df, column) mı yoksa (df) mi alıyor
+#   columns          → (column, all_columns) → worker'a gönderilecek sütun listesi
+ANALYSIS_REGISTRY = {
+    'column_deep': {
+        'module': 'column_deep_analysis',
+        'function': 'analyze_column_deep',
+        'takes_column': True,
+        'columns': lambda col, cols: [col] + _name_similar_columns(col, cols)
+    },
+    'contentSource': {
+        'module': 'contentSource_comprehensive_analysis',
+        'function': 'analyze_contentSource_comprehensive',
+        'takes_column': False,
+        'columns': lambda col, cols: ['contentSource'] + [c for c in cols if 'contentSource' in c and c != 'contentSource']
+    },
+    'company_logo': {
+        'module': 'company_logo_single_column_analysis',
+        'function': 'analyze_company_logo_column',
+        'takes_column': False,
+        'columns': lambda col, cols: ['company/logo'] + _keyword_columns(
+            cols, ['logo', 'image', 'picture', 'avatar', 'icon', 'media'], exclude=('company/logo',)
+        ) + (['company/name'] if 'company/name' in cols else [])
+    },
+    'link_basic': {
+        'module': 'analyze_link_column_comprehensive',
+        'function': 'analyze_basic_characteristics',
+        'takes_column': True,
+        'columns': lambda col, cols: [col]
+    },
+    'link_patterns': {
+        'module': 'analyze_link_column_comprehensive',
+        'function': 'analyze_url_patterns',
+        'takes_column': True,
+        'columns': lambda col, cols: [col]
+    },
+    'link_consistency': {
+        'module': 'analyze_link_column_comprehensive',
+        'function': 'check_data_consistency',
+        'takes_column': True,
+        'columns': lambda col, cols: [col]
+    },
+    'link_null_density': {
+        'module': 'analyze_link_column_comprehensive',
+        'function': 'analyze_null_density',
+        'takes_column': True,
+        'columns': lambda col, cols: [col]
+    },
+    'link_standardization': {
+        'module': 'analyze_link_column_comprehensive',
+        'function': 'analyze_format_standardization',
+        'takes_column': True,
+        'columns': lambda col, cols: [col]
+    },
+    'link_redundancy': {
+        'module': 'analyze_link_column_comprehensive',
+        'function': 'find_similar_columns',
+        'takes_column': True,
+        'columns': lambda col, cols: [col] + [c for c in cols if 'id' in c.lower() and c != col]
+    }
+}
+
+
+def unresolved_analyses(names=None):
+    """Modülü import edilemeyen veya fonksiyonu bulunamayan registry kayıtları {isim: hata}"""
+    names = ANALYSIS_REGISTRY if names is None else names
+    errors = {}
+    for name in dict.fromkeys(names):
+        spec = ANALYSIS_REGISTRY[name]
+        try:
+            getattr(importlib.import_module(spec['module']), spec['function'])
+        except (ImportError, AttributeError) as e:
+            errors[name] = f"{spec['module']}.{spec['function']}: {e}"
+    return errors
+
+
+def resolve_job_columns(job, all_columns):
+    """Bir job'un ihtiyaç duyduğu sütunları (sıralı, tekrarsız) döndürür"""
+    analysis, column = job
+    spec = ANALYSIS_REGISTRY[analysis]
+    wanted = spec['columns'](column, list(all_columns))
+    available = set(all_columns)
+    return [c for c in dict.fromkeys(wanted) if c in available]
+
+
+def _serialize_column(series):
+    """Tek sütunu Arrow IPC stream (yoksa pickle) byte'larına çevirir"""
+    if pa is not None:
+        try:
+            table = pa.Table.from_pandas(series.to_frame(), preserve_index=False)
+            sink = pa.BufferOutputStream()
+            with pa.ipc.new_stream(sink, table.schema) as writer:
+                writer.write_table(table)
+            return 'arrow', sink.getvalue().to_pybytes()
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            pass
+    return 'pickle', pickle.dumps(series, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def export_columns_to_shared_memory(df, columns):
+    """Sütunları shared memory bloklarına yazar
+
+    Returns:
+        (handles, segments): handles parent'ta unlink için tutulur,
+        segments ise worker'a gönderilen {column: (shm_name, size, format)} sözlüğüdür.
+    """
+    handles = []
+    segments = {}
+    for col in columns:
+        fmt, payload = _serialize_column(df[col])
+        shm = shared_memory.SharedMemory(create=True, size=max(len(payload), 1))
+        shm.buf[:len(payload)] = payload
+        handles.append(shm)
+        segments[col] = (shm.name, len(payload), fmt)
+    return handles, segments
+
+
+def _attach_column(column, shm_name, size, fmt):
+    """Worker tarafında shared memory'den sütunu okur"""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    view = shm.buf[:size]
+    try:
+        if fmt == 'arrow':
+            table = pa.ipc.open_stream(pa.py_buffer(view)).read_all()
+            # Numeric sütunlar zero-copy gelebilir; blok kapanmadan önce kopyala
+            series = table.column(0).to_pandas().copy()
+            series.name = column
+            del table
+        else:
+            series = pickle.loads(bytes(view))
+    finally:
+        view.release()
+        shm.close()
+    return series
+
+
+def _run_job(analysis, column, segments, capture_output=True):
+    """Process pool worker'ı: sütunları bağlar ve analizi çalıştırır"""
+    spec = ANALYSIS_REGISTRY[analysis]
+    start = time.perf_counter()
+    output = io.StringIO()
+    result = None
+    error = None
+
+    try:
+        frame = pd.DataFrame({col: _attach_column(col, *seg) for col, seg in segments.items()})
+        func = getattr(importlib.import_module(spec['module']), spec['function'])
+
+        redirect = contextlib.redirect_stdout(output) if capture_output else contextlib.nullcontext()
+        with redirect:
+            if spec['takes_column']:
+                result = func(frame, column)
+            else:
+                result = func(frame)
+    except Exception:
+        error = traceback.format_exc()
+
+    return {
+        'analysis': analysis,
+        'column': column,
+        'columns_received': list(segments),
+        'duration_s': time.perf_counter() - start,
+        'result': result,
+        'output': output.getvalue(),
+        'error': error,
+        'worker_pid': os.getpid()
+    }
+
+
+def run_parallel_analyses(df, jobs, max_workers=None, capture_output=True):
+    """(analysis, column) job'larını process pool'da çalıştırır
+
+    Her benzersiz sütun yalnızca bir kez shared memory'ye yazılır;
+    job'lar aynı sütunu paylaşıyorsa aynı blok kullanılır.
+    Sonuçlar job sırasıyla döndürülür.
+    """
+    unknown = [analysis for analysis, _ in jobs if analysis not in ANALYSIS_REGISTRY]
+    if unknown:
+        raise ValueError(f"Bilinmeyen analiz: {sorted(set(unknown))}")
+    unresolved = unresolved_analyses(analysis for analysis, _ in jobs)
+    if unresolved:
+        raise ValueError(f"Çözümlenemeyen analiz fonksiyonları: {unresolved}")
+
+    job_columns = [resolve_job_columns(job, df.columns) for job in jobs]
+    all_needed = list(dict.fromkeys(col for cols in job_columns for col in cols))
+
+    handles, segments = export_columns_to_shared_memory(df, all_needed)
+    results = [None] * len(jobs)
+
+    try:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {}
+            for i, ((analysis, column), cols) in enumerate(zip(jobs, job_columns)):
+                job_segments = {col: segments[col] for col in cols}
+                futures[executor.submit(_run_job, analysis, column, job_segments, capture_output)] = i
+
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+    finally:
+        for shm in handles:
+            shm.close()
+            shm.unlink()
+
+    return results
+
+
+def default_jobs(df):
+    """Metin sütunları için column_deep + dataset'te bulunan sütunlara özel analizler"""
+    # pandas 3'te metin sütunları 'str' dtype'lıdır (object değil)
+    jobs = [('column_deep', col) for col in df.columns
+            if pd.api.types.is_string_dtype(df[col]) or pd.api.types.is_object_dtype(df[col])]
+    if 'contentSource' in df.columns:
+        jobs.append(('contentSource', 'contentSource'))
+    if 'company/logo' in df.columns:
+        jobs.append(('company_logo', 'company/logo'))
+    if 'link' in df.columns:
+        jobs += [(name, 'link') for name in ANALYSIS_REGISTRY if name.startswith('link_')]
+    return jobs
+
+
+def main():
+    """Tüm sütunlar için paralel deep analysis"""
+
+    print("⚡ LinkedIn Jobs Dataset - Parallel Column Analysis")
+    print("=" * 60)
+
+    try:
+        df = pd.read_csv('linkedin_jobs_dataset_insights_completed.csv')
+        print(f"✅ Dataset yüklendi: {len(df):,} satır, {len(df.columns)} sütun")
+        print()
+    except Exception as e:
+        print(f"❌ HATA: Dataset yüklenemedi - {e}")
+        return
+
+    jobs = default_jobs(df)
+    print(f"🔧 {len(jobs)} job, {os.cpu_count()} CPU üzerinde çalıştırılıyor...")
+    start = time.perf_counter()
+    results = run_parallel_analyses(df, jobs)
+    elapsed = time.perf_counter() - start
+
+    failed = [r for r in results if r['error']]
+    total_cpu = sum(r['duration_s'] for r in results)
+
+    print(f"\n📊 SONUÇLAR:")
+    print(f"   ✅ Başarılı: {len(results) - len(failed)}")
+    print(f"   ❌ Hatalı: {len(failed)}")
+    print(f"   ⏱️ Wall time: {elapsed:.2f} s | Toplam analiz süresi: {total_cpu:.2f} s")
+    if elapsed > 0:
+        print(f"   ⚡ Paralel hızlanma: {total_cpu / elapsed:.1f}x")
+
+    for r in sorted(results, key=lambda r: r['duration_s'], reverse=True)[:10]:
+        print(f"   📋 {r['analysis']} / {r['column']}: {r['duration_s']:.2f} s ({len(r['columns_received'])} sütun)")
+
+    for r in failed:
+        print(f"\n❌ {r['analysis']} / {r['column']}:")
+        print(r['error'])
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+LinkedIn Jobs Dataset - Pipeline Command Line Interface
+Pipeline adımlarını, analizleri ve altyapı araçlarını tek bir giriş
+noktasından çalıştırır.
+
+Komut tablosu yalnızca modül isimlerinden oluşur; hiçbir script (ve
+dolayısıyla pandas / numpy) seçilen komut çalıştırılana kadar import
+edilmez. '--help' ve 'list' standart kütüphane dışında bir şey yüklemez,
+'validate' ise header / sidecar doğrulaması için pandas'a ihtiyaç duymaz.
+
+Kullanım:
+    python pipeline_cli.py list
+    python pipeline_cli.py step8
+    python pipeline_cli.py validate
+    python pipeline_cli.py ingest new_batch.csv
+    python pipeline_cli.py <modül_adı> [argümanlar]   # tablo dışındaki script'ler
+
+Script'ler kendi 'if __name__ == "__main__"' bloklarıyla çalıştırılır
+(runpy); komuttan sonraki argümanlar script'in sys.argv'sine aktarılır.
+"""
+
+import os
+import runpy
+import sys
+import time
+
+# komut → (modül, açıklama)
+PIPELINE_COMMANDS = {
+    'clean': ('delete_columns', 'Gereksiz sütunları siler (cleaned_columns)'),
+    'step2': ('delete_predash_column', 'preDashFollowingInfoUrn silme'),
+    'step3': ('consolidate_industry_columns', 'Industry sütunlarını birleştirme'),
+    'step4': ('logo_columns_comparison_and_deletion', 'Logo sütunları karşılaştırma / silme'),
+    'step5': ('convert_logo_to_boolean', 'has_company_logo boolean dönüşümü'),
+    'step6': ('delete_company_name_duplicate_and_analyze_format_issues', 'company/name duplicate silme'),
+    'step7': ('create_job_investment_category_and_delete_contentSource', 'job_investment_type oluşturma'),
+    'step8': ('create_urgency_categories_and_optimize_expireAt', 'Urgency + zamansal özellikler'),
+    'step9': ('job_functions_transformation_and_insights', 'job_functions_combined oluşturma'),
+    'step10': ('delete_redundant_entityUrn', 'jobApplicantInsights/entityUrn silme'),
+    'step11': ('delete_workRemoteAllowed', 'workRemoteAllowed silme'),
+    'step12': ('delete_link_column', 'link silme'),
+    'step13': ('convert_expireAt_and_create_urgency', 'expireAt datetime + job_urgency_category'),
+    'fix-company': ('copy_step13_to_fixed_company_formats', 'Şirket formatı düzeltilmiş kopya'),
+    'final': ('process_final_column_deletions', 'Final sütun silmeleri + analytics store'),
+}
+
+ANALYSIS_COMMANDS = {
+    'dataset': ('dataset_analysis', 'Kapsamlı dataset analizi'),
+    'column-deep': ('column_deep_analysis', 'Sütun derin analizi'),
+    'single-column': ('single_column_analysis', 'Tek sütun analizi'),
+    'expireat': ('expireAt_comprehensive_analysis', 'expireAt kapsamlı analizi'),
+    'expireat-insights': ('expireAt_business_insight_analysis', 'expireAt iş zekası analizi'),
+    'contentsource': ('contentSource_comprehensive_analysis', 'contentSource kapsamlı analizi'),
+    'contentsource-insights': ('contentSource_business_insight_analysis', 'contentSource iş zekası analizi'),
+    'job-functions': ('advanced_job_functions_insights', 'Gelişmiş job function insight\'ları'),
+    'formatted-job-functions': ('formattedJobFunctions_analysis', 'formattedJobFunctions analizi'),
+    'entityurn': ('jobApplicantInsights_entityUrn_analysis', 'entityUrn analizi'),
+    'entityurn-validation': ('redundant_entityUrn_validation', 'entityUrn redundancy doğrulaması'),
+    'link': ('analyze_link_column_comprehensive', 'link sütunu analizi'),
+    'company-logo': ('company_logo_single_column_analysis', 'Şirket logo analizi'),
+    'company-names': ('company_name_columns_comprehensive_analysis', 'Şirket ismi sütunları analizi'),
+    'industries': ('industry_columns_comparative_analysis', 'Industry sütunları karşılaştırması'),
+    'workplace': ('analyze_jobWorkplaceTypes_localizedName', 'Workplace type analizi'),
+    'parallel': ('parallel_column_analysis', 'Paralel sütun analizleri'),
+}
+
+TOOL_COMMANDS = {
+    'validate': ('schema_validator', 'Header-only checkpoint doğrulaması'),
+    'check': ('check_pipeline_issues', 'Pipeline sorun kontrolü'),
+    'profile': ('pipeline_profiler', 'Adım profil raporu'),
+    'chain': ('pipeline_chain_analyzer', 'Pipeline zinciri analizi'),
+    'ingest': ('incremental_ingest', 'Incremental batch ingest'),
+    'ingest-raw': ('raw_json_ingest', 'Ham JSON / JSONL streaming ingest'),
+    'projection': ('ingest_projection', 'Ingest projeksiyon raporu'),
+    'store': ('analytics_store', 'Embedded analytical store'),
+    'query': ('lazy_query', 'Lazy Parquet sorguları'),
+    'cube': ('aggregate_cube', 'Aggregate cube raporları'),
+    'mmap': ('mmap_dataset', 'Arrow IPC mmap cache'),
+    'load': ('fast_loader', 'Arrow CSV loader karşılaştırması'),
+    'strings': ('string_columns', 'string[pyarrow] bellek raporu'),
+    'star': ('company_dimension', 'Şirket dimension star schema'),
+    'nulls': ('null_bitmap_index', 'Null bitmap / null pattern korelasyonu'),
+    'sample': ('sampling', 'Katmanlı örnek + güven aralığı'),
+    'sketch': ('streaming_sketches', 'HLL / top-k / t-digest sketch profili'),
+    'job-ids': ('job_id_index', 'Job id index'),
+    'urns': ('urn_index', 'URN decomposition'),
+    'signatures': ('format_signature', 'Format signature profili'),
+    'rules': ('classification_rules', 'Sınıflandırma kural tabloları'),
+    'derive': ('derived_columns', 'Zamansal türetilmiş sütunlar'),
+    'datetimes': ('datetime_detection', 'Datetime format tespiti'),
+    'datetime-pairs': ('datetime_comparison', 'Datetime sütun çifti karşılaştırması'),
+    'xlsx': ('convert_to_xlsx', 'Final dataset → XLSX'),
+}
+
+COMMAND_GROUPS = [
+    ('🏗️ Pipeline adımları', PIPELINE_COMMANDS),
+    ('🔍 Analizler', ANALYSIS_COMMANDS),
+    ('🛠️ Araçlar', TOOL_COMMANDS),
+]
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def resolve_command(command):
+    """Komutu modül ismine çevirir; tablo dışındaki mevcut script isimleri de kabul edilir"""
+    for _, commands in COMMAND_GROUPS:
+        if command in commands:
+            return commands[command][0]
+    module = command[:-3] if command.endswith('.py') else command
+    if os.path.exists(os.path.join(SCRIPT_DIR, module + '.py')):
+        return module
+    return None
+
+
+def print_usage():
+    print("🧭 LinkedIn Jobs Dataset - Pipeline CLI")
+    print("=" * 60)
+    print("Kullanım: python pipeline_cli.py <komut> [argümanlar]")
+    for title, commands in COMMAND_GROUPS:
+        print(f"\n{title}:")
+        for command, (module, description) in commands.items():
+            print(f"   {command:<24} {description} ({module}.py)")
+    print("\nTablo dışındaki script'ler modül adıyla çalıştırılabilir.")
+
+
+def run_command(command, args=(), timed=False):
+    """Komutun script'ini __main__ olarak çalıştırır"""
+    module = resolve_command(command)
+    if module is None:
+        raise ValueError(f"Bilinmeyen komut: {command}")
+
+    if SCRIPT_DIR not in sys.path:
+        sys.path.insert(0, SCRIPT_DIR)
+
+    saved_argv = sys.argv
+    sys.argv = [os.path.join(SCRIPT_DIR, module + '.py')] + list(args)
+    start = time.perf_counter()
+    try:
+        runpy.run_module(module, run_name='__main__')
+    finally:
+        sys.argv = saved_argv
+    if timed:
+        print(f"\n⏱️ {command}: {time.perf_counter() - start:.2f} s")
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+
+    if not argv or argv[0] in ('-h', '--help', 'help', 'list'):
+        print_usage()
+        return 0
+
+    timed = argv[0] == '--time'
+    if timed:
+        argv = argv[1:]
+        if not argv:
+            print_usage()
+            return 2
+
+    command, args = argv[0], argv[1:]
+    try:
+        run_command(command, args, timed=timed)
+    except ValueError as e:
+        print(f"❌ HATA: {e}")
+        print("📋 Komut listesi için: python pipeline_cli.py --help")
+        return 2
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+LinkedIn Jobs Dataset - Pipeline Profiler
+Pipeline transform fonksiyonlarını saran instrumentation katmanı:
+her çağrı için yapılandırılmış bir span (süre, satır/sütun değişimi, bellek farkı)
+JSON Lines log dosyasına yazılır. Opsiyonel cProfile / pyinstrument dump desteği.
+Profil opt-in'dir: PIPELINE_PROFILE_LOG verilmedikçe hiçbir dosya yazılmaz.
+
+Kullanım:
+    from pipeline_profiler import profile_step
+
+    @profile_step
+    def convert_logo_to_boolean(df):
+        ...
+
+Ortam değişkenleri:
+    PIPELINE_PROFILE_LOG   → span log dosyası (ör. pipeline_profile.jsonl; boş / '0' → kapalı)
+    PIPELINE_PROFILE_DUMP  → 'cprofile' veya 'pyinstrument' (opsiyonel profil dump'ı)
+    PIPELINE_RUN_ID        → aynı run'a ait span'leri gruplamak için sabit id
+"""
+
+import functools
+import json
+import os
+import sys
+import time
+import uuid
+from collections import defaultdict
+from datetime import datetime
+
+PROFILE_LOG_ENV = 'PIPELINE_PROFILE_LOG'
+PROFILE_DUMP_ENV = 'PIPELINE_PROFILE_DUMP'
+RUN_ID_ENV = 'PIPELINE_RUN_ID'
+
+DEFAULT_PROFILE_LOG = 'pipeline_profile.jsonl'
+PROFILE_DUMP_DIR = 'pipeline_profiles'
+
+_RUN_ID = os.environ.get(RUN_ID_ENV) or uuid.uuid4().hex[:12]
+
+
+def get_profile_log_path():
+    """Aktif span log dosyasını döndürür (PIPELINE_PROFILE_LOG yoksa None)"""
+    path = os.environ.get(PROFILE_LOG_ENV)
+    if not path or path == '0':
+        return None
+    return path
+
+
+def get_rss_mb():
+    """Process'in anlık RSS bellek kullanımı (MB)"""
+    try:
+        import psutil
+        return psutil.Process(os.getpid()).memory_info().rss / 1024**2
+    except ImportError:
+        pass
+
+    # psutil yoksa Linux /proc üzerinden oku
+    try:
+        with open('/proc/self/statm', 'r') as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf('SC_PAGE_SIZE') / 1024**2
+    except (OSError, ValueError, AttributeError):
+        pass
+
+    # Son çare: peak RSS (Linux'ta KB, macOS'ta byte)
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / 1024**2 if sys.platform == 'darwin' else peak / 1024
+    except ImportError:
+        return None
+
+
+def _is_frame(obj):
+    """DataFrame benzeri nesne kontrolü (pandas import etmeden)"""
+    return hasattr(obj, 'columns') and hasattr(obj, 'shape')
+
+
+def _find_input_frame(args, kwargs):
+    """Fonksiyon argümanlarındaki ilk DataFrame'i bulur"""
+    for value in list(args) + list(kwargs.values()):
+        if _is_frame(value):
+            return value
+    return None
+
+
+def _find_output_frame(result, input_frame):
+    """Dönüş değerinden çıktı DataFrame'ini çıkarır
+
+    Pipeline fonksiyonları df, (df, stats) tuple'ı veya in-place değişiklik
+    sonrası stats dict'i döndürebildiği için her üç durum da desteklenir.
+    """
+    if _is_frame(result):
+        return result
+    if isinstance(result, (tuple, list)):
+        for item in result:
+            if _is_frame(item):
+                return item
+    if isinstance(result, dict) and result.get('success') is False:
+        return None
+    return input_frame
+
+
+def _frame_shape(frame):
+    if frame is None:
+        return None, []
+    return int(frame.shape[0]), [str(col) for col in frame.columns]
+
+
+def _start_profiler(mode):
+    """Opsiyonel profiler'ı başlatır"""
+    if mode == 'cprofile':
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()
+        return profiler
+    if mode == 'pyinstrument':
+        try:
+            from pyinstrument import Profiler
+        except ImportError:
+            return None
+        profiler = Profiler()
+        profiler.start()
+        return profiler
+    return None
+
+
+def _stop_profiler(profiler, mode, step_name, span_id):
+    """Profiler'ı durdurur ve dump dosyasının yolunu döndürür"""
+    if profiler is None:
+        return None
+
+    os.makedirs(PROFILE_DUMP_DIR, exist_ok=True)
+    safe_name = step_name.replace('.', '_').replace('<', '').replace('>', '')
+
+    if mode == 'cprofile':
+        profiler.disable()
+        dump_path = os.path.join(PROFILE_DUMP_DIR, f'{safe_name}_{span_id}.prof')
+        profiler.dump_stats(dump_path)
+        return dump_path
+
+    profiler.stop()
+    dump_path = os.path.join(PROFILE_DUMP_DIR, f'{safe_name}_{span_id}.html')
+    with open(dump_path, 'w', encoding='utf-8') as f:
+        f.write(profiler.output_html())
+    return dump_path
+
+
+def write_span(span, log_path=None):
+    """Span kaydını JSON Lines log dosyasına ekler"""
+    log_path = log_path or get_profile_log_path()
+    if log_path is None:
+        return
+    with open(log_path, 'a', encoding='utf-8') as f:
+        f.write(json.dumps(span, ensure_ascii=False, default=str) + '\n')
+
+
+def profile_step(func=None, *, step_name=None):
+    """Pipeline fonksiyonunu span üreten bir wrapper ile sarar
+
+    Her çağrı için: başlangıç/bitiş zamanı, süre, rows in/out,
+    eklenen/silinen sütunlar, RSS bellek farkı ve (istenirse) profil dump'ı.
+    """
+    if func is None:
+        return functools.partial(profile_step, step_name=step_name)
+
+    name = step_name or func.__name__
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        log_path = get_profile_log_path()
+        if log_path is None:
+            return func(*args, **kwargs)
+
+        span_id = uuid.uuid4().hex[:12]
+        dump_mode = os.environ.get(PROFILE_DUMP_ENV, '').lower()
+
+        input_frame = _find_input_frame(args, kwargs)
+        rows_in, columns_in = _frame_shape(input_frame)
+
+        rss_before = get_rss_mb()
+        started_at = datetime.now().isoformat()
+        profiler = _start_profiler(dump_mode)
+        start = time.perf_counter()
+
+        status = 'ok'
+        error = None
+        result = None
+        try:
+            result = func(*args, **kwargs)
+            return result
+        except BaseException as e:
+            status = 'error'
+            error = f'{type(e).__name__}: {e}'
+            raise
+        finally:
+            duration = time.perf_counter() - start
+            dump_path = _stop_profiler(profiler, dump_mode, name, span_id)
+            rss_after = get_rss_mb()
+
+            output_frame = _find_output_frame(result, input_frame) if status == 'ok' else None
+            rows_out, columns_out = _frame_shape(output_frame)
+            input_set, output_set = set(columns_in), set(columns_out)
+
+            span = {
+                'run_id': _RUN_ID,
+                'span_id': span_id,
+                'step': name,
+                'module': func.__module__,
+                'start': started_at,
+                'end': datetime.now().isoformat(),
+                'duration_s': round(duration, 6),
+                'status': status,
+                'error': error,
+                'rows_in': rows_in,
+                'rows_out': rows_out,
+                'columns_in': len(columns_in) if input_frame is not None else None,
+                'columns_out': len(columns_out) if output_frame is not None else None,
+                'columns_added': [c for c in columns_out if c not in input_set],
+                'columns_dropped': [c for c in columns_in if c not in output_set] if output_frame is not None else [],
+                'rss_before_mb': round(rss_before, 3) if rss_before is not None else None,
+                'rss_after_mb': round(rss_after, 3) if rss_after is not None else None,
+                'memory_delta_mb': round(rss_after - rss_before, 3) if None not in (rss_before, rss_after) else None,
+                'profile_dump': dump_path
+            }
+            try:
+                write_span(span, log_path)
+            except OSError:
+                # Log yazılamazsa pipeline adımını bozma
+                pass
+
+    return wrapper
+
+
+def load_spans(log_path=None):
+    """Span log dosyasını okur"""
+    log_path = log_path or get_profile_log_path() or DEFAULT_PROFILE_LOG
+    spans = []
+    if not os.path.exists(log_path):
+        return spans
+    with open(log_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                spans.append(json.loads(line))
+    return spans
+
+
+def summarize_spans(spans, run_id=None):
+    """Span'leri adım bazında özetler (toplam süre, çağrı sayısı, bellek farkı)"""
+    if run_id is not None:
+        spans = [s for s in spans if s['run_id'] == run_id]
+
+    summary = defaultdict(lambda: {'calls': 0, 'total_s': 0.0, 'max_s': 0.0,
+                                   'memory_delta_mb': 0.0, 'errors': 0})
+    for span in spans:
+        step = summary[span['step']]
+        step['calls'] += 1
+        step['total_s'] += span['duration_s']
+        step['max_s'] = max(step['max_s'], span['duration_s'])
+        step['memory_delta_mb'] += span.get('memory_delta_mb') or 0.0
+        if span['status'] != 'ok':
+            step['errors'] += 1
+
+    return dict(sorted(summary.items(), key=lambda item: item[1]['total_s'], reverse=True))
+
+
+def main():
+    """Span log özeti"""
+
+    print("⏱️ LinkedIn Jobs Dataset - Pipeline Profile Summary")
+    print("=" * 60)
+
+    log_path = sys.argv[1] if len(sys.argv) > 1 else (get_profile_log_path() or DEFAULT_PROFILE_LOG)
+    spans = load_spans(log_path)
+    if not spans:
+        print(f"❌ Span bulunamadı: {log_path}")
+        return
+
+    last_run = spans[-1]['run_id']
+    summary = summarize_spans(spans, run_id=last_run)
+    total_time = sum(step['total_s'] for step in summary.values())
+
+    print(f"📁 Log: {log_path}")
+    print(f"🆔 Run: {last_run} ({sum(s['calls'] for s in summary.values())} span)")
+    print(f"⏱️ Toplam süre: {total_time:.2f} s")
+    print()
+
+    for step_name, step in summary.items():
+        share = (step['total_s'] / total_time * 100) if total_time > 0 else 0
+        print(f"📊 {step_name}:")
+        print(f"   ⏱️ {step['total_s']:.3f} s ({share:.1f}%) | {step['calls']} çağrı | max {step['max_s']:.3f} s")
+        print(f"   💾 Memory delta: {step['memory_delta_mb']:+.1f} MB")
+        if step['errors']:
+            print(f"   ❌ Hatalı çağrı: {step['errors']}")
+
+if __name__ == "__main__":
+    main()
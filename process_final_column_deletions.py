@@ -1,6 +1,11 @@
-import pandas as pd
 import os
+from pipeline_profiler import profile_step
+from schema_validator import checkpoint_gate
+from analytics_store import populate_store_if_enabled
+from company_dimension import emit_star_schema_if_enabled
+from fast_loader import read_csv_fast
 
+@profile_step
 def process_column_deletions():
     """
     Read fixed_all_company_colums.csv, delete specified columns, 
@@ -11,7 +16,7 @@ def process_column_deletions():
     input_file = "fixed_all_company_colums.csv"
     
     print(f"Reading {input_file}...")
-    df = pd.read_csv(input_file)
+    df = read_csv_fast(input_file)
     
     print(f"Initial dataset: {len(df)} records, {len(df.columns)} columns")
     
@@ -52,6 +57,7 @@ def process_column_deletions():
     # CSV
     csv_file = "fixed_all_company_colums.csv"
     df.to_csv(csv_file, index=False)
+    checkpoint_gate(csv_file, df)
     csv_size = os.path.getsize(csv_file) / (1024*1024)
     print(f"✅ {csv_file} - {csv_size:.2f} MB")
     
@@ -67,6 +73,23 @@ def process_column_deletions():
     xlsx_size = os.path.getsize(xlsx_file) / (1024*1024)
     print(f"✅ {xlsx_file} - {xlsx_size:.2f} MB")
     
+    # Analytical store (opsiyonel, PIPELINE_ANALYTICS_STORE=1 ile açılır)
+    try:
+        store_info = populate_store_if_enabled(df)
+        if store_info is not None:
+            print(f"✅ {store_info['path']} - {store_info['backend']} store, {len(store_info['indexes'])} index")
+    except Exception as e:
+        print(f"⚠️ Analytical store güncellenemedi: {e}")
+    
+    # Company dimension star schema (PIPELINE_STAR_SCHEMA=0 ile kapatılabilir)
+    try:
+        star_info = emit_star_schema_if_enabled(df)
+        if star_info is not None:
+            print(f"✅ {star_info['fact_path']} + {star_info['dimension_path']} - "
+                  f"{star_info['jobs']:,} ilan, {star_info['companies']:,} şirket")
+    except Exception as e:
+        print(f"⚠️ Star schema yazılamadı: {e}")
+    
     print(f"\n🎯 Column deletion and file generation completed successfully!")
     print(f"📊 Data integrity: {len(df)} records maintained across all formats")
 
@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+LinkedIn Jobs Dataset - Streaming Raw JSON / JSONL Ingest
+Scraper'ın ham JSON çıktısını kayıt kayıt okur, iç içe alanları CSV'deki
+sütun isimleriyle ('company/industry/0', 'jobWorkplaceTypes/0/localizedName',
+'salaryInsights/salaryDisplayMinRange') aynı şekilde anında düzleştirir ve
+sabit boyutlu, tipli DataFrame batch'leri üretir. Geniş düzleştirilmiş CSV
+hiçbir zaman oluşturulmaz.
+
+Desteklenen girdiler:
+- JSONL / NDJSON: satır başına bir kayıt
+- JSON array: '[{...}, {...}]' - ijson kuruluysa onunla, değilse
+  json.JSONDecoder.raw_decode ile parça parça (dosya belleğe alınmaz)
+- '.gz' uzantılı sıkıştırılmış dosyalar
+
+Batch'ler incremental_ingest ile Parquet store'a upsert edilir; böylece ham
+scrape doğrudan dedup + delta dönüşümlerine akar. Final dataset'te
+kullanılmayan path'ler ingest_projection ile okuma sırasında atlanır.
+"""
+
+import gzip
+import json
+import re
+import sys
+
+import pandas as pd
+
+from ingest_projection import default_projection, raw_projection_columns
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+PATH_SEPARATOR = '/'
+DEFAULT_BATCH_SIZE = 5000
+READ_CHUNK_SIZE = 1 << 20
+JSONL_SUFFIXES = ('.jsonl', '.ndjson')
+
+_WHITESPACE = re.compile(r'[\s,]*')
+
+
+def open_raw_file(path, binary=False):
+    """Ham dosyayı açar ('.gz' ise gzip ile); ijson binary handle bekler"""
+    if path.endswith('.gz'):
+        return gzip.open(path, 'rb') if binary else gzip.open(path, 'rt', encoding='utf-8')
+    return open(path, 'rb') if binary else open(path, 'r', encoding='utf-8')
+
+
+def _is_jsonl(path, handle):
+    """Uzantıdan veya ilk anlamlı karakterden formatı belirler ('[' → array)"""
+    name = path[:-3] if path.endswith('.gz') else path
+    if name.endswith(JSONL_SUFFIXES):
+        return True
+    while True:
+        char = handle.read(1)
+        if not char or not char.isspace():
+            break
+    return char != '['
+
+
+def _iter_jsonl(handle):
+    for line in handle:
+        line = line.strip()
+        if line:
+            yield json.loads(line)
+
+
+def _iter_json_array(handle):
+    """'[' sonrası array elemanlarını parça parça decode eder"""
+    decoder = json.JSONDecoder()
+    buffer = ''
+    position = 0
+    exhausted = False
+
+    while True:
+        position = _WHITESPACE.match(buffer, position).end()
+        if position < len(buffer) and buffer[position] == ']':
+            return
+        try:
+            record, end = decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError:
+            if exhausted:
+                if buffer[position:].strip():
+                    raise
+                return
+            # Kayıt parçanın sınırına denk geldi: tüketilen kısmı at, yeni parça ekle
+            chunk = handle.read(READ_CHUNK_SIZE)
+            exhausted = not chunk
+            buffer = buffer[position:] + chunk
+            position = 0
+            continue
+        yield record
+        position = end
+
+
+def iter_raw_records(path):
+    """Ham dosyadaki kayıtları tek tek üretir"""
+    with open_raw_file(path) as handle:
+        if _is_jsonl(path, handle):
+            handle.seek(0)
+            yield from _iter_jsonl(handle)
+            return
+        if ijson is None:
+            # '[' _is_jsonl tarafından tüketildi
+            yield from _iter_json_array(handle)
+            return
+
+    with open_raw_file(path, binary=True) as handle:
+        yield from ijson.items(handle, 'item', use_float=True)
+
+
+def flatten_record(record, prefix='', projection=None):
+    """İç içe kaydı 'a/b/0/c' path'li (path, değer) çiftlerine düzleştirir
+
+    Boş dict / list'ler sütun üretmez (CSV flatten çıktısıyla aynı).
+    projection verilirse (ingest_projection.resolve_projection) yalnızca
+    okunacak path'ler üretilir; gerekli path'e gitmeyen alt ağaçlara inilmez.
+    """
+    if isinstance(record, dict):
+        items = record.items()
+    elif isinstance(record, list):
+        items = enumerate(record)
+    else:
+        yield prefix, record
+        return
+
+    for key, value in items:
+        path = f"{prefix}{PATH_SEPARATOR}{key}" if prefix else str(key)
+        if projection is not None and path not in projection['paths']:
+            if path not in projection['prefixes'] or not isinstance(value, (dict, list)):
+                continue
+            yield from flatten_record(value, path, projection)
+        elif isinstance(value, (dict, list)):
+            # Projeksiyondaki bir path'in tüm alt ağacı okunur
+            yield from flatten_record(value, path)
+        else:
+            yield path, value
+
+
+def _columns_to_frame(columns, row_count, column_order):
+    """Path → değer listeleri sözlüğünü tipli DataFrame'e çevirir
+
+    Tip çıkarımı pandas'a bırakılır (int + null → float64, string → object),
+    böylece batch'ler read_csv çıktısıyla aynı dtype'ları taşır. Sütunlar
+    şimdiye kadar görülen tüm path'lerin keşif sırasıyla hizalanır.
+    """
+    for values in columns.values():
+        if len(values) < row_count:
+            values.extend([None] * (row_count - len(values)))
+    for path in columns:
+        if path not in column_order:
+            column_order[path] = len(column_order)
+    frame = pd.DataFrame(columns)
+    return frame.reindex(columns=list(column_order))
+
+
+def iter_record_batches(path, batch_size=DEFAULT_BATCH_SIZE, projection=None):
+    """Ham kayıtları düzleştirilmiş, tipli DataFrame batch'leri olarak üretir
+
+    projection: ingest_projection.resolve_projection çıktısı (None → tüm path'ler)
+    """
+    column_order = {}
+    columns = {}
+    row_count = 0
+
+    for record in iter_raw_records(path):
+        for column_path, value in flatten_record(record, projection=projection):
+            values = columns.get(column_path)
+            if values is None:
+                values = columns[column_path] = [None] * row_count
+            elif len(values) < row_count:
+                values.extend([None] * (row_count - len(values)))
+            values.append(value)
+        row_count += 1
+
+        if row_count == batch_size:
+            yield _columns_to_frame(columns, row_count, column_order)
+            columns = {}
+            row_count = 0
+
+    if row_count > 0:
+        yield _columns_to_frame(columns, row_count, column_order)
+
+
+def ingest_raw_json(path, store_dir=None, batch_size=DEFAULT_BATCH_SIZE, projection=None, quiet=True):
+    """Ham JSON / JSONL dosyasını batch batch incremental store'a upsert eder
+
+    Returns:
+        dict: toplam batch / kayıt sayısı ve incremental_ingest sayaçlarının toplamı
+    """
+    from incremental_ingest import STORE_DIR, incremental_ingest
+
+    store_dir = STORE_DIR if store_dir is None else store_dir
+    totals = {'batches': 0, 'records': 0, 'columns': 0, 'new': 0, 'changed': 0,
+              'unchanged': 0, 'duplicate_in_batch': 0, 'missing_id': 0,
+              'transformed_rows': 0, 'parts': []}
+
+    schema = raw_projection_columns(projection) if projection is not None else []
+    for batch in iter_record_batches(path, batch_size=batch_size, projection=projection):
+        # Batch'te hiç görülmeyen projeksiyon path'leri (ör. formattedIndustries/2) NA sütun olarak eklenir
+        missing = [column for column in schema if column not in batch.columns]
+        if missing:
+            batch = batch.reindex(columns=list(batch.columns) + missing)
+        summary = incremental_ingest(batch, store_dir=store_dir, quiet=quiet)
+        totals['batches'] += 1
+        totals['records'] += len(batch)
+        totals['columns'] = max(totals['columns'], len(batch.columns))
+        for key in ('new', 'changed', 'unchanged', 'duplicate_in_batch', 'missing_id', 'transformed_rows'):
+            totals[key] += summary[key]
+        if summary['part'] is not None:
+            totals['parts'].append(summary['part'])
+    return totals
+
+
+def main():
+    """Ham scrape dosyasını store'a stream eder"""
+
+    print("📥 LinkedIn Jobs Dataset - Streaming Raw JSON Ingest")
+    print("=" * 60)
+
+    if len(sys.argv) < 2:
+        print("Kullanım: python raw_json_ingest.py <raw.json|raw.jsonl[.gz]> [store_dir] [batch_size]")
+        return
+
+    raw_file = sys.argv[1]
+    store_dir = sys.argv[2] if len(sys.argv) > 2 else None
+    batch_size = int(sys.argv[3]) if len(sys.argv) > 3 else DEFAULT_BATCH_SIZE
+
+    print(f"📄 Girdi: {raw_file} (batch: {batch_size:,} kayıt, "
+          f"parser: {'ijson' if ijson is not None else 'json stream'})")
+
+    projection = default_projection()
+    if projection is not None:
+        print(f"✂️ Projeksiyon: {len(projection['paths'])} path okunacak (final dataset + türetilmiş sütun kaynakları)")
+    else:
+        print("⚠️ Projeksiyon yok: tüm path'ler okunacak")
+
+    try:
+        totals = ingest_raw_json(raw_file, store_dir=store_dir, batch_size=batch_size, projection=projection)
+    except Exception as e:
+        print(f"❌ HATA: Raw ingest başarısız - {e}")
+        return
+
+    print(f"✅ {totals['records']:,} kayıt, {totals['batches']} batch, {totals['columns']} düzleştirilmiş sütun")
+    print(f"   🆕 Yeni: {totals['new']:,} | ✏️ Değişmiş: {totals['changed']:,} | "
+          f"⏭️ Değişmemiş: {totals['unchanged']:,}")
+    print(f"   🔁 Batch içi tekrar: {totals['duplicate_in_batch']:,} | ❓ id'siz: {totals['missing_id']:,}")
+    print(f"   🔧 Dönüştürülen satır: {totals['transformed_rows']:,} | 💾 Part: {len(totals['parts'])}")
+
+if __name__ == "__main__":
+    main()
@@ -1,139 +1,152 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+LinkedIn Jobs Dataset - Redundant entityUrn Validation
+jobApplicantInsights/entityUrn sütununun id ile redundancy doğrulaması.
+"""
+
 import pandas as pd
 import numpy as np
 from collections import Counter
 import warnings
 warnings.filterwarnings('ignore')
 
-print("🔍 REDUNDANT ENTITY URN VALIDATION ANALYSIS")
-print("="*55)
-
-# Load the dataset
-df = pd.read_csv('linkedin_jobs_with_combined_functions.csv')
-
-target_column = 'jobApplicantInsights/entityUrn'
-
-print("1. REDUNDANCY CONFIRMATION ANALYSIS")
-print("-"*40)
-
-# Key columns with similar characteristics
-similar_columns = ['id', 'salary/entityUrn', 'posterId']
-all_columns = [target_column] + similar_columns
-
-print("📊 Sütun karşılaştırması:")
-for col in all_columns:
-    if col in df.columns:
-        unique_count = df[col].nunique()
-        null_percentage = (df[col].isna().sum() / len(df) * 100)
-        print(f"   {col}:")
-        print(f"      Unique değer: {unique_count:,}")
-        print(f"      Boş veri: {null_percentage:.1f}%")
-        
-        # Sample values
-        sample = df[col].dropna().head(3).tolist()
-        print(f"      Örnek: {sample}")
-        print()
-
-print("2. UNIQUE COUNT OVERLAP ANALYSIS")
-print("-"*40)
-
-# Check if same unique counts indicate redundancy
-target_unique = df[target_column].nunique()
-id_unique = df['id'].nunique()
-salary_urn_unique = df['salary/entityUrn'].nunique()
-
-print(f"🔍 Kritik Bulgu:")
-print(f"   jobApplicantInsights/entityUrn: {target_unique:,} unique")
-print(f"   id: {id_unique:,} unique")
-print(f"   salary/entityUrn: {salary_urn_unique:,} unique")
-
-if target_unique == id_unique == salary_urn_unique:
-    print(f"\n⚠️  ÇOK CİDDİ REDUNDANCY!")
-    print(f"   3 sütun da AYNI unique count'a sahip!")
-    print(f"   Bu muhtemelen aynı entity'nin farklı representations'ı")
-
-print("\n3. DATA INTEGRITY PROBLEMS")
-print("-"*40)
-
-# Duplicate analysis for target column
-duplicate_count = df[target_column].duplicated().sum()
-duplicate_percentage = (duplicate_count / len(df) * 100)
-
-print(f"📈 Data Quality Metrikleri:")
-print(f"   Toplam kayıt: {len(df):,}")
-print(f"   Tekrar eden değer: {duplicate_count:,}")
-print(f"   Duplicate oranı: {duplicate_percentage:.1f}%")
-print(f"   Unique ratio: {(df[target_column].nunique() / len(df) * 100):.1f}%")
-
-if duplicate_percentage > 50:
-    print(f"\n🚨 CİDDİ PROBLEM:")
-    print(f"   %{duplicate_percentage:.1f} duplicate oranı KABUL EDİLEMEZ!")
-    print(f"   Normal unique identifier bu kadar duplicate olmaz!")
-
-print("\n4. BUSINESS VALUE ASSESSMENT")
-print("-"*40)
-
-print("💼 Business Value Analizi:")
-print(f"   - Internal tracking URN (LinkedIn-specific)")
-print(f"   - End-user analytics için değeri düşük")
-print(f"   - Aynı bilgiyi 'id' sütunu daha clean şekilde veriyor")
-print(f"   - Storage overhead: {target_column} sütunu gereksiz")
-
-print(f"\n5. ALTERNATIVE COLUMNS VALIDATION")
-print("-"*40)
-
-# Check if id column can replace functionality
-print("🔄 Alternatif sütun analizi:")
-print(f"   'id' sütunu: {df['id'].nunique():,} unique, {(df['id'].isna().sum() / len(df) * 100):.1f}% null")
-print(f"   'id' duplicate: {df['id'].duplicated().sum()} (Perfect uniqueness!)")
-print(f"   'id' format: Clean integer/string identifier")
-
-print(f"\n   SONUÇ: 'id' sütunu tüm ihtiyaçları karşılıyor!")
-
-print("\n6. DELETION RECOMMENDATION VALIDATION")
-print("-"*40)
-
-print("✅ SİLME KARARININ GEREKÇELERİ:")
-print(f"   1. YÜKSEK REDUNDANCY: %{duplicate_percentage:.1f} duplicate")
-print(f"   2. DÜŞÜK UNIQUE RATIO: %{(df[target_column].nunique() / len(df) * 100):.1f}")
-print(f"   3. ALTERNATIVE MEVCUT: 'id' sütunu daha iyi")
-print(f"   4. BUSINESS VALUE: Internal tracking - kullanıcı için gereksiz")
-print(f"   5. DATA QUALITY: Data integrity problems")
-
-recommendation_score = 0
-if duplicate_percentage > 50:
-    recommendation_score += 3
-if df[target_column].nunique() == df['id'].nunique():
-    recommendation_score += 2
-if df['id'].duplicated().sum() == 0:
-    recommendation_score += 2
-if duplicate_percentage > 60:
-    recommendation_score += 1
-
-print(f"\n📊 SİLME ÖNCELİĞİ SKORU: {recommendation_score}/8")
-
-if recommendation_score >= 6:
-    print("🎯 SONUÇ: KESINLIKLE SİL!")
-elif recommendation_score >= 4:
-    print("🎯 SONUÇ: SİLMEYİ ÖNERİRİZ")
-else:
-    print("🎯 SONUÇ: TEKRAR DÜŞÜN")
-
-print("\n7. IMPLEMENTATION PLAN")
-print("-"*40)
-
-print("🔧 Silme implementasyonu:")
-print(f"   1. Backup: Önce yedek al")
-print(f"   2. Validation: 'id' sütununun işlevselliğini doğrula") 
-print(f"   3. Drop: {target_column} sütununu sil")
-print(f"   4. Test: Tüm analytics'lerin çalıştığını kontrol et")
-print(f"   5. Monitor: Performance improvement'ı ölç")
-
-# Calculate potential storage savings
-memory_usage = df[target_column].memory_usage(deep=True) / 1024 / 1024  # MB
-print(f"\n💾 STORAGE SAVINGS:")
-print(f"   Sütun boyutu: {memory_usage:.2f} MB")
-print(f"   Column count: 90 → 89 (1 sütun azalma)")
-
-print("\n" + "="*55)
-print("VALIDATION COMPLETED!")
-print(f"🎯 KULLANICI KARARI: DOĞRU VE GEREKLİ!") 
\ No newline at end of file
+def main():
+    """entityUrn redundancy doğrulamasını çalıştırır"""
+
+    print("🔍 REDUNDANT ENTITY URN VALIDATION ANALYSIS")
+    print("="*55)
+
+    # Load the dataset
+    df = pd.read_csv('linkedin_jobs_with_combined_functions.csv')
+
+    target_column = 'jobApplicantInsights/entityUrn'
+
+    print("1. REDUNDANCY CONFIRMATION ANALYSIS")
+    print("-"*40)
+
+    # Key columns with similar characteristics
+    similar_columns = ['id', 'salary/entityUrn', 'posterId']
+    all_columns = [target_column] + similar_columns
+
+    print("📊 Sütun karşılaştırması:")
+    for col in all_columns:
+        if col in df.columns:
+            unique_count = df[col].nunique()
+            null_percentage = (df[col].isna().sum() / len(df) * 100)
+            print(f"   {col}:")
+            print(f"      Unique değer: {unique_count:,}")
+            print(f"      Boş veri: {null_percentage:.1f}%")
+
+            # Sample values
+            sample = df[col].dropna().head(3).tolist()
+            print(f"      Örnek: {sample}")
+            print()
+
+    print("2. UNIQUE COUNT OVERLAP ANALYSIS")
+    print("-"*40)
+
+    # Check if same unique counts indicate redundancy
+    target_unique = df[target_column].nunique()
+    id_unique = df['id'].nunique()
+    salary_urn_unique = df['salary/entityUrn'].nunique()
+
+    print(f"🔍 Kritik Bulgu:")
+    print(f"   jobApplicantInsights/entityUrn: {target_unique:,} unique")
+    print(f"   id: {id_unique:,} unique")
+    print(f"   salary/entityUrn: {salary_urn_unique:,} unique")
+
+    if target_unique == id_unique == salary_urn_unique:
+        print(f"\n⚠️  ÇOK CİDDİ REDUNDANCY!")
+        print(f"   3 sütun da AYNI unique count'a sahip!")
+        print(f"   Bu muhtemelen aynı entity'nin farklı representations'ı")
+
+    print("\n3. DATA INTEGRITY PROBLEMS")
+    print("-"*40)
+
+    # Duplicate analysis for target column
+    duplicate_count = df[target_column].duplicated().sum()
+    duplicate_percentage = (duplicate_count / len(df) * 100)
+
+    print(f"📈 Data Quality Metrikleri:")
+    print(f"   Toplam kayıt: {len(df):,}")
+    print(f"   Tekrar eden değer: {duplicate_count:,}")
+    print(f"   Duplicate oranı: {duplicate_percentage:.1f}%")
+    print(f"   Unique ratio: {(df[target_column].nunique() / len(df) * 100):.1f}%")
+
+    if duplicate_percentage > 50:
+        print(f"\n🚨 CİDDİ PROBLEM:")
+        print(f"   %{duplicate_percentage:.1f} duplicate oranı KABUL EDİLEMEZ!")
+        print(f"   Normal unique identifier bu kadar duplicate olmaz!")
+
+    print("\n4. BUSINESS VALUE ASSESSMENT")
+    print("-"*40)
+
+    print("💼 Business Value Analizi:")
+    print(f"   - Internal tracking URN (LinkedIn-specific)")
+    print(f"   - End-user analytics için değeri düşük")
+    print(f"   - Aynı bilgiyi 'id' sütunu daha clean şekilde veriyor")
+    print(f"   - Storage overhead: {target_column} sütunu gereksiz")
+
+    print(f"\n5. ALTERNATIVE COLUMNS VALIDATION")
+    print("-"*40)
+
+    # Check if id column can replace functionality
+    print("🔄 Alternatif sütun analizi:")
+    print(f"   'id' sütunu: {df['id'].nunique():,} unique, {(df['id'].isna().sum() / len(df) * 100):.1f}% null")
+    print(f"   'id' duplicate: {df['id'].duplicated().sum()} (Perfect uniqueness!)")
+    print(f"   'id' format: Clean integer/string identifier")
+
+    print(f"\n   SONUÇ: 'id' sütunu tüm ihtiyaçları karşılıyor!")
+
+    print("\n6. DELETION RECOMMENDATION VALIDATION")
+    print("-"*40)
+
+    print("✅ SİLME KARARININ GEREKÇELERİ:")
+    print(f"   1. YÜKSEK REDUNDANCY: %{duplicate_percentage:.1f} duplicate")
+    print(f"   2. DÜŞÜK UNIQUE RATIO: %{(df[target_column].nunique() / len(df) * 100):.1f}")
+    print(f"   3. ALTERNATIVE MEVCUT: 'id' sütunu daha iyi")
+    print(f"   4. BUSINESS VALUE: Internal tracking - kullanıcı için gereksiz")
+    print(f"   5. DATA QUALITY: Data integrity problems")
+
+    recommendation_score = 0
+    if duplicate_percentage > 50:
+        recommendation_score += 3
+    if df[target_column].nunique() == df['id'].nunique():
+        recommendation_score += 2
+    if df['id'].duplicated().sum() == 0:
+        recommendation_score += 2
+    if duplicate_percentage > 60:
+        recommendation_score += 1
+
+    print(f"\n📊 SİLME ÖNCELİĞİ SKORU: {recommendation_score}/8")
+
+    if recommendation_score >= 6:
+        print("🎯 SONUÇ: KESINLIKLE SİL!")
+    elif recommendation_score >= 4:
+        print("🎯 SONUÇ: SİLMEYİ ÖNERİRİZ")
+    else:
+        print("🎯 SONUÇ: TEKRAR DÜŞÜN")
+
+    print("\n7. IMPLEMENTATION PLAN")
+    print("-"*40)
+
+    print("🔧 Silme implementasyonu:")
+    print(f"   1. Backup: Önce yedek al")
+    print(f"   2. Validation: 'id' sütununun işlevselliğini doğrula") 
+    print(f"   3. Drop: {target_column} sütununu sil")
+    print(f"   4. Test: Tüm analytics'lerin çalıştığını kontrol et")
+    print(f"   5. Monitor: Performance improvement'ı ölç")
+
+    # Calculate potential storage savings
+    memory_usage = df[target_column].memory_usage(deep=True) / 1024 / 1024  # MB
+    print(f"\n💾 STORAGE SAVINGS:")
+    print(f"   Sütun boyutu: {memory_usage:.2f} MB")
+    print(f"   Column count: 90 → 89 (1 sütun azalma)")
+
+    print("\n" + "="*55)
+    print("VALIDATION COMPLETED!")
+    print(f"🎯 KULLANICI KARARI: DOĞRU VE GEREKLİ!") 
+
+if __name__ == "__main__":
+    main()
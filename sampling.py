@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+LinkedIn Jobs Dataset - Reproducible Sampling Engine
+Analizlerin dosya sırasına bağlı .head(N) / seed'siz .sample(N) örnekleri
+yerine seed'li, temsili örnekler ve güven aralıklı oran tahminleri üretir.
+
+- reservoir_sample: tek geçişli iterable'lardan (raw_json_ingest kayıtları)
+  Algorithm L ile k elemanlı düzgün örnek
+- reservoir_sample_frames: chunk / batch akışından satır örneği; her satıra
+  rastgele anahtar verilip en küçük k anahtar tutulur (bottom-k), bu yüzden
+  farklı batch'lerin örnekleri birleştirilebilir
+- stratified_sample: industry / urgency / investment type gibi katmanlara
+  orantılı dağıtılmış örnek; orantılı payı min_per_stratum'un altında kalan
+  küçük katmanlar tek bir 'OTHER' katmanında birleştirilir, toplam n'i aşmaz
+- proportion_ci / stratified_proportion: Wilson ve katmanlı (ağırlıklı
+  katman varyansı) güven aralıkları
+
+Seed PIPELINE_SAMPLE_SEED ile değiştirilebilir; aynı seed aynı örneği verir.
+"""
+
+import itertools
+import math
+import os
+import sys
+from statistics import NormalDist
+
+import numpy as np
+import pandas as pd
+
+SAMPLE_SEED_ENV = 'PIPELINE_SAMPLE_SEED'
+DEFAULT_SEED = 42
+DEFAULT_SAMPLE_SIZE = 1000
+DEFAULT_CONFIDENCE = 0.95
+MIN_PER_STRATUM = 2
+OTHER_STRATUM = 'OTHER'
+
+# Analizlerde kullanılan katman sütunları (ilk bulunan kullanılır)
+STRATA_COLUMNS = {
+    'industry': ['industries_consolidated', 'formattedIndustries/0', 'company/industry/0'],
+    'urgency': ['job_urgency_category', 'job_urgency_level'],
+    'investment': ['job_investment_type', 'contentSource'],
+}
+
+# Çoklu değerli ('A | B') sütunlarda katman birincil (ilk) değerdir
+MULTI_VALUE_STRATA = {'industries_consolidated'}
+MULTI_VALUE_SEPARATOR = ' | '
+
+_RANDOM_KEY_COLUMN = '__sample_key'
+_STREAM_END = object()
+
+
+def sample_seed(seed=None):
+    """Açık seed yoksa PIPELINE_SAMPLE_SEED, o da yoksa DEFAULT_SEED"""
+    if seed is not None:
+        return seed
+    return int(os.environ.get(SAMPLE_SEED_ENV, DEFAULT_SEED))
+
+
+def strata_column(df, kind):
+    """STRATA_COLUMNS[kind] içinden dataset'te bulunan ilk sütun (yoksa None)"""
+    return next((col for col in STRATA_COLUMNS[kind] if col in df.columns), None)
+
+
+def strata_values(df, column):
+    """Katman anahtarı; çoklu değerli sütunlarda tam kombinasyon yerine birincil değer"""
+    values = df[column]
+    if column in MULTI_VALUE_STRATA:
+        values = values.astype('string').str.split(MULTI_VALUE_SEPARATOR, n=1, regex=False).str[0]
+    return values
+
+
+def _open_unit(rng):
+    """(0, 1) aralığında uniform değer (log için 0 hariç)"""
+    while True:
+        value = rng.random()
+        if value > 0:
+            return value
+
+
+def reservoir_sample(iterable, k, seed=None):
+    """Tek geçişte k elemanlı düzgün örnek (Algorithm L, O(k log(N/k)) rastgele sayı)"""
+    rng = np.random.default_rng(sample_seed(seed))
+    iterator = iter(iterable)
+    reservoir = list(itertools.islice(iterator, k))
+    if len(reservoir) < k or k == 0:
+        return reservoir
+
+    w = math.exp(math.log(_open_unit(rng)) / k)
+    while True:
+        skip = int(math.log(_open_unit(rng)) / math.log(1 - w))
+        item = next(itertools.islice(iterator, skip, None), _STREAM_END)
+        if item is _STREAM_END:
+            return reservoir
+        reservoir[int(rng.integers(k))] = item
+        w *= math.exp(math.log(_open_unit(rng)) / k)
+
+
+def reservoir_sample_frames(frames, k, seed=None):
+    """DataFrame chunk / batch akışından k satırlık düzgün örnek
+
+    Her satıra uniform anahtar atanır ve en küçük k anahtar tutulur; bellek
+    O(k + chunk). Sonuç orijinal index'i korur.
+    """
+    rng = np.random.default_rng(sample_seed(seed))
+    reservoir = None
+    for frame in frames:
+        keyed = frame.assign(**{_RANDOM_KEY_COLUMN: rng.random(len(frame))})
+        reservoir = keyed if reservoir is None else pd.concat([reservoir, keyed])
+        if len(reservoir) > k:
+            reservoir = reservoir.nsmallest(k, _RANDOM_KEY_COLUMN)
+    if reservoir is None:
+        return pd.DataFrame()
+    return reservoir.drop(columns=_RANDOM_KEY_COLUMN)
+
+
+def allocate_sample(sizes, n, min_per_stratum=MIN_PER_STRATUM):
+    """Örnek büyüklüğünü katmanlara orantılı dağıtır (largest remainder)
+
+    Her katmandan en az min_per_stratum satır alınır (varyans tahmini için);
+    tabanın getirdiği fazlalık en büyük paylardan düşülür, toplam n'i aşmaz.
+    Tabanlar tek başına n'i aşıyorsa (çok sayıda katman) küçük katmanlar
+    önce collapse_small_strata ile birleştirilmelidir.
+    """
+    sizes = np.asarray(sizes, dtype=np.int64)
+    total = int(sizes.sum())
+    if n >= total:
+        return sizes.copy()
+
+    quotas = sizes * n / total
+    allocation = np.floor(quotas).astype(np.int64)
+    remainder = n - int(allocation.sum())
+    if remainder > 0:
+        order = np.argsort(-(quotas - allocation), kind='stable')[:remainder]
+        allocation[order] += 1
+    floors = np.minimum(sizes, min_per_stratum)
+    allocation = np.minimum(np.maximum(allocation, floors), sizes)
+
+    excess = int(allocation.sum()) - n
+    for h in np.argsort(-allocation, kind='stable'):
+        if excess <= 0:
+            break
+        cut = min(excess, int(allocation[h] - floors[h]))
+        allocation[h] -= cut
+        excess -= cut
+    return allocation
+
+
+def collapse_small_strata(sizes, n, min_per_stratum=MIN_PER_STRATUM):
+    """Orantılı payı min_per_stratum'un altındaki katmanları tek katmanda birleştirir
+
+    Returns:
+        (mapping, collapsed_sizes, has_other): eski katman kodu → yeni kod;
+        birleşen katman varsa son kod 'other' katmanıdır
+    """
+    sizes = np.asarray(sizes, dtype=np.int64)
+    total = int(sizes.sum())
+    small = sizes * n < min_per_stratum * total if total > n else np.zeros(len(sizes), dtype=bool)
+    if small.sum() < 2:
+        return np.arange(len(sizes)), sizes, False
+
+    kept = np.flatnonzero(~small)
+    mapping = np.full(len(sizes), len(kept), dtype=np.int64)
+    mapping[kept] = np.arange(len(kept))
+    collapsed_sizes = np.append(sizes[kept], sizes[small].sum())
+    return mapping, collapsed_sizes, True
+
+
+def stratified_sample(df, strata, n=DEFAULT_SAMPLE_SIZE, seed=None, min_per_stratum=MIN_PER_STRATUM):
+    """Katmanlara orantılı, seed'li örnek
+
+    Args:
+        strata: katman sütunu, sütun listesi veya df ile hizalı Series
+            (NA kendi katmanıdır; küçük katmanlar OTHER_STRATUM'da birleşir)
+
+    Returns:
+        (sample, design): design tahmin fonksiyonları için katman kodları
+        (sample index'iyle hizalı), katman etiketleri, popülasyon ve örnek
+        büyüklükleri
+    """
+    rng = np.random.default_rng(sample_seed(seed))
+    grouped = df.groupby(strata, dropna=False, sort=True)
+    group_sizes = grouped.size()
+    mapping, sizes, has_other = collapse_small_strata(group_sizes.to_numpy(dtype=np.int64), n, min_per_stratum)
+    codes = mapping[grouped.ngroup().to_numpy()]
+    labels = [label for label, code in zip(group_sizes.index, mapping) if code < len(sizes) - has_other]
+    if has_other:
+        labels.append(OTHER_STRATUM)
+    allocation = allocate_sample(sizes, n, min_per_stratum)
+
+    # Katman içinde rastgele sıralama: ilk allocation[h] satır seçilir
+    ranks = pd.Series(rng.random(len(df))).groupby(codes).rank(method='first').to_numpy()
+    selected = ranks <= allocation[codes]
+
+    sample = df[selected]
+    design = {
+        'strata': strata,
+        'labels': labels,
+        'codes': pd.Series(codes[selected], index=sample.index),
+        'population': sizes,
+        'sample': allocation
+    }
+    return sample, design
+
+
+def _z_value(confidence):
+    return NormalDist().inv_cdf((1 + confidence) / 2)
+
+
+def proportion_ci(successes, n, confidence=DEFAULT_CONFIDENCE, population=None):
+    """Basit rastgele örnek oranı için Wilson güven aralığı (%)
+
+    population verilirse sonlu popülasyon düzeltmesi uygulanır
+    (örnek popülasyonun tamamıysa aralık tek noktaya daralır).
+    """
+    if n == 0:
+        return {'rate': None, 'lower': None, 'upper': None, 'n': 0}
+
+    p = successes / n
+    if population is not None and n >= population:
+        return {'rate': p * 100, 'lower': p * 100, 'upper': p * 100, 'n': int(n)}
+
+    effective_n = n
+    if population is not None and population > 1:
+        effective_n = n * (population - 1) / (population - n)
+
+    z = _z_value(confidence)
+    denominator = 1 + z**2 / effective_n
+    center = (p + z**2 / (2 * effective_n)) / denominator
+    margin = z * math.sqrt(p * (1 - p) / effective_n + z**2 / (4 * effective_n**2)) / denominator
+    return {
+        'rate': p * 100,
+        'lower': max(0.0, center - margin) * 100,
+        'upper': min(1.0, center + margin) * 100,
+        'n': int(n)
+    }
+
+
+def stratified_proportion(mask, design, confidence=DEFAULT_CONFIDENCE):
+    """Katmanlı örnekten popülasyon oranı ve normal yaklaşımlı güven aralığı (%)
+
+    mask: örnek satırlarında koşulu sağlayanlar (bool Series, sample index'li)
+    Tek satırlı katmanlar varyansa katkı vermez.
+    """
+    codes = design['codes'].to_numpy()
+    population = design['population'].astype('float64')
+    strata_count = len(population)
+
+    hits = np.bincount(codes, weights=mask.reindex(design['codes'].index).fillna(False).to_numpy(dtype='float64'),
+                       minlength=strata_count)
+    sampled = np.bincount(codes, minlength=strata_count).astype('float64')
+    if sampled.sum() == 0:
+        return {'rate': None, 'lower': None, 'upper': None, 'n': 0}
+
+    present = sampled > 0
+    weights = np.where(present, population, 0.0) / population[present].sum()
+    p_h = np.divide(hits, sampled, out=np.zeros(strata_count), where=present)
+    estimate = float((weights * p_h).sum())
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        fpc = 1 - sampled / population
+        variance_h = np.where(sampled > 1, fpc * p_h * (1 - p_h) / (sampled - 1), 0.0)
+    margin = _z_value(confidence) * math.sqrt(float((weights**2 * variance_h).sum()))
+    return {
+        'rate': estimate * 100,
+        'lower': max(0.0, estimate - margin) * 100,
+        'upper': min(1.0, estimate + margin) * 100,
+        'n': int(sampled.sum())
+    }
+
+
+def format_ci(estimate):
+    """'%42.1 (%39.8 - %44.5, n=1,000)' biçiminde özet"""
+    if estimate['rate'] is None:
+        return "örnek yok"
+    return (f"%{estimate['rate']:.1f} (%{estimate['lower']:.1f} - %{estimate['upper']:.1f}, "
+            f"n={estimate['n']:,})")
+
+
+def main():
+    """Final dataset'te katmanlı örnek tahminini tam sonuçla karşılaştırır"""
+
+    print("🎲 LinkedIn Jobs Dataset - Reproducible Sampling Engine")
+    print("=" * 60)
+
+    input_file = sys.argv[1] if len(sys.argv) > 1 else 'fixed_all_company_colums.csv'
+    sample_size = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_SAMPLE_SIZE
+    try:
+        df = pd.read_csv(input_file)
+        print(f"✅ Dataset yüklendi: {len(df):,} satır, {len(df.columns)} sütun")
+        print(f"🎯 Örnek: {sample_size:,} satır, seed {sample_seed()}")
+        print()
+    except Exception as e:
+        print(f"❌ HATA: Dataset yüklenemedi - {e}")
+        return
+
+    if 'has_company_logo' not in df.columns:
+        print("❌ HATA: has_company_logo sütunu yok - karşılaştırma yapılamaz")
+        return
+
+    target = df['has_company_logo'].fillna(False).astype(bool)
+    print(f"📊 Tam dataset logo oranı: %{target.mean() * 100:.1f}")
+
+    for kind in STRATA_COLUMNS:
+        column = strata_column(df, kind)
+        if column is None:
+            continue
+        sample, design = stratified_sample(df, strata_values(df, column), sample_size)
+        estimate = stratified_proportion(target.loc[sample.index], design)
+        print(f"   • {kind} ({column}, {len(design['labels'])} katman): {format_ci(estimate)}")
+
+    simple = reservoir_sample_frames([df], sample_size)
+    simple_estimate = proportion_ci(int(target.loc[simple.index].sum()), len(simple), population=len(df))
+    print(f"   • basit rastgele: {format_ci(simple_estimate)}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+LinkedIn Jobs Dataset - Header-Only Schema Validator
+Pipeline checkpoint'lerinin sütun post-condition'larını (silinmiş / oluşturulmuş
+sütunlar, null oranı eşikleri) dataset'i parse etmeden doğrular.
+
+- Sütun listesi: CSV'de yalnızca header satırı, Parquet'te footer schema'sı okunur.
+- Null oranları: Parquet'te row group istatistikleri (null_count),
+  CSV'de ise dosyanın yanındaki '<dosya>.stats.json' sidecar'ı kullanılır.
+  Sidecar, pipeline adımı CSV'yi yazarken bellekteki DataFrame'den üretilir
+  (checkpoint_gate); dosya boyutu / mtime değişmişse bayat sayılır.
+
+Böylece 13 checkpoint'in doğrulanması 13 tam read_csv yerine
+milisaniyeler sürer. pandas / pyarrow yalnızca tarama veya Parquet
+okuması gerektiğinde import edilir; header ve sidecar doğrulaması hızlı başlar.
+"""
+
+import csv
+import json
+import os
+import time
+
+STATS_SUFFIX = '.stats.json'
+HIGH_NULL_THRESHOLD = 95.0
+
+# process_final_column_deletions.py ile fixed_all_company_colums.csv'den silinen sütunlar
+FINAL_DELETED_COLUMNS = [
+    'companyLinkedinUrl',
+    'jobState',
+    'salaryInsights/salaryExplorerUrl',
+    'company/universalName'
+]
+
+# (dosya, bu adımda oluşturulan sütunlar, bu adımda silinen sütunlar) - pipeline sırasıyla
+PIPELINE_STEPS = [
+    ('linkedin_jobs_dataset_cleaned_columns.csv', [],
+     ['merged_companyDescription', 'company/followingState/followingType']),
+    ('linkedin_jobs_dataset_optimized_step2.csv', [],
+     ['company/followingState/preDashFollowingInfoUrn']),
+    ('linkedin_jobs_dataset_optimized_step3.csv', ['industries_consolidated'],
+     ['formattedIndustries/0', 'formattedIndustries/1', 'formattedIndustries/2', 'company/industry/0']),
+    ('linkedin_jobs_dataset_optimized_step4.csv', ['company_logo_url'],
+     ['company/logo', 'companyLogo']),
+    ('linkedin_jobs_dataset_optimized_step5.csv', ['has_company_logo'],
+     ['company_logo_url']),
+    ('linkedin_jobs_dataset_optimized_step6.csv', [],
+     ['company/name']),
+    ('linkedin_jobs_dataset_optimized_step7.csv', ['job_investment_type'],
+     ['contentSource']),
+    ('linkedin_jobs_dataset_optimized_step8.csv',
+     ['job_urgency_level', 'expire_month', 'expire_quarter', 'expire_day_of_week',
+      'expire_season', 'is_business_day', 'is_month_end', 'is_quarter_end',
+      'optimal_application_window'],
+     ['expire_datetime', 'days_to_expire']),
+    ('linkedin_jobs_dataset_optimized_step9.csv', ['job_functions_combined'],
+     ['jobFunctions/0', 'jobFunctions/1', 'jobFunctions/2',
+      'formattedJobFunctions/0', 'formattedJobFunctions/1', 'formattedJobFunctions/2']),
+    ('linkedin_jobs_dataset_optimized_step10.csv', [],
+     ['jobApplicantInsights/entityUrn']),
+    ('linkedin_jobs_dataset_optimized_step11.csv', [],
+     ['workRemoteAllowed']),
+    ('linkedin_jobs_dataset_optimized_step12.csv', [],
+     ['link']),
+    ('linkedin_jobs_dataset_optimized_step13.csv', ['job_urgency_category'],
+     []),
+]
+
+
+def _build_checkpoints(steps):
+    """Adım bazlı değişiklikleri kümülatif post-condition'lara çevirir"""
+    checkpoints = {}
+    created, deleted = [], []
+    for file_name, step_created, step_deleted in steps:
+        created = [c for c in created if c not in step_deleted] + step_created
+        deleted = [c for c in deleted if c not in step_created] + step_deleted
+        checkpoints[file_name] = {
+            'must_exist': list(created),
+            'must_not_exist': list(deleted),
+            'max_null_pct': None
+        }
+    return checkpoints
+
+
+CHECKPOINTS = _build_checkpoints(PIPELINE_STEPS)
+CHECKPOINTS['fixed_all_company_colums.csv'] = {
+    'must_exist': [],
+    'must_not_exist': list(FINAL_DELETED_COLUMNS),
+    'max_null_pct': None
+}
+
+
+def _pyarrow_parquet():
+    """pyarrow.parquet'i ilk Parquet erişiminde import eder (kurulu değilse None)"""
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        return None
+    return pq
+
+
+def read_columns(path):
+    """Dosyanın sütun listesini veri satırlarını okumadan döndürür"""
+    if path.endswith('.parquet'):
+        pq = _pyarrow_parquet()
+        if pq is None:
+            raise ImportError("Parquet schema okumak için pyarrow gerekli")
+        return list(pq.read_schema(path).names)
+
+    # utf-8-sig: BOM'lu CSV'lerde ilk sütun adı '\ufeffid' olarak gelmesin
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        return next(csv.reader(f), [])
+
+
+def stats_sidecar_path(path):
+    return path + STATS_SUFFIX
+
+
+def write_stats_sidecar(df, path):
+    """Yazılmış CSV için satır sayısı ve null count sidecar'ını bellekteki df'ten üretir"""
+    stat = os.stat(path)
+    stats = {
+        'source_size': stat.st_size,
+        'source_mtime_ns': stat.st_mtime_ns,
+        'rows': int(len(df)),
+        'columns': list(map(str, df.columns)),
+        'null_counts': {str(col): int(count) for col, count in df.isnull().sum().items()}
+    }
+    with open(stats_sidecar_path(path), 'w', encoding='utf-8') as f:
+        json.dump(stats, f, ensure_ascii=False)
+    return stats
+
+
+def _load_stats_sidecar(path):
+    sidecar = stats_sidecar_path(path)
+    if not os.path.exists(sidecar):
+        return None
+    with open(sidecar, encoding='utf-8') as f:
+        stats = json.load(f)
+    stat = os.stat(path)
+    if stats.get('source_size') != stat.st_size or stats.get('source_mtime_ns') != stat.st_mtime_ns:
+        return None
+    return stats
+
+
+def _parquet_statistics(path, pq):
+    metadata = pq.ParquetFile(path).metadata
+    names = [metadata.schema.column(i).path for i in range(metadata.num_columns)]
+    null_counts = dict.fromkeys(names, 0)
+    for rg in range(metadata.num_row_groups):
+        row_group = metadata.row_group(rg)
+        for i, name in enumerate(names):
+            statistics = row_group.column(i).statistics
+            if statistics is None or not statistics.has_null_count:
+                return None
+            null_counts[name] += statistics.null_count
+    return {'rows': metadata.num_rows, 'columns': names, 'null_counts': null_counts}
+
+
+def column_statistics(path, allow_scan=True, chunksize=100_000):
+    """Satır sayısı + null count'ları metadata'dan döndürür
+
+    CSV için geçerli sidecar yoksa ve allow_scan=True ise dosya bir kez
+    chunk'lar halinde taranır ve sidecar yazılır; allow_scan=False ise None döner.
+    Sidecar normalde adımın checkpoint_gate çağrısında yazılır; check
+    script'leri allow_scan=False kullanır.
+
+    Returns:
+        dict: rows, columns, null_counts, source ('parquet_footer' / 'sidecar' / 'scan')
+    """
+    if path.endswith('.parquet'):
+        pq = _pyarrow_parquet()
+        if pq is None:
+            return None
+        stats = _parquet_statistics(path, pq)
+        if stats is not None:
+            stats['source'] = 'parquet_footer'
+        return stats
+
+    stats = _load_stats_sidecar(path)
+    if stats is not None:
+        stats['source'] = 'sidecar'
+        return stats
+    if not allow_scan:
+        return None
+
+    import pandas as pd
+
+    rows = 0
+    null_counts = None
+    for chunk in pd.read_csv(path, chunksize=chunksize):
+        rows += len(chunk)
+        counts = chunk.isnull().sum()
+        null_counts = counts if null_counts is None else null_counts + counts
+
+    columns = read_columns(path)
+    stats = {
+        'source_size': os.stat(path).st_size,
+        'source_mtime_ns': os.stat(path).st_mtime_ns,
+        'rows': rows,
+        'columns': columns,
+        'null_counts': {col: int(null_counts[col]) if null_counts is not None else 0 for col in columns}
+    }
+    with open(stats_sidecar_path(path), 'w', encoding='utf-8') as f:
+        json.dump(stats, f, ensure_ascii=False)
+    stats['source'] = 'scan'
+    return stats
+
+
+def null_percentages(stats):
+    """column_statistics çıktısından sütun → null yüzdesi"""
+    rows = stats['rows']
+    return {col: (count / rows * 100) if rows > 0 else 0.0 for col, count in stats['null_counts'].items()}
+
+
+def validate_checkpoint(path, spec=None, null_threshold=HIGH_NULL_THRESHOLD, allow_scan=False):
+    """Tek checkpoint dosyasının post-condition'larını doğrular
+
+    Returns:
+        dict: file, exists, column_count, still_exists, missing, high_null_columns,
+        null_stats_source, passed, elapsed_ms
+    """
+    start = time.perf_counter()
+    if spec is None:
+        spec = CHECKPOINTS.get(os.path.basename(path), {'must_exist': [], 'must_not_exist': [], 'max_null_pct': None})
+
+    result = {
+        'file': path,
+        'exists': os.path.exists(path),
+        'column_count': 0,
+        'still_exists': [],
+        'missing': [],
+        'high_null_columns': [],
+        'null_stats_source': None,
+        'passed': False
+    }
+
+    if result['exists']:
+        columns = set(read_columns(path))
+        result['column_count'] = len(columns)
+        result['still_exists'] = [col for col in spec['must_not_exist'] if col in columns]
+        result['missing'] = [col for col in spec['must_exist'] if col not in columns]
+
+        stats = column_statistics(path, allow_scan=allow_scan)
+        if stats is not None:
+            result['null_stats_source'] = stats['source']
+            result['row_count'] = stats['rows']
+            result['high_null_columns'] = sorted(
+                ((col, pct) for col, pct in null_percentages(stats).items() if pct > null_threshold),
+                key=lambda item: -item[1]
+            )
+
+        max_null_pct = spec.get('max_null_pct')
+        null_ok = max_null_pct is None or all(pct <= max_null_pct for _, pct in result['high_null_columns'])
+        result['passed'] = not result['still_exists'] and not result['missing'] and null_ok
+
+    result['elapsed_ms'] = (time.perf_counter() - start) * 1000
+    return result
+
+
+def checkpoint_gate(path, df=None):
+    """Pipeline adımı dosyayı yazdıktan sonra çağrılan hızlı doğrulama
+
+    df verilirse CSV için stats sidecar'ı ek parse olmadan üretilir.
+    """
+    if df is not None and not path.endswith('.parquet'):
+        write_stats_sidecar(df, path)
+
+    result = validate_checkpoint(path)
+    status = "✅ PASSED" if result['passed'] else "🚨 FAILED"
+    print(f"🛡️ Schema gate ({os.path.basename(path)}): {status} [{result['elapsed_ms']:.1f} ms]")
+    for col in result['still_exists']:
+        print(f"   🚨 {col} - STILL EXISTS!")
+    for col in result['missing']:
+        print(f"   🚨 {col} - MISSING!")
+    return result
+
+
+def validate_pipeline(checkpoints=CHECKPOINTS, allow_scan=False):
+    """Tüm checkpoint'leri (mevcut olanları) doğrular"""
+    return [validate_checkpoint(path, spec, allow_scan=allow_scan) for path, spec in checkpoints.items()]
+
+
+def main():
+    """Tüm pipeline checkpoint'lerinin header-only doğrulaması"""
+
+    print("🛡️ LinkedIn Jobs Dataset - Header-Only Schema Validator")
+    print("=" * 60)
+
+    start = time.perf_counter()
+    results = validate_pipeline()
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    for result in results:
+        name = os.path.basename(result['file'])
+        if not result['exists']:
+            print(f"   ⏭️ {name}: dosya yok")
+            continue
+
+        status = "✅" if result['passed'] else "🚨"
+        print(f"   {status} {name}: {result['column_count']} sütun [{result['elapsed_ms']:.1f} ms]")
+        for col in result['still_exists']:
+            print(f"      🚨 {col} - STILL EXISTS!")
+        for col in result['missing']:
+            print(f"      🚨 {col} - MISSING!")
+        if result['null_stats_source'] is not None:
+            print(f"      📊 >%{HIGH_NULL_THRESHOLD:.0f} null: {len(result['high_null_columns'])} sütun ({result['null_stats_source']})")
+
+    checked = [r for r in results if r['exists']]
+    failed = [r for r in checked if not r['passed']]
+    print(f"\n📊 SONUÇ: {len(checked)} checkpoint doğrulandı, {len(failed)} başarısız ({elapsed_ms:.1f} ms)")
+
+if __name__ == "__main__":
+    main()
@@ -7,9 +7,9 @@ company/followingState/preDashFollowingInfoUrn sütunun kapsamlı analizi
 
 import pandas as pd
 import numpy as np
-from collections import Counter
 import re
 import warnings
+from urn_index import urn_prefix_counts
 warnings.filterwarnings('ignore')
 
 def analyze_predash_following_info_urn(df):
@@ -124,20 +124,14 @@ def analyze_predash_following_info_urn(df):
         
         # URN prefix analysis
         if len(non_null_data) > 0:
-            # Extract URN prefixes
-            urn_prefixes = []
-            for val in non_null_data:
-                if str(val).startswith('urn:'):
-                    parts = str(val).split(':')
-                    if len(parts) >= 3:
-                        prefix = ':'.join(parts[:3])  # urn:li:something
-                        urn_prefixes.append(prefix)
+            # Extract URN prefixes (urn:li:something) - vektörel
+            prefix_counts = urn_prefix_counts(non_null_data)
             
-            if urn_prefixes:
-                prefix_counts = Counter(urn_prefixes)
+            if len(prefix_counts) > 0:
+                total_prefixed = prefix_counts.sum()
                 print(f"   🔗 URN prefixes found: {len(prefix_counts)}")
-                for prefix, count in prefix_counts.most_common(5):
-                    pct = (count / len(urn_prefixes)) * 100
+                for prefix, count in prefix_counts.head(5).items():
+                    pct = (count / total_prefixed) * 100
                     print(f"      📊 {prefix}: {count:,} ({pct:.1f}%)")
         
         # Uzunluk analizi
@@ -184,11 +178,8 @@ def analyze_predash_following_info_urn(df):
         print(f"🔧 Special characters: {special_chars:,} values")
         
         # Format inconsistency detection
-        inconsistent_formats = []
-        for val in non_null_data.head(20):  # Sample check
-            val_str = str(val)
-            if not val_str.startswith('urn:'):
-                inconsistent_formats.append(val_str)
+        text_values = non_null_data.astype(str)
+        inconsistent_formats = text_values[~text_values.str.startswith('urn:')].tolist()
         
         if inconsistent_formats:
             print(f"⚠️ Format inconsistencies detected: {len(inconsistent_formats)} samples")
@@ -11,7 +11,10 @@ Output: linkedin_jobs_after_step1_job_functions.csv
 
 import pandas as pd
 import numpy as np
+from pipeline_profiler import profile_step
+from schema_validator import checkpoint_gate
 
+@profile_step
 def step1_job_functions_consolidation():
     """Step 1: Job Functions Consolidation"""
     
@@ -99,6 +102,7 @@ def step1_job_functions_consolidation():
     
     # Save result
     df_cleaned.to_csv(output_file, index=False)
+    checkpoint_gate(output_file, df_cleaned)
     
     print(f"\n💾 STEP 1 OUTPUT SAVED:")
     print(f"   • File: {output_file}")
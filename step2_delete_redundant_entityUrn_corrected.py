@@ -11,7 +11,10 @@ Output: linkedin_jobs_after_step2_entityUrn_eliminated.csv
 
 import pandas as pd
 import numpy as np
+from pipeline_profiler import profile_step
+from schema_validator import checkpoint_gate
 
+@profile_step
 def step2_eliminate_entityUrn_redundancy():
     """Step 2: EntityUrn Redundancy Elimination"""
     
@@ -102,6 +105,7 @@ def step2_eliminate_entityUrn_redundancy():
     
     # Save result
     df_cleaned.to_csv(output_file, index=False)
+    checkpoint_gate(output_file, df_cleaned)
     
     print(f"\n💾 STEP 2 OUTPUT SAVED:")
     print(f"   • File: {output_file}")
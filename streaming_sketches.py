@@ -0,0 +1,420 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+LinkedIn Jobs Dataset - Streaming Sketch Profiling
+Sütunları tam bellekte nunique() / value_counts() / Counter(...) yerine
+sabit boyutlu, birleştirilebilir sketch'lerle profiller:
+
+- HyperLogLog (2^14 register, ~%0.8 hata): benzersiz değer sayısı
+- Count-Min: herhangi bir değerin frekans tahmini (yalnızca fazla sayar)
+- SpaceSaving: top-k değerler, her sayım için hata sınırıyla
+- t-digest: string uzunluğu / sayısal değer quantile'ları
+
+Her chunk (read_csv chunksize, raw_json_ingest batch'i) kendi içinde
+işlenip profile eklenir; profiller chunk'lar ve scrape batch'leri arasında
+birleştirilebilir ve diske yazılabilir. Böylece ham dump'lar dosya
+boyutundan bağımsız bellekte profillenir.
+"""
+
+import os
+import pickle
+import sys
+
+import numpy as np
+import pandas as pd
+
+SKETCH_PROFILE_ENV = 'PIPELINE_SKETCH_PROFILE'
+PROFILE_PATH = 'linkedin_jobs_profile.sketch.pkl'
+PROFILE_SUFFIX = '.sketch.pkl'
+
+HLL_PRECISION = 14
+CMS_WIDTH = 2048
+CMS_DEPTH = 4
+TOP_K_CAPACITY = 256
+TDIGEST_COMPRESSION = 100
+DEFAULT_CHUNK_SIZE = 100_000
+REPORT_QUANTILES = (0.5, 0.9, 0.99)
+
+
+def sketch_profile_enabled():
+    return os.environ.get(SKETCH_PROFILE_ENV, '0') == '1'
+
+
+def hash_values(values):
+    """NA'sız değerler → uint64 hash
+
+    Sayısal değerler float64'e, diğerleri str'e normalize edilir; böylece
+    aynı değer int / float / object / string[pyarrow] batch'lerinde aynı
+    hash'i alır (hash_pandas_object sabit anahtarlıdır).
+    """
+    values = pd.Series(values)
+    if pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_bool_dtype(values):
+        normalized = values.astype('float64')
+    else:
+        normalized = values.astype(str).astype(object)
+    return pd.util.hash_pandas_object(normalized, index=False).to_numpy(dtype=np.uint64)
+
+
+# HyperLogLog
+
+def _leading_zeros(words):
+    """uint64 dizisinde baştaki sıfır bit sayısı (ikili arama, vektörel)"""
+    words = words.copy()
+    zeros = np.zeros(len(words), dtype=np.uint8)
+    for shift in (32, 16, 8, 4, 2, 1):
+        empty = words < np.uint64(1 << (64 - shift))
+        zeros[empty] += shift
+        words[empty] <<= np.uint64(shift)
+    return zeros
+
+
+def hll_create(precision=HLL_PRECISION):
+    return {'precision': precision, 'registers': np.zeros(1 << precision, dtype=np.uint8)}
+
+
+def hll_add(hll, hashes):
+    precision = hll['precision']
+    buckets = (hashes >> np.uint64(64 - precision)).astype(np.intp)
+    # Sentinel bit rank'ı 64 - precision + 1 ile sınırlar
+    remaining = (hashes << np.uint64(precision)) | np.uint64(1 << (precision - 1))
+    np.maximum.at(hll['registers'], buckets, _leading_zeros(remaining) + 1)
+
+
+def hll_merge(left, right):
+    return {'precision': left['precision'], 'registers': np.maximum(left['registers'], right['registers'])}
+
+
+def hll_estimate(hll):
+    registers = hll['registers']
+    m = len(registers)
+    alpha = 0.7213 / (1 + 1.079 / m)
+    raw = alpha * m * m / np.sum(np.exp2(-registers.astype('float64')))
+    zeros = int(np.count_nonzero(registers == 0))
+    if raw <= 2.5 * m and zeros > 0:
+        # Küçük kardinalitede linear counting
+        return m * np.log(m / zeros)
+    return float(raw)
+
+
+# Count-Min
+
+def cms_create(width=CMS_WIDTH, depth=CMS_DEPTH):
+    return {'table': np.zeros((depth, width), dtype=np.int64)}
+
+
+def _cms_buckets(hashes, width, depth):
+    """64-bit hash'ten depth adet bucket (Kirsch-Mitzenmacher double hashing)"""
+    low = hashes & np.uint64(0xFFFFFFFF)
+    high = (hashes >> np.uint64(32)) | np.uint64(1)
+    return [((low + np.uint64(row) * high) % np.uint64(width)).astype(np.intp) for row in range(depth)]
+
+
+def cms_add(cms, hashes, counts):
+    depth, width = cms['table'].shape
+    for row, buckets in enumerate(_cms_buckets(hashes, width, depth)):
+        cms['table'][row] += np.bincount(buckets, weights=counts, minlength=width).astype(np.int64)
+
+
+def cms_query(cms, hashes):
+    depth, width = cms['table'].shape
+    estimates = [cms['table'][row][buckets] for row, buckets in enumerate(_cms_buckets(hashes, width, depth))]
+    return np.min(estimates, axis=0)
+
+
+def cms_merge(left, right):
+    return {'table': left['table'] + right['table']}
+
+
+# SpaceSaving top-k
+
+def topk_create(capacity=TOP_K_CAPACITY):
+    """counts / errors: değer → sayım / fazla sayım sınırı; floor: izlenmeyen değerlerin sayım üst sınırı"""
+    return {
+        'capacity': capacity,
+        'counts': pd.Series(dtype='int64'),
+        'errors': pd.Series(dtype='int64'),
+        'floor': 0
+    }
+
+
+def topk_merge(left, right):
+    """İki summary'yi birleştirir: izlenmeyen değerler diğer tarafın floor'u kadar sayılır"""
+    capacity = left['capacity']
+    index = left['counts'].index.union(right['counts'].index)
+    counts = (left['counts'].reindex(index, fill_value=left['floor'])
+              + right['counts'].reindex(index, fill_value=right['floor']))
+    errors = (left['errors'].reindex(index, fill_value=left['floor'])
+              + right['errors'].reindex(index, fill_value=right['floor']))
+
+    floor = left['floor'] + right['floor']
+    if len(counts) > capacity:
+        order = np.argsort(-counts.to_numpy(), kind='stable')
+        floor = max(floor, int(counts.iloc[order[capacity]]))
+        keep = order[:capacity]
+        counts, errors = counts.iloc[keep], errors.iloc[keep]
+    return {'capacity': capacity, 'counts': counts, 'errors': errors, 'floor': floor}
+
+
+def topk_from_counts(value_counts, capacity=TOP_K_CAPACITY):
+    """Chunk'ın tam value_counts'u → hatasız summary"""
+    exact = {'capacity': capacity, 'counts': value_counts.astype('int64'),
+             'errors': pd.Series(0, index=value_counts.index, dtype='int64'), 'floor': 0}
+    return topk_merge(topk_create(capacity), exact)
+
+
+def topk_items(topk, k=10):
+    """[(değer, tahmini sayım, hata sınırı)] - gerçek sayım [sayım - hata, sayım] aralığında"""
+    top = topk['counts'].sort_values(ascending=False, kind='stable').head(k)
+    errors = topk['errors'].reindex(top.index)
+    return [(value, int(count), int(error)) for value, count, error in zip(top.index, top, errors)]
+
+
+# t-digest
+
+def tdigest_create(compression=TDIGEST_COMPRESSION):
+    return {'compression': compression, 'means': np.empty(0), 'weights': np.empty(0),
+            'min': np.inf, 'max': -np.inf}
+
+
+def _k_scale(q, compression):
+    """k1 scale function: k(q) = δ / 2π · arcsin(2q - 1)"""
+    return compression / (2 * np.pi) * np.arcsin(np.clip(2 * q - 1, -1, 1))
+
+
+def _k_scale_inverse(k, compression):
+    return (np.sin(np.clip(k * 2 * np.pi / compression, -np.pi / 2, np.pi / 2)) + 1) / 2
+
+
+def _tdigest_compress(means, weights, compression):
+    """Sıralı centroid'leri merging t-digest kuralıyla birleştirir
+
+    Bir centroid, kapsadığı quantile aralığı k(q_sağ) - k(q_sol) <= 1 kaldıkça
+    komşusunu yutar. Her grubun sağ sınırı cumsum üzerinde searchsorted ile
+    bulunur; döngü girdi değil çıktı centroid sayısı kadar döner.
+    """
+    if len(means) == 0:
+        return means, weights
+    order = np.argsort(means, kind='stable')
+    means, weights = means[order], weights[order]
+    cumulative = np.cumsum(weights)
+    total = cumulative[-1]
+
+    starts = []
+    start, left_weight = 0, 0.0
+    while start < len(means):
+        q_limit = _k_scale_inverse(_k_scale(left_weight / total, compression) + 1, compression)
+        # Tek başına sınırı aşan centroid de kendi grubunu oluşturur
+        end = max(int(np.searchsorted(cumulative, q_limit * total, side='right')), start + 1)
+        starts.append(start)
+        start, left_weight = end, cumulative[end - 1]
+
+    merged_weights = np.add.reduceat(weights, starts)
+    merged_sums = np.add.reduceat(weights * means, starts)
+    return merged_sums / merged_weights, merged_weights
+
+
+def tdigest_add(digest, values):
+    values = np.asarray(values, dtype='float64')
+    values = values[~np.isnan(values)]
+    if len(values) == 0:
+        return
+    means, weights = _tdigest_compress(
+        np.concatenate([digest['means'], values]),
+        np.concatenate([digest['weights'], np.ones(len(values))]),
+        digest['compression']
+    )
+    digest.update(means=means, weights=weights,
+                  min=min(digest['min'], float(values.min())), max=max(digest['max'], float(values.max())))
+
+
+def tdigest_merge(left, right):
+    means, weights = _tdigest_compress(
+        np.concatenate([left['means'], right['means']]),
+        np.concatenate([left['weights'], right['weights']]),
+        left['compression']
+    )
+    return {'compression': left['compression'], 'means': means, 'weights': weights,
+            'min': min(left['min'], right['min']), 'max': max(left['max'], right['max'])}
+
+
+def tdigest_quantile(digest, q):
+    weights = digest['weights']
+    if len(weights) == 0:
+        return None
+    total = weights.sum()
+    positions = np.concatenate([[0.0], np.cumsum(weights) - weights / 2, [total]])
+    values = np.concatenate([[digest['min']], digest['means'], [digest['max']]])
+    return float(np.interp(q * total, positions, values))
+
+
+# Sütun / dataset profili
+
+def column_profile_create():
+    return {
+        'non_null': 0,
+        'hll': hll_create(),
+        'cms': cms_create(),
+        'top': topk_create(),
+        'lengths': tdigest_create(),
+        'numbers': tdigest_create()
+    }
+
+
+def column_profile_update(profile, series):
+    """Bir chunk'taki sütun değerlerini sketch'lere ekler (chunk içi value_counts tam)"""
+    values = series.dropna()
+    if len(values) == 0:
+        return
+    profile['non_null'] += len(values)
+
+    value_counts = values.value_counts(sort=False)
+    hashes = hash_values(value_counts.index)
+    hll_add(profile['hll'], hashes)
+    cms_add(profile['cms'], hashes, value_counts.to_numpy(dtype='float64'))
+    profile['top'] = topk_merge(profile['top'], topk_from_counts(value_counts))
+
+    if pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_bool_dtype(values):
+        tdigest_add(profile['numbers'], values.to_numpy(dtype='float64'))
+    else:
+        tdigest_add(profile['lengths'], values.astype(str).str.len().to_numpy(dtype='float64'))
+
+
+def column_profile_merge(left, right):
+    return {
+        'non_null': left['non_null'] + right['non_null'],
+        'hll': hll_merge(left['hll'], right['hll']),
+        'cms': cms_merge(left['cms'], right['cms']),
+        'top': topk_merge(left['top'], right['top']),
+        'lengths': tdigest_merge(left['lengths'], right['lengths']),
+        'numbers': tdigest_merge(left['numbers'], right['numbers'])
+    }
+
+
+def profile_create():
+    return {'rows': 0, 'columns': {}}
+
+
+def profile_update(profile, chunk, columns=None):
+    """DataFrame chunk'ını profile ekler (yeni sütunlar ilk görüldükleri chunk'ta açılır)"""
+    columns = chunk.columns if columns is None else [col for col in columns if col in chunk.columns]
+    profile['rows'] += len(chunk)
+    for column in columns:
+        column_profile = profile['columns'].setdefault(column, column_profile_create())
+        column_profile_update(column_profile, chunk[column])
+    return profile
+
+
+def profile_merge(left, right):
+    """İki profili (chunk, dosya veya scrape batch'i) birleştirir"""
+    merged = {'rows': left['rows'] + right['rows'], 'columns': dict(left['columns'])}
+    for column, column_profile in right['columns'].items():
+        existing = merged['columns'].get(column)
+        merged['columns'][column] = (column_profile if existing is None
+                                     else column_profile_merge(existing, column_profile))
+    return merged
+
+
+def profile_frames(frames, columns=None):
+    profile = profile_create()
+    for frame in frames:
+        profile_update(profile, frame, columns)
+    return profile
+
+
+def profile_csv(path, columns=None, chunksize=DEFAULT_CHUNK_SIZE):
+    """CSV'yi chunk chunk profiller (bellek: chunk + sketch'ler)"""
+    return profile_frames(pd.read_csv(path, usecols=columns, chunksize=chunksize), columns)
+
+
+def profile_raw(path, columns=None, batch_size=DEFAULT_CHUNK_SIZE):
+    """Ham JSON / JSONL scrape'i düzleştirilmiş batch'ler halinde profiller"""
+    from raw_json_ingest import iter_record_batches
+
+    return profile_frames(iter_record_batches(path, batch_size=batch_size), columns)
+
+
+def profile_path(path, columns=None, chunksize=DEFAULT_CHUNK_SIZE):
+    """Dosya tipine göre profil: kayıtlı profil, CSV veya ham JSON / JSONL"""
+    if path.endswith(PROFILE_SUFFIX):
+        return load_profile(path)
+    name = path[:-3] if path.endswith('.gz') else path
+    if name.endswith(('.json', '.jsonl', '.ndjson')):
+        return profile_raw(path, columns, chunksize)
+    return profile_csv(path, columns, chunksize)
+
+
+def save_profile(profile, path=PROFILE_PATH):
+    with open(path, 'wb') as f:
+        pickle.dump(profile, f, protocol=pickle.HIGHEST_PROTOCOL)
+    return path
+
+
+def load_profile(path=PROFILE_PATH):
+    with open(path, 'rb') as f:
+        return pickle.load(f)
+
+
+def estimate_frequency(profile, column, value):
+    """Count-Min ile değerin frekans tahmini (gerçek sayımdan küçük olmaz)"""
+    return int(cms_query(profile['columns'][column]['cms'], hash_values([value]))[0])
+
+
+def summarize_column(profile, column, top=10):
+    """nunique / value_counts / describe yerine geçen sütun özeti"""
+    column_profile = profile['columns'][column]
+    rows = profile['rows']
+    nulls = rows - column_profile['non_null']
+    digest = column_profile['numbers'] if len(column_profile['numbers']['weights']) else column_profile['lengths']
+    return {
+        'rows': rows,
+        'non_null': column_profile['non_null'],
+        'null_percentage': nulls / rows * 100 if rows > 0 else 0.0,
+        'distinct_estimate': int(round(hll_estimate(column_profile['hll']))) if column_profile['non_null'] else 0,
+        'top_values': topk_items(column_profile['top'], top),
+        'quantile_kind': 'value' if digest is column_profile['numbers'] else 'length',
+        'quantiles': {q: tdigest_quantile(digest, q) for q in REPORT_QUANTILES}
+    }
+
+
+def print_column_summary(summary, column):
+    print(f"📊 {column}")
+    print(f"   Null: %{summary['null_percentage']:.1f} | ≈ Benzersiz: {summary['distinct_estimate']:,}")
+    quantiles = ', '.join(f"p{int(q * 100)}={value:.1f}" for q, value in summary['quantiles'].items()
+                          if value is not None)
+    if quantiles:
+        label = 'Değer' if summary['quantile_kind'] == 'value' else 'Uzunluk'
+        print(f"   {label} quantile'ları: {quantiles}")
+    for value, count, error in summary['top_values'][:5]:
+        bound = f" (±{error:,})" if error else ""
+        print(f"   • {str(value)[:60]}: {count:,}{bound}")
+
+
+def main():
+    """Bir veya daha fazla dosyayı (CSV, ham JSON/JSONL, kayıtlı profil) profiller ve birleştirir"""
+
+    print("📐 LinkedIn Jobs Dataset - Streaming Sketch Profiling")
+    print("=" * 60)
+
+    paths = sys.argv[1:] or ['linkedin_jobs_dataset_insights_completed.csv']
+    profile = profile_create()
+    for path in paths:
+        try:
+            profile = profile_merge(profile, profile_path(path))
+            print(f"✅ Profillendi: {path}")
+        except Exception as e:
+            print(f"❌ HATA: {path} profillenemedi - {e}")
+            return
+
+    print(f"📋 Toplam: {profile['rows']:,} satır, {len(profile['columns'])} sütun")
+    print()
+    for column in profile['columns']:
+        print_column_summary(summarize_column(profile, column), column)
+
+    try:
+        save_profile(profile)
+        print(f"\n💾 Profil kaydedildi: {PROFILE_PATH} (sonraki batch'lerle birleştirilebilir)")
+    except Exception as e:
+        print(f"❌ HATA: Profil kaydedilemedi - {e}")
+
+if __name__ == "__main__":
+    main()
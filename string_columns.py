@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+LinkedIn Jobs Dataset - Arrow-Backed String Columns
+Ağır metin sütunlarını (şirket açıklaması, başlık, şirket isimleri, URL'ler,
+birleştirilmiş industry / function sütunları) object dtype'lı Python str
+yerine string[pyarrow] olarak taşır.
+
+- string[pyarrow] değerleri tek bir Arrow buffer'ında tutar: satır başına
+  ~50 byte'lık PyObject başlığı ve pointer ortadan kalkar.
+- .str.strip / .str.contains / .str.split gibi işlemler Arrow compute
+  kernel'lerinde çalışır.
+- Eksik değer pd.NA'dır: 'if value:' gibi Python truthiness kontrolleri
+  yerine isna / fillna kullanılmalıdır.
+
+fast_loader bu sütunları CSV'den doğrudan string[pyarrow] olarak okur;
+pipeline adımlarında oluşturulan sütunlar to_arrow_strings ile çevrilir.
+"""
+
+import pandas as pd
+
+ARROW_STRING_DTYPE = 'string[pyarrow]'
+
+# Pipeline boyunca string[pyarrow] taşınan ağır metin sütunları
+ARROW_STRING_COLUMNS = [
+    'title',
+    'description',
+    'companyName',
+    'companyDescription',
+    'company/name',
+    'companyLinkedinUrl',
+    'link',
+    'industries_consolidated',
+    'job_functions_combined',
+]
+
+
+def to_arrow_strings(df, columns=None):
+    """Mevcut object / string sütunları string[pyarrow]'a çevirir (in-place, df döner)"""
+    columns = ARROW_STRING_COLUMNS if columns is None else columns
+    for column in columns:
+        if column not in df.columns:
+            continue
+        dtype = df[column].dtype
+        if dtype == object or (isinstance(dtype, pd.StringDtype) and dtype.storage != 'pyarrow'):
+            df[column] = df[column].astype(ARROW_STRING_DTYPE)
+    return df
+
+
+def clean_strings(series):
+    """string[pyarrow]'a çevirir, kenar boşluklarını siler, boş string → NA"""
+    text = series.astype(ARROW_STRING_DTYPE).str.strip()
+    return text.mask((text == '').fillna(False))
+
+
+def join_string_columns(df, columns, sep=' | ', dedupe=False):
+    """Sütunları satır bazında, eksik / boş değerleri atlayarak birleştirir
+
+    df.apply(axis=1) ile ' | '.join(...) yapan satır döngülerinin vektörel
+    karşılığı. dedupe=True ise aynı satırda daha önce geçen değer tekrar
+    eklenmez. Hiç değeri olmayan satırlar NA döner.
+    """
+    parts = []
+    for column in columns:
+        part = clean_strings(df[column])
+        if dedupe:
+            for previous in parts:
+                part = part.mask(part.eq(previous).fillna(False))
+        parts.append(part)
+
+    if not parts:
+        return pd.Series(pd.NA, index=df.index, dtype=ARROW_STRING_DTYPE)
+
+    combined = parts[0]
+    for part in parts[1:]:
+        joined = combined + sep + part
+        combined = joined.fillna(combined).fillna(part)
+    return combined
+
+
+def string_memory_report(df, columns=None):
+    """Sütun bazında object → string[pyarrow] bellek karşılaştırması (MB)"""
+    columns = ARROW_STRING_COLUMNS if columns is None else columns
+    report = {}
+    for column in columns:
+        if column not in df.columns:
+            continue
+        as_object = df[column].astype(object)
+        as_arrow = df[column].astype(ARROW_STRING_DTYPE)
+        report[column] = {
+            'object_mb': as_object.memory_usage(deep=True) / 1024**2,
+            'arrow_mb': as_arrow.memory_usage(deep=True) / 1024**2
+        }
+    return report
+
+
+def main():
+    """Final dataset'teki ağır metin sütunları için bellek karşılaştırması"""
+
+    print("🔤 LinkedIn Jobs Dataset - Arrow-Backed String Columns")
+    print("=" * 60)
+
+    try:
+        df = pd.read_csv('fixed_all_company_colums.csv')
+        print(f"✅ Dataset yüklendi: {len(df):,} satır, {len(df.columns)} sütun")
+        print()
+    except Exception as e:
+        print(f"❌ HATA: Dataset yüklenemedi - {e}")
+        return
+
+    report = string_memory_report(df)
+    total_object = sum(item['object_mb'] for item in report.values())
+    total_arrow = sum(item['arrow_mb'] for item in report.values())
+
+    for column, item in report.items():
+        print(f"📋 {column}: object {item['object_mb']:.2f} MB → string[pyarrow] {item['arrow_mb']:.2f} MB")
+    if total_object > 0:
+        print()
+        print(f"💾 Toplam: {total_object:.2f} MB → {total_arrow:.2f} MB "
+              f"(-%{(1 - total_arrow / total_object) * 100:.1f})")
+
+if __name__ == "__main__":
+    main()
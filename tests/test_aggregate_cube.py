@@ -0,0 +1,44 @@
+import numpy as np
+import pandas as pd
+
+from aggregate_cube import build_cube, cube_cache_path, cube_crosstab, load_or_build_cube
+
+
+def _jobs():
+    return pd.DataFrame({
+        'job_investment_type': ['ORGANIC', 'PREMIUM_OFFLINE', 'ORGANIC', 'ORGANIC'],
+        'job_urgency_level': ['NORMAL', 'HIGH_URGENT', 'HIGH_URGENT', 'NORMAL'],
+        'job_functions_combined': ['Engineering', 'Sales', 'Information Technology | Sales', None],
+    })
+
+
+def test_cube_crosstab_matches_pandas_crosstab():
+    df = _jobs()
+    cube = build_cube(df)
+
+    expected = pd.crosstab(df['job_investment_type'], df['job_urgency_level'], normalize='index')
+    result = cube_crosstab(cube, 'investment', 'urgency', normalize='index')
+    np.testing.assert_allclose(result.to_numpy(), expected.to_numpy())
+
+    tech = cube_crosstab(cube, 'investment', 'is_tech_function')
+    assert tech.loc['ORGANIC', True] == 2
+    assert tech.loc['ORGANIC', False] == 1
+
+
+def test_all_nan_job_functions_are_not_tech():
+    df = _jobs()
+    df['job_functions_combined'] = np.nan
+
+    tech = cube_crosstab(build_cube(df), 'investment', 'is_tech_function')
+    assert list(tech.columns) == [False]
+    assert tech[False].sum() == len(df)
+
+
+def test_load_or_build_cube_reuses_saved_cube(tmp_path):
+    df = _jobs()
+    path = cube_cache_path(str(tmp_path / 'jobs.csv'))
+
+    first = load_or_build_cube(df, path)
+    assert path.endswith('jobs.cube.parquet')
+    second = load_or_build_cube(df, path)
+    pd.testing.assert_frame_equal(first, second, check_dtype=False)
@@ -0,0 +1,11 @@
+import pandas as pd
+
+from analytics_store import STORE_ENV, populate_store_if_enabled
+
+
+def test_store_is_off_by_default(tmp_path, monkeypatch):
+    monkeypatch.delenv(STORE_ENV, raising=False)
+    monkeypatch.chdir(tmp_path)
+
+    assert populate_store_if_enabled(pd.DataFrame({'id': [1, 2]})) is None
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,38 @@
+import pandas as pd
+
+from company_dimension import (build_star_schema, join_company_attributes, key_resolution_report,
+                               resolve_natural_keys)
+
+
+def _postings():
+    return pd.DataFrame({
+        'id': [1, 2, 3, 4, 5],
+        'companyLinkedinUrl': ['https://linkedin.com/company/acme', None, None, 'https://linkedin.com/company/beta', None],
+        'companyName': ['Acme', 'ACME ', 'Gamma', 'Beta', None],
+        'companyDescription': ['Acme Corp', None, None, 'Beta Inc', None],
+        'company_logo_url': ['https://media.licdn.com/a.png', None, None, None, None],
+        'has_company_logo': [True, False, False, False, False],
+    })
+
+
+def test_name_only_postings_resolve_to_url_key():
+    df = _postings()
+    keys = resolve_natural_keys(df)
+
+    assert keys[0] == keys[1] == 'companyLinkedinUrl:https://linkedin.com/company/acme'
+    assert keys[2] == 'companyName:gamma'
+    assert key_resolution_report(keys) == {'companyLinkedinUrl': 3, 'companyName': 1, 'unresolved': 1}
+
+
+def test_logo_columns_stay_on_fact():
+    df = _postings()
+    fact, dimension = build_star_schema(df)
+
+    assert 'has_company_logo' in fact.columns and 'company_logo_url' in fact.columns
+    assert 'has_company_logo' not in dimension.columns
+    assert len(dimension) == 3
+    assert fact['companyId'].isna().sum() == 1
+
+    joined = join_company_attributes(fact, dimension)
+    assert joined['has_company_logo'].tolist() == df['has_company_logo'].tolist()
+    assert joined.loc[1, 'companyDescription'] == 'Acme Corp'
@@ -0,0 +1,59 @@
+import pandas as pd
+
+from datetime_comparison import compare_datetime_columns, find_redundant_datetime_columns, pair_metrics
+from expireAt_comprehensive_analysis import detect_datetime_duplicates, find_similar_datetime_columns
+
+
+def _sparse_copy_frame():
+    posted = pd.Series(pd.date_range('2024-01-01', periods=100, freq='h')).dt.strftime('%Y-%m-%dT%H:%M:%S')
+    expire = posted.copy()
+    expire[::9] = None  # ~%11 null, dolu satırlar birebir aynı
+    return pd.DataFrame({'postedAt': posted, 'expireAt': expire})
+
+
+def test_sparse_identical_column_is_duplicate():
+    df = _sparse_copy_frame()
+    comparison = compare_datetime_columns(df, ['expireAt', 'postedAt'])
+    metrics = pair_metrics(comparison, 'expireAt', 'postedAt')
+
+    assert metrics['exact_match_rate'] == 100.0
+    assert metrics['null_pattern_agreement'] < 90
+
+    duplicates = find_redundant_datetime_columns(comparison)['duplicates']
+    assert [item['columns'] for item in duplicates] == [('expireAt', 'postedAt')]
+    assert duplicates[0]['null_pattern_agreement'] == metrics['null_pattern_agreement']
+
+    analysis = detect_datetime_duplicates(df, 'expireAt', ['postedAt'], comparison)
+    assert analysis['duplicates_found']
+
+
+def test_disjoint_columns_are_not_duplicates():
+    df = _sparse_copy_frame()
+    df.loc[df['expireAt'].notna(), 'postedAt'] = None
+    comparison = compare_datetime_columns(df, ['expireAt', 'postedAt'])
+    assert find_redundant_datetime_columns(comparison)['duplicates'] == []
+
+
+def test_numeric_epoch_column_found_by_content():
+    df = pd.DataFrame({
+        'expireAt': [1893456000000, 1893542400000, None],
+        'listedAt': [1890864000000, 1890950400000, 1891036800000],
+        'applicants': [3, 12, 40],
+        'title': ['Data Engineer', 'Analyst', 'Developer'],
+    })
+    assert find_similar_datetime_columns(df, exclude_col='expireAt') == ['listedAt']
+
+
+def test_small_overlap_is_not_duplicate():
+    # İki seyrek sütun yalnızca birkaç satırda birlikte dolu ve orada eşleşiyor
+    stamps = pd.Series(pd.date_range('2024-01-01', periods=200, freq='h')).dt.strftime('%Y-%m-%dT%H:%M:%S')
+    df = pd.DataFrame({'postedAt': stamps.copy(), 'expireAt': stamps.copy()})
+    df.loc[100:, 'postedAt'] = None
+    df.loc[:94, 'expireAt'] = None
+
+    comparison = compare_datetime_columns(df, ['expireAt', 'postedAt'])
+    metrics = pair_metrics(comparison, 'expireAt', 'postedAt')
+
+    assert metrics['joint_count'] == 5
+    assert metrics['tolerance_match_rate'] == 100.0
+    assert find_redundant_datetime_columns(comparison)['duplicates'] == []
@@ -0,0 +1,48 @@
+import pandas as pd
+
+import datetime_detection
+import expireAt_comprehensive_analysis
+from datetime_detection import clear_format_cache, detect_datetime_format, is_datetime_candidate
+
+
+def test_format_cache_is_bounded_lru(monkeypatch):
+    monkeypatch.setattr(datetime_detection, 'FORMAT_CACHE_SIZE', 2)
+    clear_format_cache()
+    first = pd.Series(['2024-01-01'], name='a')
+
+    detect_datetime_format(first)
+    detect_datetime_format(pd.Series(['2024-01-02'], name='b'))
+    detect_datetime_format(first)  # a en son kullanılan olur
+    detect_datetime_format(pd.Series(['2024-01-03'], name='c'))
+
+    assert [name for name, _ in datetime_detection._FORMAT_CACHE] == ['a', 'c']
+    clear_format_cache()
+
+
+def test_datetime_candidate_prefilter():
+    assert is_datetime_candidate(pd.Series(['2024-01-01T10:00:00Z', '2024-02-01T10:00:00Z', None]))
+    assert is_datetime_candidate(pd.Series(['01.02.2024', '1/2/2024']))
+    assert is_datetime_candidate(pd.Series([1_700_000_000_000, 1_700_000_500_000]))
+    assert not is_datetime_candidate(pd.Series(['We are hiring a Senior Data Engineer', 'Remote']))
+    assert not is_datetime_candidate(pd.Series(['ORGANIC', 'PREMIUM_OFFLINE']))
+    assert not is_datetime_candidate(pd.Series([True, False]))
+
+
+def test_find_similar_skips_free_text_columns(monkeypatch):
+    checked = []
+
+    def fake_detect(df, columns):
+        checked.extend(columns)
+        return []
+
+    monkeypatch.setattr(expireAt_comprehensive_analysis, 'detect_datetime_columns', fake_detect)
+    df = pd.DataFrame({
+        'expireAt': [1_700_000_000_000, 1_700_000_500_000],
+        'listed': [1_699_000_000_000, 1_699_000_500_000],
+        'description': ['Build data pipelines', 'Own the analytics stack'],
+        'applied': ['2024-01-01 10:00:00', '2024-01-02 11:00:00'],
+    })
+
+    expireAt_comprehensive_analysis.find_similar_datetime_columns(df, 'expireAt')
+
+    assert checked == ['listed', 'applied']
@@ -0,0 +1,53 @@
+import pandas as pd
+
+from incremental_ingest import incremental_ingest, load_store
+
+
+def _step2_frame():
+    """Step-2 şemasında batch: step 3/4 sütunları henüz birleştirilmemiş / yeniden adlandırılmamış"""
+    return pd.DataFrame({
+        'id': [1, 2, 3],
+        'title': ['Data Engineer', 'Analyst', 'Developer'],
+        'companyName': ['X', 'Y', 'Z'],
+        'formattedIndustries/0': ['IT Services', None, 'Banking'],
+        'formattedIndustries/1': [None, 'IT Services', None],
+        'formattedIndustries/2': [None, None, None],
+        'company/industry/0': ['IT Services', 'Software', None],
+        'company/logo': ['https://media.licdn.com/x.png', None, None],
+        'companyLogo': ['https://media.licdn.com/x.png', 'https://media.licdn.com/y.png', None],
+        'contentSource': ['JOBS_PREMIUM_OFFLINE', 'JOBS_CREATE', None],
+        'expireAt': [1893456000000, 1893456000000, None],
+    })
+
+
+def test_incremental_ingest_on_step2_batch(tmp_path):
+    summary = incremental_ingest(_step2_frame(), store_dir=str(tmp_path))
+
+    assert summary['new'] == 3
+    assert summary['transformed_rows'] == 3
+    store = load_store(str(tmp_path))
+    for column in ['industries_consolidated', 'has_company_logo', 'job_investment_type', 'job_urgency_level']:
+        assert column in store.columns
+    for column in ['company/logo', 'companyLogo', 'company_logo_url', 'contentSource', 'formattedIndustries/0']:
+        assert column not in store.columns
+    assert store['has_company_logo'].tolist() == [True, True, False]
+
+
+def test_incremental_ingest_on_sparse_batch(tmp_path):
+    sparse = _step2_frame()[['id', 'title', 'formattedIndustries/0', 'expireAt']]
+
+    summary = incremental_ingest(sparse, store_dir=str(tmp_path))
+
+    assert summary['transformed_rows'] == 3
+    store = load_store(str(tmp_path))
+    assert store['has_company_logo'].tolist() == [False, False, False]
+    assert store['industries_consolidated'].notna().sum() == 2
+
+
+def test_unchanged_rows_are_skipped(tmp_path):
+    incremental_ingest(_step2_frame(), store_dir=str(tmp_path))
+
+    summary = incremental_ingest(_step2_frame(), store_dir=str(tmp_path))
+
+    assert summary['unchanged'] == 3
+    assert summary['part'] is None
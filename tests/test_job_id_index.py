@@ -0,0 +1,30 @@
+import numpy as np
+import pandas as pd
+
+from job_id_index import extract_job_ids, verify_url_id_redundancy
+
+
+def _jobs_frame():
+    return pd.DataFrame({
+        'id': [3791234567, 3791234568, 3791234569],
+        'link': ['https://www.linkedin.com/jobs/view/3791234567',
+                 'https://www.linkedin.com/jobs/view/analyst-3791234568',
+                 None],
+        'companyApplyUrl': [np.nan] * 3,
+    })
+
+
+def test_all_null_url_column_is_skipped():
+    job_ids, per_column = extract_job_ids(_jobs_frame())
+
+    assert list(per_column.columns) == ['link', 'companyApplyUrl']
+    assert per_column['companyApplyUrl'].isna().all()
+    assert job_ids.tolist() == [3791234567, 3791234568, pd.NA]
+
+
+def test_redundancy_on_all_null_url_column():
+    proof = verify_url_id_redundancy(_jobs_frame(), url_column='companyApplyUrl')
+    assert proof['url_count'] == 0 and proof['checked'] == 0
+
+    proof = verify_url_id_redundancy(_jobs_frame(), url_column='link')
+    assert proof['checked'] == 2 and proof['mapping_rate'] == 100.0
@@ -0,0 +1,37 @@
+import os
+
+import pandas as pd
+
+from lazy_query import collect, count_by, crosstab, parquet_cache_path, scan_csv, select_available
+
+
+def _write_jobs(path, investment_types):
+    pd.DataFrame({
+        'id': range(len(investment_types)),
+        'job_investment_type': investment_types,
+        'contentSource': ['JOBS_CREATE'] * len(investment_types),
+        'salary': pd.Series([50000, '60k', None][:len(investment_types)], dtype=object),
+    }).to_csv(path, index=False)
+
+
+def test_scan_csv_projects_available_columns(tmp_path):
+    csv_path = str(tmp_path / 'jobs.csv')
+    _write_jobs(csv_path, ['ORGANIC', 'PREMIUM_OFFLINE', 'ORGANIC'])
+
+    jobs = scan_csv(csv_path, backend='pandas')
+    df = collect(select_available(jobs, ['job_investment_type', 'company_size_category']))
+
+    assert list(df.columns) == ['job_investment_type']
+    assert count_by(jobs, 'job_investment_type').to_dict() == {'ORGANIC': 2, 'PREMIUM_OFFLINE': 1}
+    assert crosstab(jobs, 'job_investment_type', 'contentSource').loc['ORGANIC', 'JOBS_CREATE'] == 2
+
+
+def test_scan_csv_refreshes_stale_cache(tmp_path):
+    csv_path = str(tmp_path / 'jobs.csv')
+    _write_jobs(csv_path, ['ORGANIC'])
+    scan_csv(csv_path, backend='pandas')
+
+    _write_jobs(csv_path, ['ORGANIC', 'ORGANIC'])
+    os.utime(csv_path, (os.path.getmtime(parquet_cache_path(csv_path)) + 10,) * 2)
+
+    assert count_by(scan_csv(csv_path, backend='pandas'), 'job_investment_type').to_dict() == {'ORGANIC': 2}
@@ -0,0 +1,48 @@
+import pandas as pd
+import pyarrow as pa
+
+import mmap_dataset
+from datetime_detection import detect_datetime_format
+from mmap_dataset import export_arrow_ipc, load_dataset, open_mapped_table
+
+
+def test_mixed_type_object_column_exported_as_string(tmp_path, monkeypatch):
+    # low_memory chunk'lı okumada olduğu gibi: aynı sütunda sayı ve metin
+    mixed = pd.DataFrame({'id': [1, 2, 3], 'salary': pd.Series([50000, '60k', None], dtype=object)})
+    monkeypatch.setattr(mmap_dataset.pd, 'read_csv', lambda path: mixed)
+
+    arrow_path = export_arrow_ipc(str(tmp_path / 'jobs.csv'), str(tmp_path / 'jobs.arrow'))
+    table = open_mapped_table(arrow_path)
+
+    assert table.column('salary').to_pylist() == ['50000', '60k', None]
+    assert table.column('id').to_pylist() == [1, 2, 3]
+
+
+def test_load_dataset_keeps_columns_zero_copy_by_default(tmp_path):
+    csv_path = str(tmp_path / 'jobs.csv')
+    pd.DataFrame({
+        'id': range(3000),
+        'salary': [50000.0, None, 70000.0] * 1000,
+        'title': ['Senior Data Engineer', None, 'Business Analyst'] * 1000,
+    }).to_csv(csv_path, index=False)
+    load_dataset(csv_path)  # cache üretimi
+
+    allocated = pa.total_allocated_bytes()
+    df = load_dataset(csv_path, numpy_columns=['id'])
+
+    # string ve null'lu sütunlar mmap'li buffer'larda kalır (yalnızca küçük metadata)
+    assert pa.total_allocated_bytes() - allocated < 1024
+    assert isinstance(df['title'].dtype, pd.ArrowDtype)
+    assert isinstance(df['salary'].dtype, pd.ArrowDtype)
+    assert df['id'].dtype == 'int64'
+    assert df.select_dtypes(include=['object', 'string']).columns.tolist() == ['title']
+
+
+def test_datetime_detection_on_arrow_string_column(tmp_path):
+    csv_path = str(tmp_path / 'jobs.csv')
+    pd.DataFrame({'listedAt': ['2024-01-01 10:00:00', '2024-01-02 11:30:00', None]}).to_csv(csv_path, index=False)
+
+    detection = detect_datetime_format(load_dataset(csv_path)['listedAt'], use_cache=False)
+
+    assert detection['kind'] == 'string'
+    assert detection['formats'] == ['%Y-%m-%d %H:%M:%S']
@@ -0,0 +1,26 @@
+import importlib
+
+import pandas as pd
+
+from parallel_column_analysis import ANALYSIS_REGISTRY, default_jobs, unresolved_analyses
+
+
+def test_every_registry_entry_resolves():
+    assert unresolved_analyses() == {}
+
+
+def test_link_analyses_run_on_link_column():
+    df = pd.DataFrame({
+        'id': [101, 102, 103],
+        'link': ['https://www.linkedin.com/jobs/view/101', 'https://www.linkedin.com/jobs/view/102', None],
+    })
+    for name, spec in ANALYSIS_REGISTRY.items():
+        if name.startswith('link_'):
+            func = getattr(importlib.import_module(spec['module']), spec['function'])
+            func(df, 'link')
+
+
+def test_default_jobs_include_text_columns():
+    df = pd.DataFrame({'title': ['Data Engineer', 'Analyst'], 'applies': [3, 5],
+                       'mixed': pd.Series(['a', 1], dtype=object)})
+    assert default_jobs(df) == [('column_deep', 'title'), ('column_deep', 'mixed')]
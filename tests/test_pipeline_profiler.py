@@ -0,0 +1,28 @@
+import pandas as pd
+
+from pipeline_profiler import PROFILE_LOG_ENV, load_spans, profile_step
+
+
+@profile_step
+def _add_column(df):
+    return df.assign(b=df['a'] * 2)
+
+
+def test_profiling_is_off_by_default(tmp_path, monkeypatch):
+    monkeypatch.delenv(PROFILE_LOG_ENV, raising=False)
+    monkeypatch.chdir(tmp_path)
+
+    _add_column(pd.DataFrame({'a': [1, 2]}))
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_spans_written_when_log_path_set(tmp_path, monkeypatch):
+    log_path = tmp_path / 'spans.jsonl'
+    monkeypatch.setenv(PROFILE_LOG_ENV, str(log_path))
+
+    _add_column(pd.DataFrame({'a': [1, 2]}))
+
+    spans = load_spans(str(log_path))
+    assert [span['step'] for span in spans] == ['_add_column']
+    assert spans[0]['columns_added'] == ['b']
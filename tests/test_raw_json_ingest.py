@@ -0,0 +1,43 @@
+import json
+
+from incremental_ingest import load_store
+from ingest_projection import resolve_projection
+from raw_json_ingest import flatten_record, ingest_raw_json
+
+FINAL_COLUMNS = ['id', 'title', 'industries_consolidated', 'has_company_logo',
+                 'job_investment_type', 'job_urgency_level']
+
+
+def _write_jsonl(path, records):
+    with open(path, 'w', encoding='utf-8') as f:
+        for record in records:
+            f.write(json.dumps(record) + '\n')
+
+
+def test_flatten_record_uses_csv_paths():
+    record = {'id': 1, 'company': {'industry': ['IT']}, 'formattedIndustries': ['IT', 'Software']}
+
+    assert dict(flatten_record(record)) == {
+        'id': 1, 'company/industry/0': 'IT', 'formattedIndustries/0': 'IT', 'formattedIndustries/1': 'Software'
+    }
+
+
+def test_ingest_raw_jsonl_with_missing_paths(tmp_path):
+    raw_file = tmp_path / 'raw.jsonl'
+    _write_jsonl(raw_file, [
+        {'id': 1, 'title': 'Data Engineer', 'formattedIndustries': ['IT Services'],
+         'companyLogo': 'https://media.licdn.com/x.png', 'contentSource': 'JOBS_CREATE',
+         'expireAt': 1893456000000, 'unusedField': 'x'},
+        {'id': 2, 'title': 'Analyst', 'formattedIndustries': ['Banking'], 'expireAt': 1893456000000},
+    ])
+    store_dir = str(tmp_path / 'store')
+
+    totals = ingest_raw_json(str(raw_file), store_dir=store_dir, batch_size=1,
+                             projection=resolve_projection(FINAL_COLUMNS))
+
+    assert totals['records'] == 2
+    assert totals['transformed_rows'] == 2
+    store = load_store(store_dir)
+    assert 'unusedField' not in store.columns
+    assert store['has_company_logo'].tolist() == [True, False]
+    assert store['industries_consolidated'].tolist() == ['IT Services', 'Banking']
@@ -0,0 +1,34 @@
+import numpy as np
+import pandas as pd
+
+from sampling import OTHER_STRATUM, allocate_sample, strata_values, stratified_proportion, stratified_sample
+
+
+def test_many_small_strata_do_not_inflate_sample():
+    # 3.000 katman, çoğu tek satırlık: taban her katmana uygulansaydı örnek ~5.400 olurdu
+    industries = [f'industry_{i}' for i in range(3000)] + ['Software'] * 20000 + ['Finance'] * 10000
+    df = pd.DataFrame({'industry': industries, 'has_logo': np.arange(len(industries)) % 3 == 0})
+
+    sample, design = stratified_sample(df, 'industry', n=1000, seed=7)
+
+    assert len(sample) <= 1000
+    assert design['sample'].sum() == len(sample)
+    assert design['labels'][-1] == OTHER_STRATUM
+    assert len(design['labels']) == 3
+    estimate = stratified_proportion(sample['has_logo'], design)
+    assert 25 < estimate['rate'] < 42
+
+
+def test_allocation_floor_stays_within_n():
+    allocation = allocate_sample([500, 300, 1, 1, 1], n=10)
+    assert allocation.sum() == 10
+    assert (allocation[2:] == 1).all()
+
+
+def test_industry_strata_use_primary_industry():
+    df = pd.DataFrame({'industries_consolidated': ['IT | Software', 'IT | Finance', 'Retail', None]})
+
+    values = strata_values(df, 'industries_consolidated')
+
+    assert values.tolist()[:3] == ['IT', 'IT', 'Retail']
+    assert pd.isna(values.iloc[3])
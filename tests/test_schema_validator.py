@@ -0,0 +1,23 @@
+import pandas as pd
+
+from schema_validator import checkpoint_gate, column_statistics, read_columns
+
+
+def test_read_columns_strips_utf8_bom(tmp_path):
+    path = tmp_path / 'jobs.csv'
+    path.write_bytes('id,title\n1,Analyst\n'.encode('utf-8-sig'))
+    assert read_columns(str(path)) == ['id', 'title']
+
+
+def test_checkpoint_gate_writes_stats_sidecar(tmp_path):
+    path = str(tmp_path / 'jobs_batch.csv')
+    df = pd.DataFrame({'id': [1, 2], 'has_company_logo': [True, None]})
+    df.to_csv(path, index=False)
+
+    assert column_statistics(path, allow_scan=False) is None
+    result = checkpoint_gate(path, df)
+
+    assert result['passed']
+    stats = column_statistics(path, allow_scan=False)
+    assert stats['source'] == 'sidecar'
+    assert stats['rows'] == 2 and stats['null_counts']['has_company_logo'] == 1
@@ -0,0 +1,33 @@
+import numpy as np
+
+from streaming_sketches import _k_scale, tdigest_add, tdigest_create, tdigest_merge, tdigest_quantile
+
+
+def _digest(chunks):
+    digest = tdigest_create()
+    for chunk in chunks:
+        tdigest_add(digest, chunk)
+    return digest
+
+
+def test_tdigest_centroids_respect_k_size_bound():
+    values = np.random.default_rng(1).lognormal(2.5, 1.0, 100_000)
+    digest = _digest(np.array_split(values, 100))
+
+    weights = digest['weights']
+    right = np.cumsum(weights) / weights.sum()
+    left = right - weights / weights.sum()
+    k_sizes = _k_scale(right, digest['compression']) - _k_scale(left, digest['compression'])
+
+    assert weights.sum() == len(values)
+    assert (k_sizes[weights > 1] <= 1 + 1e-9).all()
+
+
+def test_tdigest_lognormal_quantiles():
+    values = np.random.default_rng(1).lognormal(2.5, 1.0, 100_000)
+    left, right = np.array_split(values, 2)
+    digest = tdigest_merge(_digest(np.array_split(left, 50)), _digest(np.array_split(right, 50)))
+
+    for q in (0.5, 0.9, 0.99):
+        exact = np.quantile(values, q)
+        assert abs(tdigest_quantile(digest, q) - exact) / exact < 0.03
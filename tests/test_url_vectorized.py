@@ -0,0 +1,19 @@
+import numpy as np
+import pandas as pd
+
+from url_vectorized import decompose_urls, extract_url_job_ids, protocol_prefix_counts, validate_urls
+
+
+def test_all_null_float_column():
+    # Tamamı boş sütun read_csv'de float64 okunur
+    series = pd.Series([np.nan] * 3, dtype='float64')
+
+    assert extract_url_job_ids(series).isna().all()
+    assert not decompose_urls(series)['is_parsed'].any()
+    assert not validate_urls(series).any()
+    assert protocol_prefix_counts(series).empty
+
+
+def test_job_id_from_string_dtype_column():
+    series = pd.Series(['https://www.linkedin.com/jobs/view/data-engineer-3791234567', None], dtype='str')
+    assert extract_url_job_ids(series).tolist() == [3791234567, pd.NA]
@@ -0,0 +1,24 @@
+import pandas as pd
+
+from urn_index import compare_urn_with_ids, find_urn_columns
+
+
+def _urn_frame():
+    return pd.DataFrame({
+        'id': [3791234567, 3791234568],
+        'jobApplicantInsights/entityUrn': ['urn:li:fs_jobApplicantInsights:3791234567',
+                                           'urn:li:fs_jobApplicantInsights:3791234568'],
+        'salary/entityUrn': ['urn:li:fs_salaryInsights:3791234567', None],
+        'trackingRef': ['urn:li:jobPosting:3791234567', 'urn:li:jobPosting:3791234568'],
+        'title': ['Data Engineer', 'Analyst'],
+    })
+
+
+def test_urn_columns_found_by_content():
+    assert 'trackingRef' in find_urn_columns(_urn_frame())
+    assert 'title' not in find_urn_columns(_urn_frame())
+
+
+def test_compare_with_another_urn_column():
+    comparison = compare_urn_with_ids(_urn_frame(), 'jobApplicantInsights/entityUrn', id_column='salary/entityUrn')
+    assert comparison['checked'] == 1 and comparison['matched'] == 1
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+LinkedIn Jobs Dataset - Vectorized URL Decomposition
+Tek bir birleşik regex ile str.extract kullanarak URL sütunlarını
+scheme / host / port / path / query / fragment / job_id / extension
+bileşenlerine ayırır. urlparse'ın satır satır Python döngüsü yerine
+tüm sütun üzerinde çalışır; bu sayede link ve logo kontrolleri
+1.000 satırlık örnek yerine tam sütunda yapılabilir.
+
+Tekrarlayan URL'ler (ör. aynı şirketin logosu) yalnızca bir kez parse edilir:
+sütun önce factorize edilir, regex benzersiz değerlere uygulanır ve
+sonuç kodlar üzerinden satırlara geri dağıtılır.
+"""
+
+import re
+
+import pandas as pd
+
+# scheme://host[:port][/path][?query][#fragment]
+# path içinde LinkedIn job view pattern'i (/jobs/view/<slug->?<id>) ve
+# son segmentteki dosya uzantısı ayrıca yakalanır.
+URL_COMPONENTS_REGEX = (
+    r'^\s*(?P<scheme>[A-Za-z][A-Za-z0-9+.\-]*)://'
+    r'(?P<host>[^/:?#\s]+)'
+    r'(?::(?P<port>\d+))?'
+    r'(?P<path>/'
+    r'(?:jobs/view/(?:[^/?#\s]*-)?(?P<job_id>\d+)\b)?'
+    r'[^?#\s]*?'
+    r'(?:\.(?P<extension>[A-Za-z0-9]{1,5}))?'
+    r')?'
+    r'(?:\?(?P<query>[^#\s]*))?'
+    r'(?:#(?P<fragment>\S*))?'
+    r'\s*$'
+)
+
+URL_COMPONENT_COLUMNS = ['scheme', 'host', 'port', 'path', 'job_id', 'extension', 'query', 'fragment']
+
+# check_data_consistency'deki doğrulama regex'i (domain / localhost / IP + opsiyonel port)
+VALID_URL_REGEX = (
+    r'^https?://'
+    r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'
+    r'localhost|'
+    r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'
+    r'(?::\d+)?'
+    r'(?:/?|[/?]\S+)$'
+)
+
+LINKEDIN_DOMAINS = ['linkedin.com', 'www.linkedin.com', 'tr.linkedin.com']
+
+# Yalnızca job id gereken durumlar için hafif pattern (tam decomposition gerektirmez)
+JOB_ID_REGEX = r'/jobs/view/(?:[^/?#\s]*-)?(\d+)\b'
+
+
+def apply_on_uniques(series, func):
+    """func'ı yalnızca benzersiz değerlere uygular ve sonucu satırlara geri dağıtır"""
+    codes, uniques = pd.factorize(series, use_na_sentinel=True)
+    unique_result = func(pd.Series(uniques))
+
+    # -1 (null) kodları reindex ile NaN satırlarına dönüşür
+    result = unique_result.reindex(codes)
+    result.index = series.index
+    return result
+
+
+def decompose_urls(series):
+    """URL sütununu bileşen sütunlarına ayırır
+
+    Returns:
+        DataFrame: scheme, host (lowercase), port, path, job_id (Int64),
+        extension (lowercase), query, fragment. Parse edilemeyen ve null
+        satırlarda tüm bileşenler NaN olur. Index girdi ile hizalıdır.
+    """
+    text = series.astype('string')
+
+    def _extract(values):
+        parts = values.str.strip().str.extract(URL_COMPONENTS_REGEX)
+        return parts[URL_COMPONENT_COLUMNS]
+
+    parts = apply_on_uniques(text, _extract)
+
+    parts['scheme'] = parts['scheme'].str.lower()
+    parts['raw_host'] = parts['host']
+    parts['host'] = parts['host'].str.lower()
+    parts['extension'] = parts['extension'].str.lower()
+    parts['job_id'] = pd.to_numeric(parts['job_id'], errors='coerce').astype('Int64')
+    parts['port'] = pd.to_numeric(parts['port'], errors='coerce').astype('Int64')
+    parts['is_parsed'] = parts['scheme'].notna()
+    return parts
+
+
+def extract_url_job_ids(series):
+    """URL sütunundan /jobs/view/<id> job id'lerini Int64 olarak çıkarır"""
+    text = series.astype('string')
+    job_ids = apply_on_uniques(text, lambda values: values.str.extract(JOB_ID_REGEX, expand=False))
+    return pd.to_numeric(job_ids, errors='coerce').astype('Int64')
+
+
+def validate_urls(series):
+    """Tüm sütun için URL format doğrulaması (boolean Series, null → False)"""
+    text = series.astype('string')
+    return text.str.strip().str.match(VALID_URL_REGEX, flags=re.IGNORECASE).fillna(False).astype(bool)
+
+
+def is_linkedin_host(hosts, linkedin_domains=LINKEDIN_DOMAINS):
+    """Host sütunu LinkedIn domain'lerinden birini içeriyor mu (vektörel)"""
+    pattern = '|'.join(re.escape(domain) for domain in linkedin_domains)
+    return hosts.str.contains(pattern, regex=True, na=False)
+
+
+def protocol_prefix_counts(series):
+    """Ham protocol yazımlarının (http://, HTTPS:// ...) dağılımı"""
+    text = series.astype('string')
+    prefixes = text.str.strip().str.extract(r'^(https?://|HTTPS?://)', expand=False)
+    return prefixes.value_counts()
+
+
+def main():
+    """Link sütunu için tam sütun URL decomposition özeti"""
+
+    print("🔗 LinkedIn Jobs Dataset - Vectorized URL Decomposition")
+    print("=" * 60)
+
+    try:
+        df = pd.read_csv('linkedin_jobs_cleaned_no_redundant_workplace.csv')
+        print(f"✅ Dataset yüklendi: {len(df):,} satır, {len(df.columns)} sütun")
+        print()
+    except Exception as e:
+        print(f"❌ HATA: Dataset yüklenemedi - {e}")
+        return
+
+    url_columns = [col for col in df.columns if 'link' in col.lower() or 'url' in col.lower() or col == 'company/logo']
+
+    for col in url_columns:
+        non_null = df[col].dropna()
+        if len(non_null) == 0:
+            continue
+
+        parts = decompose_urls(non_null)
+        valid = validate_urls(non_null)
+
+        print(f"📋 {col}:")
+        print(f"   📊 URL sayısı: {len(non_null):,}")
+        print(f"   ✅ Parse edilen: {parts['is_parsed'].sum():,}")
+        print(f"   ✅ Format geçerli: {valid.sum():,} ({valid.mean() * 100:.2f}%)")
+        print(f"   🌐 Benzersiz host: {parts['host'].nunique():,}")
+        print(f"   🆔 Job ID içeren: {parts['job_id'].notna().sum():,}")
+        top_ext = parts['extension'].value_counts().head(3)
+        if len(top_ext) > 0:
+            print(f"   📸 Uzantılar: {', '.join(f'.{ext} ({count:,})' for ext, count in top_ext.items())}")
+        print()
+
+if __name__ == "__main__":
+    main()
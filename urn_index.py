@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+LinkedIn Jobs Dataset - Vectorized URN Decomposition & Type Index
+'urn:li:<type>:<id>' değerlerini tek bir str.extract ile
+categorical urn_type + Int64 urn_id sütunlarına ayırır.
+
+Satır satır split(':') döngüleri yerine tüm sütun üzerinde çalışır;
+tekrarlayan URN'ler (url_vectorized'deki gibi) yalnızca bir kez parse edilir.
+urn_id üzerinden kurulan id → satır index'i ile entityUrn ↔ id gibi
+redundancy kontrolleri tam sütunda integer eşitlik / join'e dönüşür.
+"""
+
+import pandas as pd
+
+from job_id_index import build_job_id_index, normalize_job_ids
+from url_vectorized import apply_on_uniques
+
+# urn:<namespace>:<type>:<key>  (key sayısal ise urn_id olarak da çıkarılır)
+URN_REGEX = (
+    r'^\s*urn:(?P<namespace>[A-Za-z0-9]+)'
+    r':(?P<urn_type>[A-Za-z][A-Za-z0-9_]*)'
+    r':(?P<urn_key>\S+?)\s*$'
+)
+
+# jobApplicantInsights analizindeki pattern sınıflandırması
+URN_SHAPE_REGEX = r'[a-zA-Z0-9\-_]+'
+
+
+def _looks_like_urn(series):
+    # pandas 3'te metin sütunları 'str' dtype'lıdır; object da kabul edilir
+    if not (pd.api.types.is_string_dtype(series) or pd.api.types.is_object_dtype(series)):
+        return False
+    first = series.first_valid_index()
+    return first is not None and str(series.at[first]).startswith('urn:')
+
+
+def find_urn_columns(df):
+    """URN taşıyan sütunlar: isminde 'urn' geçen veya ilk dolu değeri 'urn:' ile başlayan"""
+    return [col for col in df.columns if 'urn' in col.lower() or _looks_like_urn(df[col])]
+
+
+def decompose_urns(series):
+    """URN sütununu bileşenlerine ayırır
+
+    Returns:
+        DataFrame: namespace, urn_type (category), urn_key, urn_id (Int64,
+        key sayısal değilse NA), is_urn. Index girdi ile hizalıdır.
+    """
+    text = series.astype('string')
+    parts = apply_on_uniques(text, lambda values: values.str.extract(URN_REGEX))
+
+    parts['urn_type'] = parts['urn_type'].astype('category')
+    parts['urn_id'] = pd.to_numeric(parts['urn_key'], errors='coerce').astype('Int64')
+    parts['is_urn'] = parts['namespace'].notna()
+    return parts
+
+
+def expand_urn_columns(df, columns=None, drop=False):
+    """Her URN sütunu için '<col>_urn_type' (category) ve '<col>_urn_id' (Int64) ekler"""
+    columns = find_urn_columns(df) if columns is None else list(columns)
+    expanded = df.copy()
+    for col in columns:
+        parts = decompose_urns(df[col])
+        expanded[f'{col}_urn_type'] = parts['urn_type']
+        expanded[f'{col}_urn_id'] = parts['urn_id']
+    if drop:
+        expanded = expanded.drop(columns=columns)
+    return expanded
+
+
+def build_urn_id_index(series):
+    """URN sütununun urn_id'leri üzerinden id → satır index'i"""
+    return build_job_id_index(decompose_urns(series)['urn_id'])
+
+
+def compare_urn_with_ids(df, urn_column, id_column='id'):
+    """URN id'si ile id sütununun tam sütun integer karşılaştırması
+
+    id_column da URN ise (ör. salary/entityUrn) onun urn_id'si kullanılır.
+
+    Returns:
+        dict: checked / matched (aynı satırda eşitlik), match_rate,
+        shared_ids (iki sütunun id kümelerinin kesişimi, join ile),
+        urn_unique / id_unique
+    """
+    urn_ids = decompose_urns(df[urn_column])['urn_id']
+    if _looks_like_urn(df[id_column]):
+        ids = decompose_urns(df[id_column])['urn_id']
+    else:
+        ids = normalize_job_ids(df[id_column])
+
+    comparable = urn_ids.notna() & ids.notna()
+    checked = int(comparable.sum())
+    matched = int((urn_ids[comparable] == ids[comparable]).sum())
+
+    urn_unique = pd.Index(urn_ids.dropna().unique())
+    id_unique = pd.Index(ids.dropna().unique())
+
+    return {
+        'checked': checked,
+        'matched': matched,
+        'match_rate': (matched / checked * 100) if checked > 0 else 0.0,
+        'row_match_rate': (matched / len(df) * 100) if len(df) > 0 else 0.0,
+        'shared_ids': len(urn_unique.intersection(id_unique)),
+        'urn_unique': len(urn_unique),
+        'id_unique': len(id_unique)
+    }
+
+
+def urn_type_counts(series):
+    """urn_type dağılımı (URN olmayan değerler hariç)"""
+    return decompose_urns(series)['urn_type'].value_counts()
+
+
+def urn_prefix_counts(series):
+    """'urn:li:<type>' prefix dağılımı (single_column_analysis formatında)"""
+    parts = decompose_urns(series)
+    prefixes = ('urn:' + parts['namespace'] + ':' + parts['urn_type'].astype('string')).dropna()
+    return prefixes.value_counts()
+
+
+def urn_shape_counts(series):
+    """Tam sütun pattern dağılımı (alfanumerik run'lar → 'X')"""
+    text = series.dropna().astype('string')
+    shapes = apply_on_uniques(text, lambda values: values.str.replace(URN_SHAPE_REGEX, 'X', regex=True))
+    return shapes.value_counts()
+
+
+def main():
+    """Tüm URN sütunları için type / id index özeti"""
+
+    print("🔗 LinkedIn Jobs Dataset - URN Decomposition & Type Index")
+    print("=" * 60)
+
+    try:
+        df = pd.read_csv('linkedin_jobs_with_combined_functions.csv')
+        print(f"✅ Dataset yüklendi: {len(df):,} satır, {len(df.columns)} sütun")
+        print()
+    except Exception as e:
+        print(f"❌ HATA: Dataset yüklenemedi - {e}")
+        return
+
+    for col in find_urn_columns(df):
+        parts = decompose_urns(df[col])
+        non_null = int(df[col].notna().sum())
+
+        print(f"📋 {col}:")
+        print(f"   📊 Dolu değer: {non_null:,} | URN: {parts['is_urn'].sum():,} | Sayısal id: {parts['urn_id'].notna().sum():,}")
+        for urn_type, count in parts['urn_type'].value_counts().head(3).items():
+            print(f"   🏷️ {urn_type}: {count:,}")
+
+        if 'id' in df.columns and parts['urn_id'].notna().any():
+            comparison = compare_urn_with_ids(df, col)
+            print(f"   🆔 id ile eşleşme: {comparison['matched']:,}/{comparison['checked']:,} (%{comparison['match_rate']:.2f})")
+            print(f"   🔗 Ortak id (join): {comparison['shared_ids']:,}")
+        print()
+
+if __name__ == "__main__":
+    main()
@@ -6,7 +6,9 @@ Column Operations Validator for linkedin_jobs_dataset_optimized_step12.csv
 linkedin_jobs_dataset_optimized_step12.csv'de uygulanıp uygulanmadığını kontrol et.
 """
 
-import pandas as pd
+import os
+
+from schema_validator import read_columns, column_statistics, stats_sidecar_path
 
 def validate_column_operations_in_step12():
     """Step12 dataset'te column operations validation"""
@@ -18,14 +20,18 @@ def validate_column_operations_in_step12():
     
     try:
         print(f"📂 Loading target dataset: {target_file}")
-        df = pd.read_csv(target_file)
-        print(f"✅ Dataset loaded: {len(df):,} records, {len(df.columns)} columns")
+        columns = read_columns(target_file)
+        stats = column_statistics(target_file, allow_scan=False)
+        if stats is None:
+            print(f"❌ Stats sidecar missing or stale: {stats_sidecar_path(target_file)} - re-run the step that writes it")
+            return
+        print(f"✅ Dataset schema loaded: {stats['rows']:,} records, {len(columns)} columns ({stats['source']})")
         print()
     except Exception as e:
         print(f"❌ Error loading dataset: {e}")
         return
     
-    current_columns = set(df.columns)
+    current_columns = set(columns)
     
     # 44-55 arası projelerde verilen komutlar
     operations = {
@@ -146,11 +152,11 @@ def validate_column_operations_in_step12():
     # DATASET CURRENT STATE
     print(f"\n📋 DATASET CURRENT STATE:")
     print(f"   • Total columns in step12: {len(current_columns)}")
-    print(f"   • Records: {len(df):,}")
+    print(f"   • Records: {stats['rows']:,}")
     
-    # Memory usage
-    memory_usage = df.memory_usage(deep=True).sum() / (1024*1024)
-    print(f"   • Memory usage: {memory_usage:.2f} MB")
+    # File size (dataset parse edilmediği için memory yerine)
+    file_size = os.path.getsize(target_file) / (1024*1024)
+    print(f"   • File size: {file_size:.2f} MB")
     
     # PROJECT-SPECIFIC BREAKDOWN
     print(f"\n📊 PROJECT-SPECIFIC VALIDATION:")